@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+    Benchmarks the decoding of a large item search page, comparing the
+    previous QgisStacApiIO response handling (uncompressed transfer,
+    bytes to str copy and json.loads of the text) with the current one
+    (compressed transfer, decompression and JSON decoding of the bytes,
+    with orjson when it is installed).
+
+    Usage: python scripts/benchmark_json_decode.py [features] [repeats]
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from kadas_stac.api.content_encoding import decode_content  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def feature(index):
+    """ Returns an item resembling the Planetary Computer search results."""
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": f"S2B_MSIL2A_20220101T000000_R{index:05d}",
+        "collection": "sentinel-2-l2a",
+        "bbox": [6.0, 46.0, 7.0, 47.0],
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [6.0 + i / 100, 46.0 + (i % 7) / 100] for i in range(40)
+            ]],
+        },
+        "properties": {
+            "datetime": "2022-01-01T10:20:30.024000Z",
+            "eo:cloud_cover": 12.5,
+            "platform": "Sentinel-2B",
+            "instruments": ["msi"],
+            "s2:processing_baseline": "03.01",
+            **{f"s2:statistic_{i}": i * 1.5 for i in range(40)},
+        },
+        "links": [
+            {
+                "rel": rel,
+                "type": "application/json",
+                "href": f"https://example.com/{rel}/{index}",
+            }
+            for rel in ("self", "parent", "collection", "root", "license")
+        ],
+        "assets": {
+            f"B{band:02d}": {
+                "href": f"https://example.com/data/{index}/B{band:02d}.tif",
+                "type": "image/tiff; application=geotiff; "
+                        "profile=cloud-optimized",
+                "title": f"Band {band}",
+                "roles": ["data"],
+                "eo:bands": [{"name": f"B{band:02d}", "center_wavelength": 0.4}],
+                "proj:shape": [10980, 10980],
+                "proj:transform": [10.0, 0.0, 600000.0, 0.0, -10.0, 5200020.0],
+            }
+            for band in range(1, 25)
+        },
+    }
+
+
+def json_loads(content):
+    """ Mirrors pystac StacIO.json_loads."""
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
+
+def previous_decode(body):
+    content = bytes(bytearray(body))
+    text = content.decode("utf-8")
+    return json_loads(text)
+
+
+def current_decode(body):
+    return json_loads(decode_content(body, "gzip"))
+
+
+def measure(function, body, repeats):
+    """ Returns the best run time and the peak traced memory in MB."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(body)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), peak / (1024 * 1024)
+
+
+def main():
+    features = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    page = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [feature(index) for index in range(features)],
+            "links": [],
+        }
+    ).encode("utf-8")
+    compressed = gzip.compress(page)
+
+    print(f"Features: {features}, orjson: {orjson is not None}")
+    print(
+        f"Transferred: {len(page) / (1024 * 1024):.1f} MB uncompressed, "
+        f"{len(compressed) / (1024 * 1024):.1f} MB gzip"
+    )
+    for name, function, body in (
+            ("previous", previous_decode, page),
+            ("current", current_decode, compressed),
+    ):
+        elapsed, peak = measure(function, body, repeats)
+        print(f"{name:>9}: {elapsed * 1000:8.1f} ms, peak {peak:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+    Benchmarks the offline items index, the time to index the items
+    and the latency of typical searches over them.
+
+    Usage: python scripts/benchmark_offline_index.py [items] [repeats]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from kadas_stac.api.offline_index import OfflineIndex  # noqa: E402
+
+COLLECTIONS = ("sentinel-2-l2a", "landsat-c2-l2", "naip", "swissimage")
+
+
+def feature(index, generator):
+    """ Returns an item with a random footprint and acquisition date."""
+    x = generator.uniform(-179.0, 178.0)
+    y = generator.uniform(-80.0, 79.0)
+    day = generator.randint(1, 28)
+    month = generator.randint(1, 12)
+    year = generator.randint(2015, 2024)
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": f"ITEM_{year}{month:02d}{day:02d}_{index:06d}",
+        "collection": COLLECTIONS[index % len(COLLECTIONS)],
+        "bbox": [x, y, x + 1.0, y + 1.0],
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [x, y], [x + 1.0, y], [x + 1.0, y + 1.0],
+                [x, y + 1.0], [x, y],
+            ]],
+        },
+        "properties": {
+            "datetime": f"{year}-{month:02d}-{day:02d}T10:20:30Z",
+            "eo:cloud_cover": round(generator.uniform(0, 100), 1),
+            "platform": f"platform-{index % 7}",
+        },
+        "links": [],
+        "assets": {
+            "thumbnail": {
+                "href": f"https://example.com/{index}/thumbnail.png",
+                "roles": ["thumbnail"],
+            },
+        },
+    }
+
+
+SEARCHES = {
+    "bbox": {"bbox": [6.0, 46.0, 10.0, 48.0]},
+    "bbox + datetime": {
+        "bbox": [-10.0, 35.0, 30.0, 60.0],
+        "datetime": "2020-01-01T00:00:00Z/2020-12-31T23:59:59Z",
+    },
+    "collection + datetime": {
+        "collections": ["sentinel-2-l2a"],
+        "datetime": "2022-06-01T00:00:00Z/..",
+    },
+    "bbox + query": {
+        "bbox": [-10.0, 35.0, 30.0, 60.0],
+        "query": {"eo:cloud_cover": {"lt": 10}},
+    },
+    "free text": {"q": "platform-3"},
+    "page 50 of all": {"page": 50},
+}
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    generator = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        index = OfflineIndex(os.path.join(directory, "offline_index.sqlite"))
+        features = [feature(number, generator) for number in range(items)]
+
+        start = time.perf_counter()
+        for offset in range(0, items, 100):
+            index.add_items("connection", features[offset:offset + 100])
+        elapsed = time.perf_counter() - start
+        print(
+            f"Items: {items}, rtree: {index.has_rtree}, fts: {index.has_fts}"
+        )
+        print(
+            f"Indexed in pages of 100: {elapsed:.1f} s, "
+            f"{elapsed * 1000 * 100 / items:.2f} ms per page"
+        )
+
+        for name, search in SEARCHES.items():
+            parameters = dict(search, limit=10)
+            page = parameters.pop("page", 1)
+            timings = []
+            for _ in range(repeats):
+                start = time.perf_counter()
+                _, total = index.search("connection", parameters, page)
+                timings.append(time.perf_counter() - start)
+            print(
+                f"{name:>22}: {min(timings) * 1000:8.1f} ms, "
+                f"{total} matched"
+            )
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,7 @@ from .models import (
 
 from .network import ContentFetcherTask, NetworkFetcher
 from ..conf import ConnectionSettings
+from ..definitions.constants import PREFETCH_TASK_PRIORITY
 
 from ..lib.pystac import ItemCollection
 
@@ -39,8 +40,13 @@ class BaseClient(QtCore.QObject):
     auth_config: str
     url: str
     content_task: ContentFetcherTask
+    prefetch_task: ContentFetcherTask
+    item_task: ContentFetcherTask
+    pages_task: ContentFetcherTask
+    collections_task: ContentFetcherTask
     capability: ApiCapability
     catalog_type: str  # 'api' or 'static'
+    connection_id: str
 
     conformance_received = QtCore.pyqtSignal(
         list,
@@ -60,6 +66,9 @@ class BaseClient(QtCore.QObject):
         list,
         ResourcePagination
     )
+    items_batch_received = QtCore.pyqtSignal(
+        list
+    )
     item_collections_received = QtCore.pyqtSignal(
         ItemCollection
     )
@@ -75,14 +84,20 @@ class BaseClient(QtCore.QObject):
             auth_config: typing.Optional[str] = None,
             capability=None,
             catalog_type: str = "api",
+            connection_id: typing.Optional[str] = None,
             **kwargs
     ):
         super().__init__(*args, **kwargs)
         self.auth_config = auth_config or ""
         self.url = url.rstrip("/")
         self.content_task = None
+        self.prefetch_task = None
+        self.item_task = None
+        self.pages_task = None
+        self.collections_task = None
         self.capability = capability
         self.catalog_type = catalog_type
+        self.connection_id = connection_id
 
     @classmethod
     def from_connection_settings(
@@ -102,7 +117,8 @@ class BaseClient(QtCore.QObject):
             url=connection_settings.url,
             auth_config=connection_settings.auth_config,
             capability=connection_settings.capability,
-            catalog_type=connection_settings.catalog_type
+            catalog_type=connection_settings.catalog_type,
+            connection_id=str(connection_settings.id)
         )
 
     def get_items(
@@ -125,10 +141,145 @@ class BaseClient(QtCore.QObject):
             response_handler=self.handle_items,
             error_handler=self.handle_error,
             auth_config=self.auth_config,
+            connection_id=self.connection_id,
+            stream_items=True,
+            save_items=True,
+        )
+        self.content_task.items_batch_ready.connect(
+            self.handle_items_batch
         )
 
         QgsApplication.taskManager().addTask(self.content_task)
 
+    def prefetch_items(
+        self,
+        item_search: ItemSearch,
+        response_handler: typing.Callable
+    ):
+        """Fetches a result page ahead of the user navigation in a low
+        priority task, the prepared page is passed to the response handler.
+        Any running prefetch is cancelled.
+
+        :param item_search: Search item object of the page to prefetch
+        :type item_search: ItemSearch
+
+        :param response_handler: Callback receiving the items and
+        pagination details of the fetched page
+        :type response_handler: typing.Callable
+        """
+        self.cancel_prefetch()
+        self.prefetch_task = ContentFetcherTask(
+            url=self.url,
+            search_params=item_search,
+            resource_type=ResourceType.FEATURE,
+            api_capability=self.capability,
+            catalog_type=self.catalog_type,
+            response_handler=response_handler,
+            error_handler=self.handle_prefetch_error,
+            auth_config=self.auth_config,
+            connection_id=self.connection_id,
+        )
+
+        QgsApplication.taskManager().addTask(
+            self.prefetch_task,
+            PREFETCH_TASK_PRIORITY
+        )
+
+    def cancel_prefetch(self):
+        """Cancels the running page prefetch task, if any."""
+        if self.prefetch_task is not None:
+            try:
+                self.prefetch_task.cancel()
+            except RuntimeError:
+                # The task has already finished and was deleted
+                pass
+            self.prefetch_task = None
+
+    def cancel_all_items(self):
+        """Cancels the running result pages walk, if any."""
+        if self.pages_task is not None:
+            try:
+                self.pages_task.cancel()
+            except RuntimeError:
+                # The task has already finished and was deleted
+                pass
+            self.pages_task = None
+
+    def get_full_item(
+        self,
+        item_href: str,
+        response_handler: typing.Callable,
+        error_handler: typing.Callable = None
+    ):
+        """Fetches the full document of an item returned by a lean
+        search, the prepared item is passed to the response handler.
+
+        :param item_href: Item self link
+        :type item_href: str
+
+        :param response_handler: Callback receiving the prepared item
+        and the pagination details
+        :type response_handler: typing.Callable
+
+        :param error_handler: Callback receiving the error message,
+        defaults to the client error handler
+        :type error_handler: typing.Callable
+        """
+        self.item_task = ContentFetcherTask(
+            url=self.url,
+            search_params={'item_href': item_href},
+            resource_type=ResourceType.FEATURE,
+            api_capability=self.capability,
+            catalog_type=self.catalog_type,
+            response_handler=response_handler,
+            error_handler=error_handler or self.handle_error,
+            auth_config=self.auth_config,
+            connection_id=self.connection_id,
+        )
+
+        QgsApplication.taskManager().addTask(self.item_task)
+
+    def get_all_items(
+        self,
+        item_search: ItemSearch,
+        page_handler: typing.Callable,
+        response_handler: typing.Callable,
+        error_handler: typing.Callable = None
+    ):
+        """Walks all the result pages of the item search, the items of
+        each page are passed to the page handler in the task thread.
+
+        :param item_search: Search item object of the search
+        :type item_search: ItemSearch
+
+        :param page_handler: Callback receiving the items of each page,
+        called in the task thread
+        :type page_handler: typing.Callable
+
+        :param response_handler: Callback receiving an empty items list
+        and the pagination details once all the pages have been walked
+        :type response_handler: typing.Callable
+
+        :param error_handler: Callback receiving the error message,
+        also called when the walk is canceled, defaults to the client
+        error handler
+        :type error_handler: typing.Callable
+        """
+        self.pages_task = ContentFetcherTask(
+            url=self.url,
+            search_params=item_search,
+            resource_type=ResourceType.FEATURE,
+            api_capability=self.capability,
+            catalog_type=self.catalog_type,
+            response_handler=response_handler,
+            error_handler=error_handler or self.handle_error,
+            auth_config=self.auth_config,
+            connection_id=self.connection_id,
+            page_handler=page_handler,
+        )
+
+        QgsApplication.taskManager().addTask(self.pages_task)
+
     def get_collections(
         self
     ):
@@ -142,10 +293,45 @@ class BaseClient(QtCore.QObject):
             response_handler=self.handle_collections,
             error_handler=self.handle_error,
             auth_config=self.auth_config,
+            connection_id=self.connection_id,
         )
 
         QgsApplication.taskManager().addTask(self.content_task)
 
+    def refresh_collections(
+        self,
+        response_handler: typing.Callable,
+        error_handler: typing.Callable = None
+    ):
+        """Revalidates the cached collections listing in a low priority
+        background task, the collections are passed to the response handler.
+
+        The listing requests go through the network responses cache,
+        so unchanged pages are revalidated with conditional requests.
+
+        :param response_handler: Callback receiving the collections
+        and the pagination details
+        :type response_handler: typing.Callable
+
+        :param error_handler: Callback receiving the error message,
+        defaults to the client error handler
+        :type error_handler: typing.Callable
+        """
+        self.collections_task = ContentFetcherTask(
+            url=self.url,
+            search_params=None,
+            resource_type=ResourceType.COLLECTION,
+            response_handler=response_handler,
+            error_handler=error_handler or self.handle_error,
+            auth_config=self.auth_config,
+            connection_id=self.connection_id,
+        )
+
+        QgsApplication.taskManager().addTask(
+            self.collections_task,
+            PREFETCH_TASK_PRIORITY
+        )
+
     def get_collection(
         self,
         collection_id
@@ -231,6 +417,12 @@ class BaseClient(QtCore.QObject):
     ):
         raise NotImplementedError
 
+    def handle_items_batch(
+            self,
+            items
+    ):
+        raise NotImplementedError
+
     def handle_item_collections(
             self,
             items
@@ -249,4 +441,10 @@ class BaseClient(QtCore.QObject):
     ):
         raise NotImplementedError
 
+    def handle_prefetch_error(
+            self,
+            message: str
+    ):
+        raise NotImplementedError
+
 
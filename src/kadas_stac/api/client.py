@@ -7,6 +7,7 @@ with post network response handling.
 """
 
 from .base import BaseClient
+from ..utils import log
 from .models import (
     ResourcePagination,
 )
@@ -33,6 +34,18 @@ class Client(BaseClient):
         """
         self.items_received.emit(items_response, pagination)
 
+    def handle_items_batch(
+            self,
+            items
+    ):
+        """Emits a batch of the search results items as soon as they are
+        prepared, before the whole search completes.
+
+        :param items: Prepared search results items
+        :type items: List[models.Items]
+        """
+        self.items_batch_received.emit(items)
+
     def handle_item_collections(
             self,
             items_response,
@@ -123,3 +136,15 @@ class Client(BaseClient):
         :type message: str
         """
         self.error_received.emit(message)
+
+    def handle_prefetch_error(
+            self,
+            message: str
+    ):
+        """Logs the error of a page prefetch, prefetch failures are
+        not reported to the user since the page is fetched again on demand.
+
+        :param message: Error message
+        :type message: str
+        """
+        log(message, info=False, notify=False)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+    Landing pages cache for the opened STAC catalogs.
+
+    Every content fetch opens the catalog from its landing page, the
+    landing page documents are kept here for a configurable time so
+    that the searches, page changes and collections fetches of a
+    connection do not need to request them again.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+import time
+import typing
+
+
+class LandingPageCache:
+    """ Stores the fetched catalog landing pages by URL and
+    authentication headers.
+    """
+
+    def __init__(self):
+        self._entries: typing.Dict[tuple, tuple] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(url: str, headers: typing.Optional[dict] = None):
+        """Builds the cache key for the passed url and headers, the headers
+        values are hashed so no credentials are kept in the cache keys.
+
+        :param url: Catalog URL
+        :type url: str
+
+        :param headers: Request headers used when opening the catalog
+        :type headers: dict
+
+        :returns: Cache key
+        :rtype: tuple
+        """
+        headers_hash = hashlib.sha256(
+            json.dumps(headers or {}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return url.rstrip('/'), headers_hash
+
+    def get(
+            self,
+            url: str,
+            headers: typing.Optional[dict] = None,
+            ttl: float = 0
+    ) -> typing.Optional[dict]:
+        """Returns a copy of the stored landing page when it is
+        younger than the passed time to live.
+
+        :param url: Catalog URL
+        :type url: str
+
+        :param headers: Request headers used when opening the catalog
+        :type headers: dict
+
+        :param ttl: Time to live in seconds
+        :type ttl: float
+
+        :returns: Landing page document or None
+        :rtype: dict
+        """
+        if ttl <= 0:
+            return None
+        key = self._key(url, headers)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_time, landing_page = entry
+            if time.monotonic() - stored_time > ttl:
+                del self._entries[key]
+                return None
+            return copy.deepcopy(landing_page)
+
+    def store(
+            self,
+            url: str,
+            landing_page: dict,
+            headers: typing.Optional[dict] = None
+    ):
+        """Stores the landing page fetched from the passed url.
+
+        :param url: Catalog URL
+        :type url: str
+
+        :param landing_page: Landing page document
+        :type landing_page: dict
+
+        :param headers: Request headers used when opening the catalog
+        :type headers: dict
+        """
+        key = self._key(url, headers)
+        with self._lock:
+            self._entries[key] = (
+                time.monotonic(),
+                copy.deepcopy(landing_page)
+            )
+
+    def invalidate(self, url: typing.Optional[str] = None):
+        """Drops the landing pages stored for the passed url, the
+        child catalogs and collections of the url are dropped too.
+        All the entries are removed when no url is passed.
+
+        :param url: Catalog URL
+        :type url: str
+        """
+        with self._lock:
+            if url is None:
+                self._entries.clear()
+                return
+            url = url.rstrip('/')
+            for key in list(self._entries.keys()):
+                if key[0] == url or key[0].startswith(f"{url}/"):
+                    del self._entries[key]
+
+
+def open_client(
+        client_class,
+        url: str,
+        stac_io,
+        headers: typing.Optional[dict] = None,
+        ttl: float = 0
+):
+    """Opens the catalog client from the cached landing page when
+    available, otherwise fetches and caches the landing page.
+
+    Mirrors pystac_client.Client.from_file, which always
+    fetches the landing page.
+
+    :param client_class: The pystac_client Client class
+    :type client_class: type
+
+    :param url: Catalog URL
+    :type url: str
+
+    :param stac_io: StacIO instance used by the client
+    :type stac_io: QgisStacApiIO
+
+    :param headers: Request headers used when opening the catalog
+    :type headers: dict
+
+    :param ttl: Time to live in seconds of the cached landing page
+    :type ttl: float
+
+    :returns: The opened client
+    :rtype: pystac_client.Client
+    """
+    landing_page = landing_pages.get(url, headers, ttl)
+    if landing_page is None:
+        landing_page = stac_io.read_json(url)
+        if ttl > 0:
+            landing_pages.store(url, landing_page, headers)
+
+    client = client_class.from_dict(
+        landing_page,
+        href=url,
+        migrate=True,
+        preserve_dict=False
+    )
+    if client.get_self_href() is None:
+        client.set_self_href(url)
+
+    root_link = client.get_root_link()
+    if root_link is not None and not root_link.is_resolved():
+        if root_link.get_absolute_href() == url:
+            client.set_root(client)
+
+    client._stac_io = stac_io
+    client._stac_io._conformance = client.extra_fields.get('conformsTo', [])
+
+    return client
+
+
+landing_pages = LandingPageCache()
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+"""
+    Persistent cache of the catalogs collection documents.
+
+    The full collection documents (extent, summaries, item assets,
+    links, ...) of each connection are stored in one JSON file, so the
+    collections list and the collection details can be shown without
+    requests while the listing is revalidated in the background.
+"""
+
+import json
+import os
+import threading
+import time
+import typing
+
+
+class CollectionCache:
+    """ On-disk cache of the collection documents by connection."""
+
+    def __init__(self, directory: typing.Optional[str] = None):
+        self.directory = directory
+        self._entries = {}
+        self._lock = threading.RLock()
+
+    def configure(self, directory: str):
+        """Sets the folder of the cached collections files.
+
+        :param directory: Cache folder
+        :type directory: str
+        """
+        with self._lock:
+            if directory != self.directory:
+                self.directory = directory
+                self._entries.clear()
+
+    def get(self, connection_key) -> typing.Optional[typing.List[dict]]:
+        """Returns the cached collection documents of a connection.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :returns: Collection documents, None when the connection
+        collections have not been cached
+        :rtype: list
+        """
+        entry = self._entry(connection_key)
+        return entry["collections"] if entry is not None else None
+
+    def get_document(
+            self,
+            connection_key,
+            collection_id: str
+    ) -> typing.Optional[dict]:
+        """Returns the cached document of a collection.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param collection_id: STAC collection id
+        :type collection_id: str
+
+        :returns: Collection document or None
+        :rtype: dict
+        """
+        entry = self._entry(connection_key)
+        if entry is None:
+            return None
+        return entry["index"].get(collection_id)
+
+    def updated(self, connection_key) -> typing.Optional[float]:
+        """Returns the time the connection collections were stored.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :returns: Time in seconds since the epoch or None
+        :rtype: float
+        """
+        entry = self._entry(connection_key)
+        return entry["updated"] if entry is not None else None
+
+    def put(
+            self,
+            connection_key,
+            documents: typing.List[dict]
+    ) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """Stores the collection documents of a connection, replacing
+        the previously cached ones.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param documents: Collection documents
+        :type documents: list
+
+        :returns: Ids of the added and of the removed collections
+        :rtype: tuple
+        """
+        previous = self.get(connection_key) or []
+        added, removed = diff_collections(previous, documents)
+        entry = self._make_entry(documents, time.time())
+        with self._lock:
+            self._entries[str(connection_key)] = entry
+            path = self._path(connection_key)
+            if path is not None:
+                try:
+                    os.makedirs(self.directory, exist_ok=True)
+                    temporary_path = f"{path}.tmp"
+                    with open(temporary_path, "w") as cache_file:
+                        json.dump(
+                            {
+                                "updated": entry["updated"],
+                                "collections": documents,
+                            },
+                            cache_file
+                        )
+                    os.replace(temporary_path, path)
+                except (OSError, TypeError, ValueError):
+                    pass
+        return added, removed
+
+    def remove(self, connection_key):
+        """Drops the cached collections of a connection.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+        """
+        with self._lock:
+            self._entries.pop(str(connection_key), None)
+            path = self._path(connection_key)
+            if path is not None and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def _path(self, connection_key) -> typing.Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, f"{connection_key}.json")
+
+    @staticmethod
+    def _make_entry(documents, updated):
+        return {
+            "updated": updated,
+            "collections": documents,
+            "index": {
+                document.get("id"): document for document in documents
+            },
+        }
+
+    def _entry(self, connection_key) -> typing.Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(str(connection_key))
+            if entry is not None:
+                return entry
+            path = self._path(connection_key)
+            if path is None or not os.path.exists(path):
+                return None
+            try:
+                with open(path) as cache_file:
+                    content = json.load(cache_file)
+                entry = self._make_entry(
+                    content["collections"],
+                    content.get("updated")
+                )
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._entries[str(connection_key)] = entry
+            return entry
+
+
+def diff_collections(
+        previous: typing.List,
+        current: typing.List
+) -> typing.Tuple[typing.List[str], typing.List[str]]:
+    """Compares two collection listings by collection id.
+
+    :param previous: Previous collection documents or models
+    :type previous: list
+
+    :param current: Current collection documents or models
+    :type current: list
+
+    :returns: Ids of the added and of the removed collections
+    :rtype: tuple
+    """
+    def ids(collections):
+        return [
+            collection.get("id") if isinstance(collection, dict)
+            else collection.id
+            for collection in collections
+        ]
+
+    previous_ids = ids(previous)
+    current_ids = ids(current)
+    previous_set = set(previous_ids)
+    current_set = set(current_ids)
+    added = [
+        collection_id for collection_id in current_ids
+        if collection_id not in previous_set
+    ]
+    removed = [
+        collection_id for collection_id in previous_ids
+        if collection_id not in current_set
+    ]
+    return added, removed
+
+
+collection_cache = CollectionCache()
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+    HTTP content encoding negotiation and decoding.
+
+    Qt only decompresses the replies transparently when it sets the
+    Accept-Encoding header itself, the QGIS network based StacIO sets
+    it explicitly, so it can also accept brotli when the module is
+    available, and decodes the replies here.
+"""
+
+import typing
+import zlib
+
+# Use brotli if available
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ACCEPT_ENCODING = "gzip, deflate, br" if brotli is not None else "gzip, deflate"
+
+_DECODE_ERRORS = (zlib.error,) + ((brotli.error,) if brotli is not None else ())
+
+
+class ContentEncodingError(Exception):
+    """Raised when a response body can not be decoded."""
+
+
+def decode_content(
+        body: bytes,
+        content_encoding: typing.Optional[str] = None
+) -> bytes:
+    """Decodes the response body using the codings listed in the
+    response Content-Encoding header, in the reverse order of
+    their application.
+
+    :param body: Response body
+    :type body: bytes
+
+    :param content_encoding: Content-Encoding header value
+    :type content_encoding: str
+
+    :returns: Decoded body
+    :rtype: bytes
+    """
+    codings = [
+        coding.strip().lower()
+        for coding in (content_encoding or "").split(",")
+        if coding.strip()
+    ]
+    for coding in reversed(codings):
+        try:
+            if coding in ("gzip", "x-gzip"):
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            elif coding == "deflate":
+                try:
+                    body = zlib.decompress(body)
+                except zlib.error:
+                    # Some servers send raw deflate data without zlib header
+                    body = zlib.decompress(body, -zlib.MAX_WBITS)
+            elif coding == "br" and brotli is not None:
+                body = brotli.decompress(body)
+            elif coding != "identity":
+                raise ContentEncodingError(
+                    f"Unsupported content encoding: {coding}"
+                )
+        except _DECODE_ERRORS as e:
+            raise ContentEncodingError(
+                f"Invalid {coding} encoded content: {e}"
+            ) from e
+    return body
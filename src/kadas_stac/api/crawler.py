@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+    Static STAC catalogs crawler.
+
+    Walks the "child" and "item" links of a static catalog breadth first,
+    with a bounded number of concurrent requests, until the items budget
+    or the maximum depth is reached.
+"""
+
+import typing
+
+from urllib.parse import urljoin, urldefrag
+
+from ..definitions.constants import CRAWLER_MAX_REQUESTS_DEFAULT
+from ..logger import get_logger
+
+logger = get_logger(level="DEBUG")
+
+
+class StaticCatalogCrawler:
+    """ Collects items from a hierarchical static STAC catalog.
+
+    Documents of the same depth are fetched concurrently with the
+    asynchronous requests of the passed StacIO, so requests go through
+    the QGIS network stack. The StacIO per-host requests limit is set to
+    the crawler concurrency during the crawl. Already visited URLs are
+    skipped and no new requests are scheduled once the items budget is
+    reached.
+    """
+
+    def __init__(
+            self,
+            stac_io,
+            max_items: int = 100,
+            max_depth: int = 3,
+            max_in_flight: int = CRAWLER_MAX_REQUESTS_DEFAULT,
+            collection_filter: typing.Optional[typing.List[str]] = None,
+            progress_callback: typing.Optional[typing.Callable] = None,
+            is_canceled: typing.Optional[typing.Callable] = None,
+            item_callback: typing.Optional[typing.Callable] = None,
+    ):
+        """
+        :param stac_io: StacIO used to read the catalog documents, with
+        asynchronous requests
+        :type stac_io: QgisStacApiIO
+
+        :param max_items: Maximum number of items to collect
+        :type max_items: int
+
+        :param max_depth: Maximum depth of the followed child links
+        :type max_depth: int
+
+        :param max_in_flight: Maximum number of concurrent requests
+        :type max_in_flight: int
+
+        :param collection_filter: Collection ids of the items to keep
+        :type collection_filter: list
+
+        :param progress_callback: Called with the crawl progress percentage
+        :type progress_callback: Callable
+
+        :param is_canceled: Returns True when the crawl should stop
+        :type is_canceled: Callable
+
+        :param item_callback: Called with each collected item
+        :type item_callback: Callable
+        """
+        self.stac_io = stac_io
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.max_in_flight = max(1, max_in_flight)
+        self.collection_filter = collection_filter
+        self.progress_callback = progress_callback
+        self.is_canceled = is_canceled or (lambda: False)
+        self.item_callback = item_callback
+
+        self.items = []
+        self._visited = set()
+        self._root_url = None
+
+    def crawl(self, url: str) -> typing.List[dict]:
+        """Collects the items of the catalog at the passed url.
+
+        :param url: Catalog or collection URL
+        :type url: str
+
+        :returns: Collected item features
+        :rtype: list
+        """
+        if self.collection_filter:
+            logger.info(
+                f"Crawling static catalog with collection "
+                f"filter: {self.collection_filter}"
+            )
+        else:
+            logger.info("Crawling static catalog")
+
+        frontier = self._unvisited([url])
+        self._root_url = frontier[0]
+        host_limit = self.stac_io.max_in_flight_per_host
+        self.stac_io.max_in_flight_per_host = self.max_in_flight
+        try:
+            self._walk(frontier)
+        finally:
+            self.stac_io.max_in_flight_per_host = host_limit
+
+        logger.info(f"Static catalog crawl complete: {len(self.items)} items found")
+        return self.items
+
+    def _walk(self, frontier):
+        """Visits the catalog documents level by level, starting
+        from the passed urls.
+        """
+        depth = 0
+        while frontier and not self._done():
+            children = []
+            item_urls = []
+            for document_url, document in self._fetch(frontier):
+                links = self._links(document_url, document)
+                children.extend(links.get('child', []))
+                item_urls.extend(links.get('item', []))
+
+            for item_url, document in self._fetch(
+                    self._unvisited(item_urls),
+                    budget=True
+            ):
+                self._add_item(item_url, document)
+
+            depth += 1
+            if depth > self.max_depth:
+                if children:
+                    logger.warning(
+                        f"Max crawl depth ({self.max_depth}) reached, stopping"
+                    )
+                break
+            frontier = self._unvisited(children)
+
+    def _done(self) -> bool:
+        return len(self.items) >= self.max_items or self.is_canceled()
+
+    def _unvisited(self, urls):
+        """Returns the passed urls that have not been scheduled yet,
+        marking them as visited.
+        """
+        result = []
+        for url in urls:
+            url = urldefrag(url)[0]
+            if url not in self._visited:
+                self._visited.add(url)
+                result.append(url)
+        return result
+
+    def _wait_any(self, futures):
+        """Waits for at least one of the passed futures to complete.
+
+        :returns: The completed futures
+        :rtype: set
+        """
+        self.stac_io.wait(futures, first_completed=True)
+        return {future for future in futures if future.done()}
+
+    def _fetch(self, urls, budget=False):
+        """Fetches the passed urls keeping at most max_in_flight
+        requests running, yields the fetched documents in completion order.
+
+        :param budget: Whether to stop scheduling requests once
+        the items budget is reached
+        :type budget: bool
+        """
+        pending = list(urls)
+        running = {}
+        while (pending or running) and not self.is_canceled():
+            while pending and len(running) < self.max_in_flight:
+                if budget and \
+                        len(self.items) + len(running) >= self.max_items:
+                    pending = []
+                    break
+                url = pending.pop(0)
+                running[self.stac_io.read_json_async(url)] = url
+            if not running:
+                break
+            completed = self._wait_any(list(running))
+            for future in completed:
+                url = running.pop(future)
+                try:
+                    yield url, future.result()
+                except Exception as e:
+                    if url == self._root_url:
+                        raise
+                    logger.debug(f"Failed to read {url}: {e}")
+            if budget and len(self.items) >= self.max_items:
+                pending = []
+        for future in running:
+            future.cancel()
+
+    def _links(self, base_url, document):
+        """Groups the absolute hrefs of the document links by relation.
+
+        :returns: Relation mapped to the list of link hrefs
+        :rtype: dict
+        """
+        links = {}
+        for link in document.get('links', []):
+            href = link.get('href')
+            rel = link.get('rel')
+            if href and rel in ('child', 'item'):
+                links.setdefault(rel, []).append(urljoin(base_url, href))
+        return links
+
+    def _add_item(self, url, document):
+        """Adds the item document to the crawl results when it
+        matches the collection filter.
+        """
+        if len(self.items) >= self.max_items:
+            return
+        if not isinstance(document, dict) or \
+                document.get('type') != 'Feature' or \
+                document.get('id') is None:
+            logger.debug(f"Skipping invalid item at {url}")
+            return
+        item = document
+        links = item.setdefault('links', [])
+        if not any(link.get('rel') == 'self' for link in links):
+            links.append({'rel': 'self', 'href': url})
+
+        if self.collection_filter:
+            item_collection = item.get('collection')
+            if item_collection and item_collection not in self.collection_filter:
+                logger.debug(
+                    f"Skipping item from collection '{item_collection}' "
+                    f"(not in filter: {self.collection_filter})"
+                )
+                return
+            elif not item_collection:
+                logger.warning(
+                    f"Item {item.get('id')} has no collection attribute, including it"
+                )
+
+        self.items.append(item)
+        if self.item_callback:
+            self.item_callback(item)
+        if self.progress_callback:
+            self.progress_callback(
+                min(100.0, 100.0 * len(self.items) / self.max_items)
+            )
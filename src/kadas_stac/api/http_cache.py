@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+"""
+    HTTP responses cache used by the QGIS network based StacIO.
+
+    Responses are kept in a memory LRU and in an on-disk store with a
+    size limit. Freshness follows the response Cache-Control header,
+    stale responses that carry an ETag or Last-Modified validator are
+    revalidated with conditional requests.
+"""
+
+import collections
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import typing
+
+MEMORY_ENTRIES_DEFAULT = 128
+DISK_SIZE_DEFAULT = 50 * 1024 * 1024
+
+
+class CachedResponse:
+    """ A cached response body and its validators."""
+
+    __slots__ = ("body", "etag", "last_modified", "expires")
+
+    def __init__(
+            self,
+            body: bytes,
+            etag: typing.Optional[str] = None,
+            last_modified: typing.Optional[str] = None,
+            expires: float = 0
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+
+    def is_fresh(self) -> bool:
+        """ Whether the response can be used without revalidation."""
+        return time.time() < self.expires
+
+    def validators(self) -> dict:
+        """Returns the conditional request headers for this response.
+
+        :returns: Conditional request headers
+        :rtype: dict
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> dict:
+        """ Metadata of the response, stored next to the body on disk."""
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "expires": self.expires,
+        }
+
+
+def parse_cache_control(value: typing.Optional[str]) -> dict:
+    """Parses a Cache-Control header value into its directives.
+
+    :param value: Cache-Control header value
+    :type value: str
+
+    :returns: Lower case directives mapped to their values, directives
+    without value are mapped to True
+    :rtype: dict
+    """
+    directives = {}
+    for part in (value or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, directive_value = part.partition("=")
+        directives[name.strip().lower()] = \
+            directive_value.strip().strip('"') if directive_value else True
+    return directives
+
+
+def request_key(
+        method: str,
+        url: str,
+        body: typing.Optional[dict] = None,
+        headers: typing.Optional[dict] = None
+) -> str:
+    """Builds the cache key of a request, POST bodies and request
+    headers are serialized canonically before hashing.
+
+    :param method: HTTP method
+    :type method: str
+
+    :param url: Full request URL including the query string
+    :type url: str
+
+    :param body: POST request body
+    :type body: dict
+
+    :param headers: Request headers
+    :type headers: dict
+
+    :returns: Hex digest identifying the request
+    :rtype: str
+    """
+    canonical = json.dumps(
+        [
+            method.upper(),
+            url,
+            body or {},
+            {str(k).lower(): str(v) for k, v in (headers or {}).items()},
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class HttpResponseCache:
+    """ Memory and disk cache of the HTTP responses."""
+
+    def __init__(
+            self,
+            directory: typing.Optional[str] = None,
+            memory_entries: int = MEMORY_ENTRIES_DEFAULT,
+            max_disk_size: int = DISK_SIZE_DEFAULT,
+    ):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.max_disk_size = max_disk_size
+        self.enabled = True
+        self._memory = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._stats = collections.Counter()
+
+    def configure(
+            self,
+            directory: typing.Optional[str] = None,
+            max_disk_size: typing.Optional[int] = None,
+            enabled: typing.Optional[bool] = None,
+    ):
+        """Updates the cache configuration.
+
+        :param directory: Folder of the on-disk store
+        :type directory: str
+
+        :param max_disk_size: On-disk store size limit in bytes,
+        0 disables the on-disk store
+        :type max_disk_size: int
+
+        :param enabled: Whether responses are cached
+        :type enabled: bool
+        """
+        with self._lock:
+            if directory is not None:
+                self.directory = directory
+            if max_disk_size is not None:
+                self.max_disk_size = max_disk_size
+                self._trim_disk()
+            if enabled is not None:
+                self.enabled = enabled
+
+    def get(self, key: str) -> typing.Optional[CachedResponse]:
+        """Returns the cached response of the request key.
+
+        :param key: Request key as returned by request_key()
+        :type key: str
+
+        :returns: Cached response or None
+        :rtype: CachedResponse
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            response = self._memory.get(key)
+            if response is not None:
+                self._memory.move_to_end(key)
+                return response
+            response = self._read_disk(key)
+            if response is not None:
+                self._remember(key, response)
+            return response
+
+    def store(
+            self,
+            key: str,
+            body: bytes,
+            headers: typing.Dict[str, str]
+    ) -> typing.Optional[CachedResponse]:
+        """Stores the response body if its headers allow it.
+
+        Responses with "no-store" and responses that can neither
+        be reused nor revalidated are not stored.
+
+        :param key: Request key as returned by request_key()
+        :type key: str
+
+        :param body: Response body
+        :type body: bytes
+
+        :param headers: Lower case response headers
+        :type headers: dict
+
+        :returns: The stored response or None
+        :rtype: CachedResponse
+        """
+        if not self.enabled:
+            return None
+        response = CachedResponse(
+            body,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        if not self._update_freshness(response, headers):
+            self.discard(key)
+            return None
+        if not response.is_fresh() and not response.validators():
+            self.discard(key)
+            return None
+        with self._lock:
+            self._remember(key, response)
+            self._write_disk(key, response)
+            self._stats["stores"] += 1
+        return response
+
+    def revalidated(
+            self,
+            key: str,
+            response: CachedResponse,
+            headers: typing.Dict[str, str]
+    ):
+        """Refreshes a cached response after a "304 Not Modified" reply.
+
+        :param key: Request key as returned by request_key()
+        :type key: str
+
+        :param response: The revalidated cached response
+        :type response: CachedResponse
+
+        :param headers: Lower case headers of the 304 response
+        :type headers: dict
+        """
+        response.etag = headers.get("etag") or response.etag
+        response.last_modified = \
+            headers.get("last-modified") or response.last_modified
+        if self._update_freshness(response, headers):
+            with self._lock:
+                self._remember(key, response)
+                self._write_disk(key, response)
+
+    def discard(self, key: str):
+        """Removes the cached response of the request key.
+
+        :param key: Request key as returned by request_key()
+        :type key: str
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+            for path in self._disk_paths(key):
+                if path and os.path.exists(path):
+                    os.remove(path)
+
+    def clear(self):
+        """ Removes all the cached responses."""
+        with self._lock:
+            self._memory.clear()
+            if self.directory and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    os.remove(os.path.join(self.directory, name))
+
+    def record(self, name: str):
+        """Increments the named statistics counter.
+
+        :param name: Counter name, e.g. "hits", "misses" or "not_modified"
+        :type name: str
+        """
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """Returns the cache statistics counters.
+
+        :returns: Counters of the cache hits, misses, revalidations
+        and stored responses
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        return stats
+
+    @staticmethod
+    def _update_freshness(
+            response: CachedResponse,
+            headers: typing.Dict[str, str]
+    ) -> bool:
+        """Sets the response expiry time from the Cache-Control header.
+
+        :returns: False when the response must not be stored
+        :rtype: bool
+        """
+        directives = parse_cache_control(headers.get("cache-control"))
+        if "no-store" in directives:
+            return False
+        max_age = directives.get("s-maxage", directives.get("max-age"))
+        if "no-cache" in directives or max_age in (None, True):
+            response.expires = 0
+        elif re.match(r"^\d+$", str(max_age)):
+            age = headers.get("age", "0")
+            age = int(age) if age.isdigit() else 0
+            response.expires = time.time() + max(int(max_age) - age, 0)
+        return True
+
+    def _remember(self, key: str, response: CachedResponse):
+        self._memory[key] = response
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_paths(self, key: str):
+        if not self.directory:
+            return None, None
+        path = os.path.join(self.directory, key)
+        return f"{path}.json", f"{path}.body"
+
+    def _read_disk(self, key: str) -> typing.Optional[CachedResponse]:
+        meta_path, body_path = self._disk_paths(key)
+        if not meta_path or not os.path.exists(body_path):
+            return None
+        try:
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(body, **meta)
+
+    def _write_disk(self, key: str, response: CachedResponse):
+        meta_path, body_path = self._disk_paths(key)
+        if not meta_path or self.max_disk_size <= 0:
+            return
+        if len(response.body) > self.max_disk_size:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(body_path, "wb") as body_file:
+                body_file.write(response.body)
+            with open(meta_path, "w") as meta_file:
+                json.dump(response.to_dict(), meta_file)
+        except OSError:
+            return
+        self._trim_disk()
+
+    def _trim_disk(self):
+        """ Removes the least recently written responses until the
+        on-disk store fits in its size limit."""
+        if not self.directory or not os.path.isdir(self.directory):
+            return
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".body"):
+                continue
+            key = name[:-len(".body")]
+            size = 0
+            modified = 0
+            for path in self._disk_paths(key):
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                size += stat.st_size
+                modified = max(modified, stat.st_mtime)
+            entries.append((modified, key, size))
+            total_size += size
+        for _, key, size in sorted(entries):
+            if total_size <= self.max_disk_size:
+                break
+            for path in self._disk_paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            self._memory.pop(key, None)
+            total_size -= size
+
+http_cache = HttpResponseCache()
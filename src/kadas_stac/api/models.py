@@ -15,6 +15,8 @@ import typing
 
 from uuid import UUID, uuid4
 
+from dateutil import parser
+
 from qgis.PyQt import (
     QtCore
 )
@@ -302,6 +304,52 @@ class Collection:
     extent: ResourceExtent = None
     summaries: typing.Dict[str, str] = None
 
+    @classmethod
+    def from_dict(cls, document: dict):
+        """ Creates a collection from a STAC collection document.
+
+        :param document: STAC collection document
+        :type document: dict
+
+        :returns: Collection instance
+        :rtype: Collection
+        """
+        extent = document.get("extent") or {}
+        spatial = extent.get("spatial") or {}
+        temporal = extent.get("temporal") or {}
+        return cls(
+            id=document.get("id"),
+            title=document.get("title"),
+            description=document.get("description"),
+            keywords=document.get("keywords"),
+            license=document.get("license"),
+            stac_version=document.get("stac_version"),
+            stac_extensions=document.get("stac_extensions"),
+            summaries=document.get("summaries"),
+            extent=ResourceExtent(
+                spatial=SpatialExtent(bbox=spatial.get("bbox")),
+                temporal=TemporalExtent(interval=temporal.get("interval"))
+            ),
+            links=[
+                ResourceLink(
+                    href=link.get("href"),
+                    rel=link.get("rel"),
+                    title=link.get("title"),
+                    type=link.get("type")
+                )
+                for link in document.get("links") or []
+            ],
+            providers=[
+                ResourceProvider(
+                    name=provider.get("name"),
+                    description=provider.get("description"),
+                    roles=provider.get("roles"),
+                    url=provider.get("url")
+                )
+                for provider in document.get("providers") or []
+            ],
+        )
+
 
 @dataclasses.dataclass
 class Conformance:
@@ -327,6 +375,234 @@ class Item:
     assets: typing.Dict[str, ResourceAsset] = None
     collection: str = None
     stac_object: STACObject = None
+    lean: bool = False
+
+
+def parse_datetime(value: typing.Optional[str]) -> typing.Optional[datetime.datetime]:
+    """ Parses a STAC datetime string, the common ISO-8601 forms are
+    handled by datetime.fromisoformat, other forms by dateutil.
+
+    :param value: Datetime string
+    :type value: str
+
+    :returns: Parsed datetime or None when the value is empty or invalid
+    :rtype: datetime.datetime
+    """
+    if not value:
+        return None
+    text = f"{value[:-1]}+00:00" if value[-1] in "Zz" else value
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    try:
+        return parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+
+
+_UNSET = object()
+
+
+class ItemProperties:
+    """ Lazy view on the properties of a STAC item feature,
+    each datetime is parsed when it is first accessed.
+    """
+
+    __slots__ = ("_properties", "_datetime", "_start_date", "_end_date")
+
+    def __init__(self, properties: typing.Optional[dict]):
+        self._properties = properties or {}
+        self._datetime = _UNSET
+        self._start_date = _UNSET
+        self._end_date = _UNSET
+
+    @property
+    def resource_datetime(self) -> typing.Optional[datetime.datetime]:
+        if self._datetime is _UNSET:
+            self._datetime = parse_datetime(self._properties.get("datetime"))
+        return self._datetime
+
+    @property
+    def start_date(self) -> typing.Optional[datetime.datetime]:
+        if self._start_date is _UNSET:
+            self._start_date = parse_datetime(
+                self._properties.get("start_date")
+            )
+        return self._start_date
+
+    @property
+    def end_date(self) -> typing.Optional[datetime.datetime]:
+        if self._end_date is _UNSET:
+            self._end_date = parse_datetime(self._properties.get("end_date"))
+        return self._end_date
+
+    @property
+    def eo_cloud_cover(self) -> typing.Optional[float]:
+        return self._properties.get("eo:cloud_cover")
+
+    @property
+    def title(self) -> typing.Optional[str]:
+        return self._properties.get("title")
+
+    @property
+    def description(self) -> typing.Optional[str]:
+        return self._properties.get("description")
+
+
+class ItemView:
+    """ Compact search result item wrapping the raw STAC item feature.
+
+    Provides the models.Item attributes used by the plugin, the
+    properties, assets and pystac object are only built when accessed.
+    """
+
+    __slots__ = (
+        "feature",
+        "item_uuid",
+        "lean",
+        "_root",
+        "_properties",
+        "_assets",
+        "_stac_object",
+    )
+
+    def __init__(
+            self,
+            feature: dict,
+            root=None,
+            lean: bool = False,
+            item_uuid: typing.Optional[UUID] = None
+    ):
+        """
+        :param feature: STAC item feature
+        :type feature: dict
+
+        :param root: Root catalog of the pystac item
+        :type root: pystac.Catalog
+
+        :param lean: Whether the feature only holds the lean search fields
+        :type lean: bool
+
+        :param item_uuid: Plugin item identifier
+        :type item_uuid: UUID
+        """
+        self.feature = feature
+        self.item_uuid = item_uuid or uuid4()
+        self.lean = lean
+        self._root = root
+        self._properties = None
+        self._assets = None
+        self._stac_object = None
+
+    @property
+    def id(self) -> str:
+        return self.feature.get("id")
+
+    @property
+    def collection(self) -> typing.Optional[str]:
+        return self.feature.get("collection")
+
+    @property
+    def geometry(self) -> typing.Optional[dict]:
+        return self.feature.get("geometry")
+
+    @property
+    def bbox(self) -> typing.Optional[typing.List[float]]:
+        return self.feature.get("bbox")
+
+    @property
+    def properties(self) -> ItemProperties:
+        if self._properties is None:
+            self._properties = ItemProperties(self.feature.get("properties"))
+        return self._properties
+
+    @property
+    def assets(self) -> typing.List[ResourceAsset]:
+        if self._assets is None:
+            self._assets = [
+                ResourceAsset(
+                    href=asset.get("href"),
+                    title=asset.get("title") or key,
+                    description=asset.get("description"),
+                    type=asset.get("type"),
+                    roles=asset.get("roles") or []
+                )
+                for key, asset in (self.feature.get("assets") or {}).items()
+            ]
+        return self._assets
+
+    @assets.setter
+    def assets(self, assets: typing.List[ResourceAsset]):
+        self._assets = assets
+
+    @property
+    def stac_object(self) -> STACObject:
+        if self._stac_object is None:
+            # The plugin and pystac_client use the pystac package found
+            # in the bundled libraries folder.
+            from pystac import Item as PystacItem
+
+            feature = dict(self.feature)
+            feature.setdefault("links", [])
+            feature.setdefault("assets", {})
+            self._stac_object = PystacItem.from_dict(
+                feature,
+                root=self._root,
+                preserve_dict=True
+            )
+        return self._stac_object
+
+    @stac_object.setter
+    def stac_object(self, stac_object: STACObject):
+        self._stac_object = stac_object
+
+    @property
+    def self_href(self) -> typing.Optional[str]:
+        """ Href of the item self link."""
+        return next(
+            (
+                link.get("href") for link in self.feature.get("links") or []
+                if link.get("rel") == "self"
+            ),
+            None
+        )
+
+    def asset_href(self, role: str) -> typing.Optional[str]:
+        """ Returns the href of the first asset with the passed role,
+        without building the assets list.
+
+        :param role: Asset role
+        :type role: str
+
+        :returns: Asset href
+        :rtype: str
+        """
+        if self._assets is not None:
+            assets = ((asset.href, asset.roles) for asset in self._assets)
+        else:
+            assets = (
+                (asset.get("href"), asset.get("roles") or [])
+                for asset in (self.feature.get("assets") or {}).values()
+            )
+        return next((href for href, roles in assets if role in roles), None)
+
+    def update(self, feature: dict):
+        """ Replaces the wrapped feature, used when the full item of
+        a lean search result is fetched.
+
+        :param feature: Full STAC item feature
+        :type feature: dict
+        """
+        self.feature = feature
+        self.lean = False
+        self._properties = None
+        self._assets = None
+        self._stac_object = None
+
+    def to_dict(self) -> dict:
+        """ Returns the wrapped STAC item feature."""
+        return self.feature
 
 
 @dataclasses.dataclass
@@ -345,6 +621,7 @@ class ItemSearch:
     filter_lang: FilterLang = FilterLang.CQL_JSON
     sortby: SortField = None
     sort_order: SortOrder = SortOrder.ASCENDING
+    fields: typing.Optional[dict] = None
 
     def params(self):
         """ Converts the class members into a dictionary that
@@ -434,6 +711,9 @@ class ItemSearch:
         if self.sortby:
             parameters["sortby"] = sort_load
 
+        if self.fields:
+            parameters["fields"] = self.fields
+
         return parameters
 
 
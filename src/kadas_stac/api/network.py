@@ -1,9 +1,9 @@
+import math
 import os
 import typing
 import uuid
 import json
 
-from dateutil import parser
 from functools import partial
 
 from json.decoder import JSONDecodeError
@@ -11,7 +11,6 @@ from json.decoder import JSONDecodeError
 from qgis.core import (
     QgsApplication,
     QgsAuthMethodConfig,
-    QgsNetworkContentFetcherTask,
     QgsTask,
 )
 
@@ -19,7 +18,6 @@ from qgis.PyQt import (
     QtGui,
     QtCore,
     QtWidgets,
-    QtNetwork
 )
 
 from .models import (
@@ -28,13 +26,11 @@ from .models import (
     Conformance,
     Collection,
     Constants,
-    Item,
+    ItemView,
     ItemSearch,
-    ResourceAsset,
     ResourceExtent,
     ResourceLink,
     ResourcePagination,
-    ResourceProperties,
     ResourceProvider,
     ResourceType,
     SpatialExtent,
@@ -48,14 +44,32 @@ from .models import (
 from ..lib import planetary_computer as pc
 
 from pystac_client import Client
+from pystac_client.conformance import ConformanceClasses
 from pystac_client.exceptions import APIError
 
+from pystac import Collection as StacCollection
 from pystac.errors import STACTypeError
 
+from ..lib.pystac.link import Link
+
 from ..utils import log, tr
 
-from ..conf import settings_manager
-from ..definitions.constants import SAS_SUBSCRIPTION_VARIABLE
+from ..conf import Settings, settings_manager
+from ..definitions.constants import (
+    CLIENT_CACHE_TTL_DEFAULT,
+    CRAWLER_MAX_REQUESTS_DEFAULT,
+    SAS_SUBSCRIPTION_VARIABLE,
+    STATIC_CATALOG_MAX_DEPTH,
+    STATIC_CATALOG_MAX_ITEMS,
+    STREAM_BATCH_SIZE
+)
+from .client_cache import open_client
+from .collection_cache import collection_cache
+from .crawler import StaticCatalogCrawler
+from .http_cache import http_cache
+from .offline_index import offline_index
+from .sas_signer import sas_signer
+from .pagination import pagination_cursors, search_key
 from ..logger import get_logger
 
 # Initialize logger
@@ -65,89 +79,6 @@ logger = get_logger(level="DEBUG")
 # from .proxy_handler import get_pystac_kwargs
 
 
-def get_all_items_recursive(client, max_items=100, max_depth=3, collection_filter=None):
-    """
-    Recursively navigate a static STAC catalog to collect all items.
-    
-    For hierarchical static catalogs (like Maxar Open Data), items may be nested
-    in sub-collections. This function:
-    1. Gets items from the current catalog/collection
-    2. Recursively gets items from all child collections
-    
-    Args:
-        client: pystac_client.Client instance
-        max_items: Maximum total items to return (safety limit)
-        max_depth: Maximum recursion depth (safety limit)
-        collection_filter: Optional list of collection IDs to filter (only items from these collections)
-    
-    Returns:
-        List of pystac.Item objects
-    """
-    all_items = []
-    
-    def _collect_items_recursive(catalog_or_collection, current_depth=0):
-        """Internal recursive function to collect items."""
-        if current_depth > max_depth:
-            logger.warning(f"Max recursion depth ({max_depth}) reached, stopping")
-            return
-        
-        if len(all_items) >= max_items:
-            logger.info(f"Max items ({max_items}) reached, stopping")
-            return
-        
-        # Check if we should skip this collection based on filter
-        if collection_filter and hasattr(catalog_or_collection, 'id'):
-            collection_id = catalog_or_collection.id
-            if collection_id not in collection_filter:
-                logger.debug(f"Skipping collection '{collection_id}' (not in filter: {collection_filter})")
-                # Still check child collections (might match deeper in hierarchy)
-            else:
-                logger.info(f"✓ Collection '{collection_id}' matches filter")
-        
-        # Get direct items from this catalog/collection
-        try:
-            items_iterator = catalog_or_collection.get_items()
-            for item in items_iterator:
-                if len(all_items) >= max_items:
-                    break
-                    
-                # Apply collection filter to items
-                if collection_filter:
-                    item_collection = getattr(item, 'collection_id', None)
-                    logger.debug(f"Item {item.id} has collection_id: '{item_collection}'")
-                    if item_collection and item_collection not in collection_filter:
-                        logger.debug(f"Skipping item from collection '{item_collection}' (not in filter: {collection_filter})")
-                        continue
-                    elif not item_collection:
-                        logger.warning(f"Item {item.id} has no collection_id attribute, including it")
-                
-                all_items.append(item)
-                logger.debug(f"Found item: {item.id} (total: {len(all_items)})")
-        except Exception as e:
-            logger.debug(f"No items at this level: {e}")
-        
-        # Recursively get items from child collections
-        try:
-            collections_iterator = catalog_or_collection.get_collections()
-            for collection in collections_iterator:
-                if len(all_items) >= max_items:
-                    break
-                logger.debug(f"Descending into collection: {collection.id}")
-                _collect_items_recursive(collection, current_depth + 1)
-        except Exception as e:
-            logger.debug(f"No child collections: {e}")
-    
-    # Start recursive collection from the client (root catalog)
-    if collection_filter:
-        logger.info(f"Starting recursive item collection with collection filter: {collection_filter}")
-    else:
-        logger.info("Starting recursive item collection from static catalog")
-    _collect_items_recursive(client)
-    logger.info(f"Recursive collection complete: {len(all_items)} items found")
-    
-    return all_items
-
-
 class ContentFetcherTask(QgsTask):
     """
     Task to manage the STAC API content search using the pystac_client library,
@@ -167,6 +98,8 @@ class ContentFetcherTask(QgsTask):
     client = None
     pagination = None
 
+    items_batch_ready = QtCore.pyqtSignal(list)
+
     def __init__(
             self,
             url: str,
@@ -177,6 +110,10 @@ class ContentFetcherTask(QgsTask):
             response_handler: typing.Callable = None,
             error_handler: typing.Callable = None,
             auth_config = None,
+            connection_id: str = None,
+            stream_items: bool = False,
+            page_handler: typing.Callable = None,
+            save_items: bool = False,
     ):
         super().__init__()
         self.url = url
@@ -187,6 +124,12 @@ class ContentFetcherTask(QgsTask):
         self.response_handler = response_handler
         self.error_handler = error_handler
         self.auth_config = auth_config
+        self.connection_id = connection_id
+        self.stream_items = stream_items
+        self.page_handler = page_handler
+        self.save_items = save_items
+        self._stream_batch = []
+        self._lean_search = False
 
     def _try_static_fallback(self):
         """
@@ -196,7 +139,7 @@ class ContentFetcherTask(QgsTask):
         :rtype: bool
         """
         logger.warning(f"Attempting static catalog fallback for {self.url}")
-        logger.info("Auto-switching to static catalog navigation (recursive get_items)")
+        logger.info("Auto-switching to static catalog navigation (catalog crawl)")
         
         try:
             # Get collection filter from search params if available
@@ -205,19 +148,12 @@ class ContentFetcherTask(QgsTask):
                 collection_filter = self.search_params.collections
                 logger.info(f"Applying collection filter in fallback mode: {collection_filter}")
             
-            # Use recursive navigation for hierarchical static catalogs
-            items = get_all_items_recursive(
-                self.client, 
-                max_items=100, 
-                max_depth=3,
+            # Crawl the hierarchical static catalog
+            self.response = self._crawl_static_catalog(
+                self.url,
                 collection_filter=collection_filter
             )
             
-            # Convert pystac.Item objects to models.Item objects
-            self.response = [self._prepare_single_item(item) for item in items if item]
-            # Filter out None results
-            self.response = [r for r in self.response if r is not None]
-            
             # Create pagination object for fallback mode
             self.pagination = ResourcePagination(
                 total_items=len(self.response),
@@ -241,6 +177,20 @@ class ContentFetcherTask(QgsTask):
         :rtype: bool
         """
         logger.debug(f"ContentFetcherTask starting: url={self.url}, resource_type={self.resource_type}")
+
+        if self.offline_search_enabled():
+            try:
+                if self.page_handler is not None:
+                    self.response = self.walk_offline_index()
+                else:
+                    self.response = self.search_offline_index()
+                    self.sign_items(self.response)
+            except Exception as err:
+                logger.error(f"Offline search failed: {err}", exc_info=True)
+                self.error = str(err)
+            if self.page_handler is not None and self.isCanceled():
+                return False
+            return self.response is not None
         
         pystac_auth = {}
         if self.auth_config:
@@ -257,7 +207,12 @@ class ContentFetcherTask(QgsTask):
             
             # QgisStacApiIO uses QGIS QgsNetworkAccessManager which handles proxy/SSL automatically
             # No need to configure proxy manually - QGIS settings are respected
-            stac_io = QgisStacApiIO(headers=pystac_auth.get('headers', {}))
+            # Tasks run off the GUI thread, so the next result pages
+            # can be requested while the current one is processed
+            stac_io = QgisStacApiIO(
+                headers=pystac_auth.get('headers', {}),
+                prefetch_pages=True
+            )
             
             logger.info("QgisStacApiIO created - using QGIS network stack (SSL via Qt)")
             
@@ -271,8 +226,11 @@ class ContentFetcherTask(QgsTask):
             
             # Open client with QGIS StacIO
             if stac_io:
-                from ..lib.pystac_client import Client
-                self.client = Client.from_file(self.url, stac_io=stac_io, headers=pystac_auth.get('headers', {}))
+                self.client = self._open_client(
+                    self.url,
+                    stac_io,
+                    pystac_auth.get('headers', {})
+                )
                 logger.info("STAC client opened with QgisStacApiIO")
             else:
                 # This will fail if SSL module is not available, but try anyway as fallback
@@ -286,9 +244,17 @@ class ContentFetcherTask(QgsTask):
                     ResourceType.FEATURE:
                 logger.debug("Fetching FEATURE resources")
                 
+                if isinstance(self.search_params, dict) and \
+                        self.search_params.get('item_href'):
+                    # Full item of a lean search result
+                    self.response = self.read_full_item(
+                        self.search_params.get('item_href')
+                    )
+                    self.pagination = ResourcePagination()
+
                 # Static catalogs: use get_items() instead of search()
-                if self.catalog_type == CatalogType.STATIC.value:
-                    logger.info("Using static catalog navigation (recursive get_items)")
+                elif self.catalog_type == CatalogType.STATIC.value:
+                    logger.info("Using static catalog navigation (catalog crawl)")
                     
                     # For static catalogs with collection selected: use collection URL directly
                     catalog_url = self.url
@@ -299,18 +265,6 @@ class ContentFetcherTask(QgsTask):
                         logger.info(f"🌐 Using root catalog URL: {catalog_url}")
                     
                     try:
-                        # Re-open client with the appropriate URL (root or collection)
-                        if catalog_url != self.url:
-                            logger.info(f"Opening new client for collection URL...")
-                            if stac_io:
-                                from ..lib.pystac_client import Client
-                                collection_client = Client.from_file(catalog_url, stac_io=stac_io, headers=pystac_auth.get('headers', {}))
-                            else:
-                                collection_client = Client.open(catalog_url, headers=pystac_auth.get('headers', {}))
-                            logger.info(f"Client opened for collection")
-                        else:
-                            collection_client = self.client
-                        
                         # Get collection filter from search params if available
                         collection_filter = None
                         if self.search_params and hasattr(self.search_params, 'collections') and self.search_params.collections:
@@ -320,19 +274,12 @@ class ContentFetcherTask(QgsTask):
                         else:
                             logger.info("📋 No collection filter - will search all collections")
                         
-                        # Use recursive navigation for hierarchical static catalogs
-                        items = get_all_items_recursive(
-                            collection_client,  # Use collection-specific client if available 
-                            max_items=100, 
-                            max_depth=3,
+                        # Crawl the hierarchical static catalog from the root or collection URL
+                        self.response = self._crawl_static_catalog(
+                            catalog_url,
                             collection_filter=collection_filter
                         )
                         
-                        # Convert pystac.Item objects to models.Item objects
-                        self.response = [self._prepare_single_item(item) for item in items if item]
-                        # Filter out None results
-                        self.response = [r for r in self.response if r is not None]
-                        
                         # Create pagination object for static catalogs
                         self.pagination = ResourcePagination(
                             total_items=len(self.response),
@@ -356,13 +303,14 @@ class ContentFetcherTask(QgsTask):
                     try:
                         if self.search_params:
                             response = self.client.search(
-                                **self.search_params.params()
+                                **self.search_parameters()
                             )
                         else:
                             response = self.client.search()
-                        self.response = self.prepare_items_results(
+                        self.response = self.stream_all_pages(
                             response
-                        )
+                        ) if self.page_handler is not None \
+                            else self.prepare_items_results(response)
                         logger.info(f"Feature search completed: {len(self.response) if isinstance(self.response, list) else 'unknown'} results")
                     except NotImplementedError as e:
                         # Automatic fallback: try static catalog mode
@@ -379,18 +327,36 @@ class ContentFetcherTask(QgsTask):
                             logger.error(error_msg)
                             raise Exception(error_msg) from e
 
+                if self.page_handler is not None and self.response:
+                    # Static catalogs results are a single page
+                    self.page_handler(self.response)
+                self.index_items(self.response)
+                self.sign_items(self.response)
+
             elif self.resource_type == \
                     ResourceType.COLLECTION:
                 logger.debug("Fetching COLLECTION resources")
-                if self.search_params and self.search_params.get('collection_id'):
-                    response = self.client.get_collection(
-                        self.search_params.get('collection_id')
-                    )
+                collection_id = self.search_params.get('collection_id') \
+                    if self.search_params else None
+                static_collections = self._read_static_collections(
+                    collection_id
+                )
+                if collection_id:
+                    if static_collections is None:
+                        response = self.client.get_collection(collection_id)
+                    else:
+                        response = next(iter(static_collections), None)
+                        if response is None:
+                            raise Exception(
+                                f"Collection {collection_id} not found"
+                            )
                     self.response = self.prepare_collection_result(
                         response
                     )
                 else:
-                    response = self.client.get_collections()
+                    response = static_collections \
+                        if static_collections is not None \
+                        else self.client.get_collections()
                     self.response = self.prepare_collections_results(
                         response
                     )
@@ -427,6 +393,7 @@ class ContentFetcherTask(QgsTask):
             is_search_error = (
                 self.resource_type == ResourceType.FEATURE and
                 self.catalog_type != CatalogType.STATIC.value and
+                not isinstance(self.search_params, dict) and
                 ('/search' in error_str.lower() or 
                  'operation canceled' in error_str.lower() or
                  'http 400' in error_str.lower() or
@@ -455,8 +422,277 @@ class ContentFetcherTask(QgsTask):
                 log(f"Unexpected error: {error_str}")
                 self.error = error_str
 
+        if self.page_handler is not None and self.isCanceled():
+            # The canceled walk did not pass all the result pages
+            return False
         return self.response is not None
 
+    def offline_search_enabled(self):
+        """ Whether the items search is answered from the offline
+        index instead of the catalog.
+
+        :returns: Offline search setting value for item searches
+        :rtype: bool
+        """
+        return self.resource_type == ResourceType.FEATURE and \
+            isinstance(self.search_params, ItemSearch) and \
+            settings_manager.get_value(
+                Settings.OFFLINE_SEARCH,
+                False,
+                setting_type=bool
+            )
+
+    def search_offline_index(self, page=None):
+        """ Searches the items previously fetched from the connection
+        in the offline index, the CQL filters are not evaluated.
+
+        :param page: Result page, defaults to the searched page
+        :type page: int
+
+        :returns: Prepared items of the requested page
+        :rtype: list
+        """
+        parameters = self.search_params.params()
+        if parameters.get('filter'):
+            logger.warning("Filters are ignored by the offline search")
+        page = page or self.search_params.page or 1
+        page_size = parameters.get('limit') or 10
+        records, total = offline_index.search(
+            self.connection_id or self.url,
+            parameters,
+            page
+        )
+        total_pages = math.ceil(total / page_size)
+        self.pagination = ResourcePagination(
+            total_items=total,
+            total_pages=total_pages,
+            current_page=page,
+            page_size=page_size,
+            next_page=page + 1 if page < total_pages else None,
+            previous_page=page - 1 if page > 1 else None
+        )
+        logger.info(f"Offline search matched {total} items")
+        return [
+            ItemView(record['feature'], lean=record['lean'])
+            for record in records
+        ]
+
+    def walk_offline_index(self):
+        """ Walks all the offline index result pages of the search
+        from the first one and passes the items of each page to the
+        page handler, in the task thread.
+
+        :returns: Empty list, the items are passed to the page handler
+        :rtype: list
+        """
+        page = 1
+        while not self.isCanceled():
+            items = self.search_offline_index(page)
+            if items:
+                self.page_handler(items)
+            if self.pagination.next_page is None:
+                break
+            page += 1
+        if self.isCanceled():
+            self.error = tr("the result pages walk was canceled")
+        return []
+
+    def index_items(self, items):
+        """ Adds the fetched items to the offline index, when enabled.
+
+        :param items: Prepared items or item
+        :type items: list
+        """
+        if not items or not settings_manager.get_value(
+                Settings.OFFLINE_INDEX,
+                False,
+                setting_type=bool
+        ):
+            return
+        if isinstance(items, ItemView):
+            items = [items]
+        try:
+            for lean in (False, True):
+                offline_index.add_items(
+                    self.connection_id or self.url,
+                    [item.feature for item in items if item.lean == lean],
+                    lean=lean
+                )
+        except Exception as err:
+            logger.warning(f"Failed to index the fetched items: {err}")
+
+    def sign_items(self, items):
+        """ Signs in place the asset hrefs of the fetched items of a
+        SAS token connection, with one token lookup per storage container
+        for the whole page. The signed features are then shared by the
+        thumbnails, the assets dialog and the downloads.
+
+        :param items: Prepared items or item
+        :type items: list
+        """
+        if not items or \
+                self.api_capability != ApiCapability.SUPPORT_SAS_TOKEN:
+            return
+        if isinstance(items, ItemView):
+            items = [items]
+
+        # If the plugin defined connection sas subscription key
+        # exists use it instead of the environment one.
+        sas_key = os.getenv(SAS_SUBSCRIPTION_VARIABLE)
+        if self.connection_id:
+            connection = settings_manager.get_connection_settings(
+                self.connection_id
+            )
+            sas_key = connection.sas_subscription_key or sas_key
+        try:
+            signed = sas_signer.sign_features(
+                [item.feature for item in items],
+                subscription_key=sas_key
+            )
+            logger.debug(f"Signed {signed} assets of {len(items)} items")
+        except Exception as err:
+            logger.warning(f"Failed to sign the items assets: {err}")
+
+    def _read_static_collections(self, collection_id=None):
+        """ Reads the child collections of a catalog that does not
+        provide the collections endpoint. All the child documents are
+        requested at once, so their latency overlaps instead of adding up
+        as with the sequential link resolution of pystac.
+
+        :param collection_id: Id of the only collection to return
+        :type collection_id: str
+
+        :returns: Child collections, None when the catalog provides the
+        collections endpoint or the StacIO has no asynchronous requests
+        :rtype: list
+        """
+        stac_io = self.client._stac_io
+        if not hasattr(stac_io, 'read_json_async') or \
+                stac_io.conforms_to(ConformanceClasses.COLLECTIONS):
+            return None
+
+        requests = [
+            (href, stac_io.read_json_async(href))
+            for href in (
+                link.get_absolute_href()
+                for link in self.client.get_links('child')
+            )
+            if href
+        ]
+        collections = []
+        for href, future in requests:
+            try:
+                document = future.result()
+            except Exception as e:
+                logger.debug(f"Failed to read child link {href}: {e}")
+                continue
+            if document.get('type') != 'Collection':
+                continue
+            if collection_id and document.get('id') != collection_id:
+                continue
+            collections.append(
+                StacCollection.from_dict(
+                    document,
+                    href=href,
+                    root=self.client,
+                    migrate=True,
+                    preserve_dict=False
+                )
+            )
+        return collections
+
+    def _crawl_static_catalog(self, url, collection_filter=None):
+        """ Collects the items of a static catalog by crawling its
+        child and item links, reporting the crawl progress on this task.
+        Items are prepared, and streamed when enabled, as they are found.
+
+        :param url: Catalog or collection URL
+        :type url: str
+
+        :param collection_filter: Collection ids of the items to keep
+        :type collection_filter: list
+
+        :returns: Prepared items
+        :rtype: list
+        """
+        items = []
+
+        def add_item(item):
+            item_result = self._prepare_single_item(item)
+            if item_result is not None:
+                items.append(item_result)
+                self._stream_item(item_result)
+
+        max_in_flight = settings_manager.get_value(
+            Settings.CRAWLER_MAX_REQUESTS,
+            CRAWLER_MAX_REQUESTS_DEFAULT,
+            setting_type=int
+        )
+        crawler = StaticCatalogCrawler(
+            self.client._stac_io,
+            max_items=STATIC_CATALOG_MAX_ITEMS,
+            max_depth=STATIC_CATALOG_MAX_DEPTH,
+            max_in_flight=max_in_flight,
+            collection_filter=collection_filter,
+            progress_callback=self.setProgress,
+            is_canceled=self.isCanceled,
+            item_callback=add_item,
+        )
+        crawler.crawl(url)
+        self._flush_stream()
+        return items
+
+    def _stream_item(self, item_result):
+        """ Adds the prepared item to the batch streamed to the
+        items_batch_ready signal listeners, when streaming is enabled.
+
+        :param item_result: Prepared item
+        :type item_result: models.ItemView
+        """
+        if not self.stream_items:
+            return
+        self._stream_batch.append(item_result)
+        if len(self._stream_batch) >= STREAM_BATCH_SIZE:
+            self._flush_stream()
+
+    def _flush_stream(self):
+        """ Emits the pending streamed items batch."""
+        if self._stream_batch:
+            self.sign_items(self._stream_batch)
+            self.items_batch_ready.emit(self._stream_batch)
+            self._stream_batch = []
+
+    def _open_client(self, url, stac_io, headers):
+        """ Opens the STAC client for the passed url, reusing the
+        landing page fetched by a previous task when it has not expired.
+
+        :param url: Catalog URL
+        :type url: str
+
+        :param stac_io: QGIS network based StacIO
+        :type stac_io: QgisStacApiIO
+
+        :param headers: Authentication headers
+        :type headers: dict
+
+        :returns: The opened client
+        :rtype: pystac_client.Client
+        """
+        from ..lib.pystac_client import Client
+
+        ttl = settings_manager.get_value(
+            Settings.CLIENT_CACHE_TTL,
+            CLIENT_CACHE_TTL_DEFAULT,
+            setting_type=int
+        )
+        return open_client(
+            Client,
+            url,
+            stac_io,
+            headers=headers,
+            ttl=ttl * 60
+        )
+
     def prepare_auth_properties(self, auth_config_id):
         """ Fetches the required headers and parameters
          from the QGIS Authentication method with the passed configuration id
@@ -569,7 +805,8 @@ class ContentFetcherTask(QgsTask):
             self,
             collections_response
     ):
-        """ Prepares the collections results
+        """ Prepares the collections results, the full collection
+        documents are stored in the connection collections cache.
 
         :param collections_response: Collection generator
         :type collections_response: pystac_client.CollectionClient
@@ -577,23 +814,60 @@ class ContentFetcherTask(QgsTask):
         :returns: List of collections
         :rtype: list
         """
-        collections = []
-        for collection in collections_response:
-            # Avoid Attribute error and assign None to properties that are not available
-            collection_dict = vars(collection)
-            id = collection_dict.get('id', None)
-            title = collection_dict.get('title', None)
-
-            collection_result = Collection(
-                id=id,
-                title=title,
-            )
-            collections.append(collection_result)
-        return collections
+        documents = [
+            collection.to_dict(transform_hrefs=False)
+            for collection in collections_response
+        ]
+        added, removed = collection_cache.put(
+            self.connection_id or self.url,
+            documents
+        )
+        logger.debug(
+            f"Cached {len(documents)} collections, "
+            f"{len(added)} added, {len(removed)} removed"
+        )
+        return [Collection.from_dict(document) for document in documents]
+
+    def search_parameters(self):
+        """ Returns the pystac-client search parameters. The lean search
+        fields are only sent when the catalog supports the fields extension.
+
+        :returns: Search parameters
+        :rtype: dict
+        """
+        parameters = self.search_params.params()
+        self._lean_search = bool(parameters.get('fields'))
+        if self._lean_search and not self.client._stac_io.conforms_to(
+                ConformanceClasses.FIELDS
+        ):
+            logger.debug("Fields extension not supported, requesting full items")
+            parameters.pop('fields')
+            self._lean_search = False
+        return parameters
+
+    def read_full_item(self, item_href):
+        """ Reads and prepares the full item document at the passed href,
+        used to hydrate the items returned by lean searches.
+
+        :param item_href: Item self link
+        :type item_href: str
+
+        :returns: Prepared full item
+        :rtype: models.ItemView
+        """
+        feature = self.client._stac_io.read_json(item_href)
+        links = feature.setdefault('links', [])
+        if not any(link.get('rel') == 'self' for link in links):
+            links.append({'rel': 'self', 'href': item_href})
+        return self._prepare_single_item(feature)
 
     def prepare_items_results(self, response):
         """ Prepares the search items results
 
+        Opens the requested page starting from the nearest stored
+        pagination cursor of the current search, instead of walking
+        all the result pages from the first one.
+
         :param response: Fetched response from the pystac-client library
         :type response: pystac_client.ItemSearch
 
@@ -601,115 +875,215 @@ class ContentFetcherTask(QgsTask):
         :rtype: list
         """
         self.pagination = ResourcePagination()
-        count = 1
-        items_generator = response.get_item_collections()
-        prev_collection = None
-        items_collection = None
         page = self.search_params.page \
-            if self.search_params else Constants.PAGE_SIZE
+            if self.search_params else 1
+        parameters = self.search_params.params() \
+            if self.search_params else {}
+        connection_key = self.connection_id or self.url
+        key = search_key(parameters)
+        stac_io = response._stac_io
+
+        count, cursor = pagination_cursors.nearest_cursor(
+            connection_key,
+            key,
+            page
+        )
+        base_parameters = response.get_parameters()
+        if cursor is None:
+            items_page = stac_io.read_json(
+                response.url,
+                method=response.method,
+                parameters=base_parameters
+            )
+        else:
+            logger.debug(f"Opening page {count} from the cached cursor")
+            items_page = stac_io.read_json(
+                Link.from_dict(cursor),
+                parameters=base_parameters
+            )
+
         while True:
-            try:
-                collection = next(items_generator)
-                prev_collection = collection
-                if page == count:
-                    items_collection = collection
-                    break
-                count += 1
-            except StopIteration:
-                self.pagination.total_pages = count
-                items_collection = prev_collection
+            next_link = next(
+                (
+                    link for link in items_page.get('links', [])
+                    if link.get('rel') == 'next'
+                ),
+                None
+            )
+            if next_link:
+                pagination_cursors.store(
+                    connection_key,
+                    key,
+                    count + 1,
+                    next_link
+                )
+            else:
+                pagination_cursors.mark_last_page(
+                    connection_key,
+                    key,
+                    count
+                )
+                if page > count:
+                    self.pagination.total_pages = count
+                break
+            if page == count:
+                self.pagination.next_page = count + 1
                 break
-        items = self.get_items_list(items_collection)
+            count += 1
+            items_page = stac_io.read_json(
+                Link.from_dict(next_link),
+                parameters=base_parameters
+            )
+
+        # Only the requested page is streamed and saved, a page past
+        # the end of the results is not displayed.
+        displayed = self.pagination.total_pages == 0
+        records = [] if self.save_items and displayed else None
+        items = self.get_items_list(
+            items_page.get('features', []),
+            stream=displayed,
+            records=records
+        )
+        if records:
+            self.store_items(page, records)
         return items
 
-    def get_items_list(self, items_collection):
+    def store_items(self, page, records):
+        """ Saves the item records of the displayed result page in the
+        plugin items store.
+
+        :param page: Result page of the items
+        :type page: int
+
+        :param records: Item records
+        :type records: list
+        """
+        if not self.connection_id:
+            return
+        try:
+            settings_manager.save_items(
+                self.connection_id,
+                records,
+                page,
+                replace_page=True
+            )
+        except Exception as err:
+            logger.warning(f"Failed to save the result items: {err}")
+
+    def stream_all_pages(self, response):
+        """ Walks all the search result pages from the first one and
+        passes the items of each page to the page handler, in the task
+        thread. Only the items of the current page are kept.
+
+        The "next" links of the walked pages are stored as the search
+        pagination cursors.
+
+        :param response: Fetched response from the pystac-client library
+        :type response: pystac_client.ItemSearch
+
+        :returns: Empty list, the items are passed to the page handler.
+        The task run fails when the walk is canceled.
+        :rtype: list
+        """
+        self.pagination = ResourcePagination()
+        parameters = self.search_params.params() \
+            if self.search_params else {}
+        connection_key = self.connection_id or self.url
+        key = search_key(parameters)
+        stac_io = response._stac_io
+        base_parameters = response.get_parameters()
+
+        count = 1
+        items_page = stac_io.read_json(
+            response.url,
+            method=response.method,
+            parameters=base_parameters
+        )
+        while not self.isCanceled():
+            self.page_handler(
+                self.get_items_list(items_page.get('features', []))
+            )
+            next_link = next(
+                (
+                    link for link in items_page.get('links', [])
+                    if link.get('rel') == 'next'
+                ),
+                None
+            )
+            if not next_link:
+                pagination_cursors.mark_last_page(
+                    connection_key,
+                    key,
+                    count
+                )
+                break
+            pagination_cursors.store(
+                connection_key,
+                key,
+                count + 1,
+                next_link
+            )
+            count += 1
+            items_page = stac_io.read_json(
+                Link.from_dict(next_link),
+                parameters=base_parameters
+            )
+        self.pagination.total_pages = count
+        if self.isCanceled():
+            self.error = tr("the result pages walk was canceled")
+        return []
+
+    def get_items_list(self, features, stream=False, records=None):
         """ Gets and prepares the items list from the
-        pystac-client Collection generator
+        fetched STAC item features
+
+        :param features: The STAC item features
+        :type features: list
+
+        :param stream: Whether to stream the prepared items
+        :type stream: bool
 
-        :param items_collection: The STAC item collection generator
-        :type items_collection: pystac_client.CollectionClient
+        :param records: When passed, receives the items store records
+        of the items, built before the streamed items are signed
+        :type records: list
 
         :returns: List of items
-        :rtype: models.Item
+        :rtype: models.ItemView
         """
         items = []
-        properties = None
-        items_list = items_collection.items if items_collection else []
 
-        for item in items_list:
-            item_result = self._prepare_single_item(item)
+        for feature in features or []:
+            item_result = self._prepare_single_item(feature)
             if item_result:
                 items.append(item_result)
+                if records is not None:
+                    records.append(settings_manager.item_record(item_result))
+                if stream:
+                    self._stream_item(item_result)
+        self._flush_stream()
 
         return items
     
-    def _prepare_single_item(self, item):
+    def _prepare_single_item(self, feature):
         """
-        Prepare a single pystac.Item into a models.Item object.
+        Prepare a single STAC item feature into a models.ItemView object.
+        The properties and assets are only parsed when accessed.
         
-        :param item: pystac.Item object
-        :type item: pystac.Item
+        :param feature: STAC item feature
+        :type feature: dict
         
-        :returns: Prepared Item object or None if error
-        :rtype: models.Item or None
+        :returns: Prepared ItemView object or None if invalid
+        :rtype: models.ItemView or None
         """
-        try:
-            properties_datetime = item.properties.get("datetime")
-
-            item_datetime = parser.parse(
-                properties_datetime
-            ) if properties_datetime else None
-
-            properties_start_date = item.properties.get("start_date")
-            start_date = parser.parse(
-                properties_start_date,
-            ) if properties_start_date else None
-
-            properties_end_date = item.properties.get("end_date")
-
-            end_date = parser.parse(
-                properties_end_date
-            ) if properties_end_date else None
-
-            cloud_cover = item.properties.get("eo:cloud_cover")
-
-            properties = ResourceProperties(
-                resource_datetime=item_datetime,
-                eo_cloud_cover=cloud_cover,
-                start_date=start_date,
-                end_date=end_date
-            )
-        except Exception as e:
-            log(
-                f"Error in parsing item properties datetime: {e}"
-            )
-            properties = None
-            
-        assets = []
-        for key, asset in item.assets.items():
-            title = asset.title if asset.title else key
-            item_asset = ResourceAsset(
-                href=asset.href,
-                title=title,
-                description=asset.description,
-                type=asset.media_type,
-                roles=asset.roles or []
-            )
-            assets.append(item_asset)
-            
-        item_result = Item(
-            id=item.id,
-            item_uuid=uuid.uuid4(),
-            properties=properties,
-            collection=item.collection_id,
-            assets=assets,
-            stac_object=item,
+        if not isinstance(feature, dict) or feature.get("id") is None:
+            log(f"Skipping invalid item feature: {str(feature)[:200]}")
+            return None
+
+        return ItemView(
+            feature,
+            root=self.client,
+            lean=self._lean_search,
         )
-        
-        if item.geometry:
-            item_result.geometry = item.geometry
-            
-        return item_result
 
     def prepare_conformance_results(self, conformance):
         """ Prepares the fetched conformance classes
@@ -741,6 +1115,7 @@ class ContentFetcherTask(QgsTask):
         :param result: Whether task completed with success
         :type result: bool
         """
+        logger.debug(f"Network cache statistics: {http_cache.stats()}")
         if result:
             self.response_handler(self.response, self.pagination)
         else:
@@ -781,13 +1156,8 @@ class NetworkFetcher(QtCore.QObject):
             raise NotImplementedError
 
         url = f"{self.url.strip('/')}/{endpoint}"
-        request = QtNetwork.QNetworkRequest(
-            QtCore.QUrl(
-                url
-            )
-        )
         self.network_task(
-            request,
+            url,
             self.queryable_response,
             self.error_handler
         )
@@ -803,59 +1173,46 @@ class NetworkFetcher(QtCore.QObject):
 
     def network_task(
             self,
-            request,
+            url,
             handler,
-            error_handler,
-            auth_config=""
+            error_handler
     ):
-        """Fetches the response from the given request.
+        """Fetches the JSON content of the given URL without blocking,
+        the response is handled once the reply is received.
 
-        :param request: Network request
-        :type request: QNetworkRequest
+        :param url: Resource URL
+        :type url: str
 
         :param handler: Callback function to handle the response
         :type handler: Callable
 
-        :param auth_config: Authentication configuration string
-        :type auth_config: str
+        :param error_handler: Callback function to handle the errors
+        :type error_handler: Callable
         """
-        task = QgsNetworkContentFetcherTask(
-            request,
-            authcfg=auth_config
-        )
-        response_handler = partial(
-            self.response,
-            task,
-            handler,
-            error_handler
+        from .qgis_stac_io import QgisStacApiIO
 
+        future = QgisStacApiIO().read_json_async(url)
+        future.add_done_callback(
+            partial(self.response, handler, error_handler)
         )
-        task.fetched.connect(response_handler)
-        task.run()
 
     def response(
             self,
-            task,
             handler,
-            error_handler
+            error_handler,
+            future
     ):
         """ Handles the returned response
 
-        :param task: QGIS task that fetches network content
-        :type task:  QgsNetworkContentFetcherTask
+        :param future: Completed JSON content request
+        :type future:  RequestFuture
         """
-        reply = task.reply()
-        error = reply.error()
-        if error == QtNetwork.QNetworkReply.NoError:
-            contents: QtCore.QByteArray = reply.readAll()
-            try:
-                data = json.loads(
-                    contents.data().decode()
-                )
-                queryable = self.prepare_queryable(data)
-                handler(queryable)
-            except json.decoder.JSONDecodeError as err:
-                log(tr("Problem parsing network response"))
+        error = future.exception()
+        if error is None:
+            queryable = self.prepare_queryable(future.result())
+            handler(queryable)
+        elif isinstance(error, JSONDecodeError):
+            log(tr("Problem parsing network response"))
         else:
             error_handler(tr("Problem fetching response from network"))
 
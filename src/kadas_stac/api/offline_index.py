@@ -0,0 +1,643 @@
+# -*- coding: utf-8 -*-
+"""
+    Local search index of the STAC items fetched from the catalogs.
+
+    The fetched item features are kept in a SQLite database with an
+    R-tree over their bounding boxes and a full text index over their
+    ids and properties, so that searches can be answered without a
+    network connection. The index is bounded by the age of the items
+    and by the size of the stored features.
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+from .sas_signer import unsigned_feature
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    connection TEXT NOT NULL,
+    collection TEXT NOT NULL,
+    id TEXT NOT NULL,
+    start_time REAL,
+    end_time REAL,
+    min_x REAL,
+    min_y REAL,
+    max_x REAL,
+    max_y REAL,
+    fetched REAL NOT NULL,
+    size INTEGER NOT NULL,
+    lean INTEGER NOT NULL,
+    feature TEXT NOT NULL,
+    UNIQUE (connection, collection, id)
+);
+CREATE INDEX IF NOT EXISTS items_connection_time
+    ON items (connection, start_time);
+CREATE INDEX IF NOT EXISTS items_fetched
+    ON items (fetched);
+"""
+
+RTREE_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_rtree
+    USING rtree (id, min_x, max_x, min_y, max_y);
+CREATE TRIGGER IF NOT EXISTS items_rtree_delete AFTER DELETE ON items
+BEGIN
+    DELETE FROM items_rtree WHERE id = old.rowid;
+END;
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts
+    USING fts5 (id, properties);
+CREATE TRIGGER IF NOT EXISTS items_fts_delete AFTER DELETE ON items
+BEGIN
+    DELETE FROM items_fts WHERE rowid = old.rowid;
+END;
+"""
+
+# Operators of the STAC API query extension
+QUERY_OPERATORS = {
+    "eq": lambda value, expected: value == expected,
+    "neq": lambda value, expected: value != expected,
+    "lt": lambda value, expected: value < expected,
+    "lte": lambda value, expected: value <= expected,
+    "gt": lambda value, expected: value > expected,
+    "gte": lambda value, expected: value >= expected,
+    "startsWith": lambda value, expected: str(value).startswith(expected),
+    "endsWith": lambda value, expected: str(value).endswith(expected),
+    "contains": lambda value, expected: expected in str(value),
+    "in": lambda value, expected: value in expected,
+}
+
+SORT_COLUMNS = {
+    "id": "id",
+    "collection": "collection",
+    "datetime": "start_time",
+    "properties.datetime": "start_time",
+}
+
+
+def timestamp(value) -> typing.Optional[float]:
+    """Converts an RFC 3339 date time to seconds since the epoch,
+    date times without time zone are in UTC.
+
+    :param value: Date time text
+    :type value: str
+
+    :returns: Timestamp or None when the value is empty or open
+    :rtype: float
+    """
+    if not value or value == "..":
+        return None
+    text = value.strip()
+    if text[-1:] in ("Z", "z"):
+        text = f"{text[:-1]}+00:00"
+    try:
+        parsed = datetime.datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            from dateutil import parser
+            parsed = parser.isoparse(value)
+        except (ImportError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def datetime_range(value) -> typing.Tuple[
+    typing.Optional[float],
+    typing.Optional[float]
+]:
+    """Returns the bounds of a STAC API datetime parameter, an
+    instant or an interval with optionally open ends.
+
+    :param value: Datetime parameter
+    :type value: str
+
+    :returns: Start and end timestamps, None for an open end
+    :rtype: tuple
+    """
+    if not value:
+        return None, None
+    if "/" in value:
+        start, end = value.split("/", 1)
+        return timestamp(start), timestamp(end)
+    instant = timestamp(value)
+    return instant, instant
+
+
+def matches_query(properties: dict, query: typing.Optional[dict]) -> bool:
+    """Tests the item properties against a STAC API query extension
+    filter, comparisons between mismatched types do not match.
+
+    :param properties: Item properties
+    :type properties: dict
+
+    :param query: Property names mapped to their operators and values
+    :type query: dict
+
+    :returns: Whether the properties match all the query operators
+    :rtype: bool
+    """
+    for name, operators in (query or {}).items():
+        if name not in properties:
+            return False
+        value = properties[name]
+        if not isinstance(operators, dict):
+            operators = {"eq": operators}
+        for operator, expected in operators.items():
+            test = QUERY_OPERATORS.get(operator)
+            if test is None:
+                return False
+            try:
+                if not test(value, expected):
+                    return False
+            except TypeError:
+                return False
+    return True
+
+
+class OfflineIndex:
+    """ Searchable store of the fetched item features by connection.
+
+    Items are identified by their connection, collection and id, adding
+    an item that is already indexed replaces the stored feature, except
+    that the fields of a lean search do not replace a full item. Searches
+    take the STAC API item search parameters and return records,
+    dictionaries with the "feature" and "lean" keys.
+    """
+
+    def __init__(
+            self,
+            path: typing.Optional[str] = None,
+            max_age: typing.Optional[float] = None,
+            max_size: typing.Optional[int] = None
+    ):
+        """
+        :param path: Database file path
+        :type path: str
+
+        :param max_age: Seconds after which the items are evicted
+        :type max_age: float
+
+        :param max_size: Bytes of stored features kept in the index
+        :type max_size: int
+        """
+        self.path = path
+        self.max_age = max_age
+        self.max_size = max_size
+        self.has_rtree = False
+        self.has_fts = False
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def configure(
+            self,
+            path: typing.Optional[str] = None,
+            max_age: typing.Optional[float] = None,
+            max_size: typing.Optional[int] = None
+    ):
+        """Sets the database file path and the eviction limits, the
+        database is opened on first use.
+
+        :param path: Database file path
+        :type path: str
+
+        :param max_age: Seconds after which the items are evicted
+        :type max_age: float
+
+        :param max_size: Bytes of stored features kept in the index
+        :type max_size: int
+        """
+        with self._lock:
+            if path is not None and path != self.path:
+                self.close()
+                self.path = path
+            if max_age is not None:
+                self.max_age = max_age
+            if max_size is not None:
+                self.max_size = max_size
+
+    def close(self):
+        """ Closes the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _database(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path is None:
+                raise RuntimeError("The offline index path is not configured")
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(
+                self.path,
+                check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(SCHEMA)
+            # The SQLite library may be built without these modules,
+            # bboxes and text are then matched on the items table.
+            try:
+                connection.executescript(RTREE_SCHEMA)
+                self.has_rtree = True
+            except sqlite3.OperationalError:
+                self.has_rtree = False
+            try:
+                connection.executescript(FTS_SCHEMA)
+                self.has_fts = True
+            except sqlite3.OperationalError:
+                self.has_fts = False
+            self._connection = connection
+        return self._connection
+
+    def add_items(
+            self,
+            connection_key,
+            features: typing.List[dict],
+            lean: bool = False
+    ):
+        """Indexes the passed item features in one transaction,
+        then evicts the items over the index limits.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param features: STAC item features
+        :type features: list
+
+        :param lean: Whether the features only hold the lean search fields
+        :type lean: bool
+        """
+        rows = [
+            row for row in (
+                self._item_row(str(connection_key), feature, lean)
+                for feature in features
+            )
+            if row is not None
+        ]
+        if not rows:
+            return
+        with self._lock:
+            database = self._database()
+            with database:
+                for row, properties_text in rows:
+                    upsert = database.execute(
+                        "INSERT INTO items (connection, collection, id, "
+                        "start_time, end_time, min_x, min_y, max_x, max_y, "
+                        "fetched, size, lean, feature) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (connection, collection, id) DO UPDATE "
+                        "SET start_time = excluded.start_time, "
+                        "end_time = excluded.end_time, "
+                        "min_x = excluded.min_x, min_y = excluded.min_y, "
+                        "max_x = excluded.max_x, max_y = excluded.max_y, "
+                        "fetched = excluded.fetched, size = excluded.size, "
+                        "lean = excluded.lean, feature = excluded.feature "
+                        "WHERE NOT excluded.lean OR items.lean",
+                        row
+                    )
+                    if not upsert.rowcount:
+                        # A stored full item is kept over its lean version,
+                        # so are its bbox and text index rows
+                        continue
+                    rowid = database.execute(
+                        "SELECT rowid FROM items WHERE connection = ? "
+                        "AND collection = ? AND id = ?",
+                        row[:3]
+                    ).fetchone()[0]
+                    if self.has_rtree:
+                        database.execute(
+                            "DELETE FROM items_rtree WHERE id = ?",
+                            (rowid,)
+                        )
+                        min_x, min_y, max_x, max_y = row[5:9]
+                        if min_x is not None:
+                            if min_x > max_x:
+                                # Crossing the antimeridian
+                                min_x, max_x = -180.0, 180.0
+                            database.execute(
+                                "INSERT INTO items_rtree "
+                                "VALUES (?, ?, ?, ?, ?)",
+                                (rowid, min_x, max_x, min_y, max_y)
+                            )
+                    if self.has_fts:
+                        database.execute(
+                            "DELETE FROM items_fts WHERE rowid = ?",
+                            (rowid,)
+                        )
+                        database.execute(
+                            "INSERT INTO items_fts (rowid, id, properties) "
+                            "VALUES (?, ?, ?)",
+                            (rowid, row[2], properties_text)
+                        )
+            self.evict()
+
+    @staticmethod
+    def _item_row(connection_key, feature, lean):
+        """Returns the items table row of the feature and the text of
+        its properties, None for an invalid feature.
+        """
+        if not isinstance(feature, dict) or feature.get("id") is None:
+            return None
+        properties = feature.get("properties") or {}
+        start = properties.get("start_datetime") or properties.get("datetime")
+        end = properties.get("end_datetime") or properties.get("datetime")
+        bbox = OfflineIndex._bbox(feature) or [None] * 4
+        # Streamed result pages are signed in place before they are
+        # indexed, the expiring SAS tokens are not stored
+        document = json.dumps(unsigned_feature(feature))
+        properties_text = " ".join(
+            f"{name} {value}" for name, value in properties.items()
+            if isinstance(value, (str, int, float))
+        )
+        row = (
+            connection_key,
+            feature.get("collection") or "",
+            str(feature["id"]),
+            timestamp(start),
+            timestamp(end),
+            *bbox,
+            time.time(),
+            len(document),
+            int(lean),
+            document,
+        )
+        return row, properties_text
+
+    @staticmethod
+    def _bbox(feature) -> typing.Optional[typing.List[float]]:
+        bbox = feature.get("bbox")
+        if bbox and len(bbox) == 6:
+            return [bbox[0], bbox[1], bbox[3], bbox[4]]
+        if bbox and len(bbox) == 4:
+            return list(bbox)
+        xs = []
+        ys = []
+
+        def visit(coordinates):
+            if coordinates and isinstance(coordinates[0], (int, float)):
+                xs.append(coordinates[0])
+                ys.append(coordinates[1])
+            else:
+                for child in coordinates or []:
+                    visit(child)
+
+        visit((feature.get("geometry") or {}).get("coordinates"))
+        if not xs:
+            return None
+        return [min(xs), min(ys), max(xs), max(ys)]
+
+    def search(
+            self,
+            connection_key,
+            parameters: dict,
+            page: int = 1
+    ) -> typing.Tuple[typing.List[dict], int]:
+        """Searches the indexed items of a connection.
+
+        The "bbox", "datetime", "collections", "ids", "query", "q",
+        "sortby" and "limit" STAC API search parameters are evaluated,
+        the CQL filters are not.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param parameters: Item search parameters
+        :type parameters: dict
+
+        :param page: Result page, starting from 1
+        :type page: int
+
+        :returns: Item records of the page and the total matched items
+        :rtype: tuple
+        """
+        bbox = parameters.get("bbox")
+        text = parameters.get("q")
+        # When the R-tree or the text index select the candidates, the
+        # unary plus keeps the planner from scanning the connection index.
+        conditions = [
+            "+connection = ?" if bbox or text else "connection = ?"
+        ]
+        values = [str(connection_key)]
+
+        collections = parameters.get("collections")
+        if collections:
+            conditions.append(
+                f"collection IN ({', '.join('?' * len(collections))})"
+            )
+            values.extend(collections)
+
+        ids = parameters.get("ids")
+        if ids:
+            conditions.append(f"id IN ({', '.join('?' * len(ids))})")
+            values.extend(str(item_id) for item_id in ids)
+
+        start, end = datetime_range(parameters.get("datetime"))
+        if start is not None:
+            conditions.append("end_time >= ?")
+            values.append(start)
+        if end is not None:
+            conditions.append("start_time <= ?")
+            values.append(end)
+
+        with self._lock:
+            database = self._database()
+            if bbox:
+                condition, bbox_values = self._bbox_condition(bbox)
+                conditions.append(condition)
+                values.extend(bbox_values)
+
+            if text:
+                condition, text_values = self._text_condition(text)
+                conditions.append(condition)
+                values.extend(text_values)
+
+            where = " AND ".join(conditions)
+            order = self._order(parameters.get("sortby"))
+            page_size = int(parameters.get("limit") or 10)
+            offset = (max(1, int(page or 1)) - 1) * page_size
+            query = parameters.get("query")
+
+            if not query:
+                total = database.execute(
+                    f"SELECT COUNT(*) FROM items WHERE {where}",
+                    values
+                ).fetchone()[0]
+                rows = database.execute(
+                    f"SELECT feature, lean FROM items WHERE {where} "
+                    f"ORDER BY {order} LIMIT ? OFFSET ?",
+                    values + [page_size, offset]
+                )
+                return [
+                    {"feature": json.loads(feature), "lean": bool(lean)}
+                    for feature, lean in rows
+                ], total
+
+            matched = []
+            for feature, lean in database.execute(
+                    f"SELECT feature, lean FROM items "
+                    f"WHERE {where} ORDER BY {order}",
+                    values
+            ):
+                feature = json.loads(feature)
+                if matches_query(feature.get("properties") or {}, query):
+                    matched.append({"feature": feature, "lean": bool(lean)})
+        return matched[offset:offset + page_size], len(matched)
+
+    def _bbox_condition(self, bbox) -> typing.Tuple[str, list]:
+        if len(bbox) == 6:
+            bbox = [bbox[0], bbox[1], bbox[3], bbox[4]]
+        min_x, min_y, max_x, max_y = bbox
+        if min_x > max_x:
+            # Crossing the antimeridian
+            ranges = [(min_x, 180.0), (-180.0, max_x)]
+        else:
+            ranges = [(min_x, max_x)]
+
+        columns = ("min_x", "max_x", "min_y", "max_y")
+        tests = []
+        values = []
+        for range_min_x, range_max_x in ranges:
+            tests.append(
+                f"({columns[0]} <= ? AND {columns[1]} >= ? AND "
+                f"{columns[2]} <= ? AND {columns[3]} >= ?)"
+            )
+            values.extend([range_max_x, range_min_x, max_y, min_y])
+        if self.has_rtree:
+            return (
+                f"rowid IN (SELECT id FROM items_rtree "
+                f"WHERE {' OR '.join(tests)})",
+                values
+            )
+        return f"({' OR '.join(tests)})", values
+
+    def _text_condition(self, text) -> typing.Tuple[str, list]:
+        """Returns the condition matching the items with any of the
+        comma separated phrases of the free text search.
+        """
+        phrases = [
+            phrase.strip() for phrase in str(text).split(",")
+            if phrase.strip()
+        ]
+        if self.has_fts:
+            expression = " OR ".join(
+                '"{}"'.format(phrase.replace('"', '""'))
+                for phrase in phrases
+            )
+            return (
+                "rowid IN (SELECT rowid FROM items_fts "
+                "WHERE items_fts MATCH ?)",
+                [expression]
+            )
+        tests = []
+        values = []
+        for phrase in phrases:
+            tests.append("(id LIKE ? OR feature LIKE ?)")
+            values.extend([f"%{phrase}%", f"%{phrase}%"])
+        return f"({' OR '.join(tests)})", values
+
+    @staticmethod
+    def _order(sortby) -> str:
+        orders = []
+        for sort in sortby or []:
+            column = SORT_COLUMNS.get(sort.get("field"))
+            if column is None:
+                continue
+            direction = "DESC" \
+                if sort.get("direction") == "desc" else "ASC"
+            orders.append(f"{column} {direction}")
+        if not orders:
+            orders.append("start_time DESC")
+        orders.append("id")
+        return ", ".join(orders)
+
+    def evict(self):
+        """ Removes the items older than the maximum age, then the
+        oldest items until the stored features fit in the maximum size.
+        """
+        with self._lock:
+            database = self._database()
+            with database:
+                if self.max_age:
+                    database.execute(
+                        "DELETE FROM items WHERE fetched < ?",
+                        (time.time() - self.max_age,)
+                    )
+                if not self.max_size:
+                    return
+                size = database.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM items"
+                ).fetchone()[0]
+                excess = size - self.max_size
+                if excess <= 0:
+                    return
+                evicted = []
+                for rowid, item_size in database.execute(
+                        "SELECT rowid, size FROM items ORDER BY fetched"
+                ):
+                    evicted.append((rowid,))
+                    excess -= item_size
+                    if excess <= 0:
+                        break
+                database.executemany(
+                    "DELETE FROM items WHERE rowid = ?",
+                    evicted
+                )
+
+    def count(self, connection_key=None) -> int:
+        """Returns the number of indexed items.
+
+        :param connection_key: Connection identifier, all the
+        connections items are counted when None
+        :type connection_key: str
+
+        :returns: Number of items
+        :rtype: int
+        """
+        with self._lock:
+            database = self._database()
+            if connection_key is None:
+                return database.execute(
+                    "SELECT COUNT(*) FROM items"
+                ).fetchone()[0]
+            return database.execute(
+                "SELECT COUNT(*) FROM items WHERE connection = ?",
+                (str(connection_key),)
+            ).fetchone()[0]
+
+    def clear(self, connection_key=None):
+        """Removes the indexed items of a connection, or all the
+        items when no connection is passed.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+        """
+        with self._lock:
+            database = self._database()
+            with database:
+                if connection_key is None:
+                    database.execute("DELETE FROM items")
+                else:
+                    database.execute(
+                        "DELETE FROM items WHERE connection = ?",
+                        (str(connection_key),)
+                    )
+
+    def clear_all(self):
+        """Removes the indexed items of all the connections.
+
+        Slot of the settings clear button, its clicked signal would
+        pass the checked state as the connection of clear().
+        """
+        self.clear()
+
+
+offline_index = OfflineIndex()
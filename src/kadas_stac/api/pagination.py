@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+    Pagination cursors for the STAC API item searches.
+
+    STAC APIs paginate search results by returning a "next" link
+    (URL, POST body or token) with every page. The cursors of the pages
+    that have already been visited are kept per connection, so that any
+    page of the current search can be opened with a single request
+    instead of walking the results from the first page.
+"""
+
+import copy
+import json
+import threading
+import typing
+
+
+def search_key(search_parameters: typing.Optional[dict]) -> str:
+    """Builds a stable key from the item search parameters.
+
+    Parameters without a value are dropped and the remaining
+    keys are sorted, so equal searches produce equal keys regardless
+    of how the parameters dictionary was built.
+
+    :param search_parameters: Item search parameters, usually the
+    output of ItemSearch.params()
+    :type search_parameters: dict
+
+    :returns: Normalized search key
+    :rtype: str
+    """
+    parameters = {
+        key: value
+        for key, value in (search_parameters or {}).items()
+        if value is not None and value != []
+    }
+    return json.dumps(
+        parameters,
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+
+
+class _SearchCursors:
+    """ Cursors stored for a single search of a connection."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.cursors = {}
+        self.last_page = None
+
+
+class PaginationCursorCache:
+    """ Stores the "next" links of the visited item search result pages.
+
+    Only the cursors of the latest search of each connection are kept,
+    a search with different parameters drops the previous cursors.
+    """
+
+    def __init__(self):
+        self._searches: typing.Dict[str, _SearchCursors] = {}
+        self._lock = threading.Lock()
+
+    def _search(self, connection_key, key, create=False):
+        """Returns the cursors stored for the passed search, any cursors
+        stored for a previous search of the connection are dropped.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by search_key()
+        :type key: str
+
+        :param create: Whether to create the search entry if missing
+        :type create: bool
+
+        :returns: The search cursors
+        :rtype: _SearchCursors
+        """
+        connection_key = str(connection_key)
+        search = self._searches.get(connection_key)
+        if search is not None and search.key != key:
+            del self._searches[connection_key]
+            search = None
+        if search is None and create:
+            search = _SearchCursors(key)
+            self._searches[connection_key] = search
+        return search
+
+    def nearest_cursor(self, connection_key, key, page):
+        """Finds the closest stored cursor for the passed page.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by search_key()
+        :type key: str
+
+        :param page: Target page number
+        :type page: int
+
+        :returns: Tuple of the page number and its cursor, the cursor is
+        None when the search has to start from the first page.
+        :rtype: tuple
+        """
+        with self._lock:
+            search = self._search(connection_key, key)
+            if search is None:
+                return 1, None
+            pages = [number for number in search.cursors if number <= page]
+            if not pages:
+                return 1, None
+            number = max(pages)
+            return number, copy.deepcopy(search.cursors[number])
+
+    def store(self, connection_key, key, page, cursor):
+        """Stores the cursor used to open the passed page.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by search_key()
+        :type key: str
+
+        :param page: Page number that the cursor opens
+        :type page: int
+
+        :param cursor: The STAC "next" link of the previous page
+        :type cursor: dict
+        """
+        with self._lock:
+            search = self._search(connection_key, key, create=True)
+            search.cursors[page] = copy.deepcopy(cursor)
+
+    def mark_last_page(self, connection_key, key, page):
+        """Records the last available page of the search.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by search_key()
+        :type key: str
+
+        :param page: Last page number
+        :type page: int
+        """
+        with self._lock:
+            search = self._search(connection_key, key, create=True)
+            search.last_page = page
+            for number in [n for n in search.cursors if n > page]:
+                del search.cursors[number]
+
+    def last_page(self, connection_key, key):
+        """Returns the last page of the search if it is already known.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by search_key()
+        :type key: str
+
+        :returns: The last page number or None
+        :rtype: int
+        """
+        with self._lock:
+            search = self._search(connection_key, key)
+            return search.last_page if search else None
+
+    def invalidate(self, connection_key=None):
+        """Drops the stored cursors of the passed connection, or of all the
+        connections when no connection is passed.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+        """
+        with self._lock:
+            if connection_key is None:
+                self._searches.clear()
+            else:
+                self._searches.pop(str(connection_key), None)
+
+
+pagination_cursors = PaginationCursorCache()
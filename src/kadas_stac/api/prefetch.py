@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+    Prefetched item search result pages.
+
+    The pages fetched ahead of the user navigation are kept in a small
+    bounded buffer, so that moving to them does not need a new request.
+"""
+
+import collections
+import threading
+import typing
+
+PAGE_BUFFER_SIZE = 4
+
+
+class PageBuffer:
+    """ Bounded buffer of the prepared item search result pages,
+    the least recently used pages are dropped first.
+    """
+
+    def __init__(self, max_pages: int = PAGE_BUFFER_SIZE):
+        self.max_pages = max_pages
+        self._pages = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, connection_key, key, page, items, pagination):
+        """Stores a prepared result page.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by pagination.search_key()
+        :type key: str
+
+        :param page: Page number
+        :type page: int
+
+        :param items: Prepared page items
+        :type items: list
+
+        :param pagination: Page pagination details
+        :type pagination: ResourcePagination
+        """
+        buffer_key = (str(connection_key), key, page)
+        with self._lock:
+            self._pages[buffer_key] = (items, pagination)
+            self._pages.move_to_end(buffer_key)
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+
+    def get(
+            self,
+            connection_key,
+            key,
+            page
+    ) -> typing.Optional[typing.Tuple[list, typing.Any]]:
+        """Returns the stored page items and pagination details.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+
+        :param key: Search key as returned by pagination.search_key()
+        :type key: str
+
+        :param page: Page number
+        :type page: int
+
+        :returns: Tuple of the page items and pagination or None
+        :rtype: tuple
+        """
+        buffer_key = (str(connection_key), key, page)
+        with self._lock:
+            entry = self._pages.get(buffer_key)
+            if entry is not None:
+                self._pages.move_to_end(buffer_key)
+            return entry
+
+    def clear(self, connection_key=None):
+        """Drops the stored pages of the passed connection, or all the
+        stored pages when no connection is passed.
+
+        :param connection_key: Connection identifier
+        :type connection_key: str
+        """
+        with self._lock:
+            if connection_key is None:
+                self._pages.clear()
+                return
+            for buffer_key in list(self._pages.keys()):
+                if buffer_key[0] == str(connection_key):
+                    del self._pages[buffer_key]
+
+
+page_buffer = PageBuffer()
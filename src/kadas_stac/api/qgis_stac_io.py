@@ -5,8 +5,10 @@ QGIS-compatible StacApiIO using QgsNetworkAccessManager instead of requests.
 This solves the SSL module availability issue in KADAS/QGIS Python environments.
 """
 
+import collections
 import json
 import re
+from functools import partial
 from typing import Any, Dict, Iterator, List, Optional, Union
 from urllib.parse import urlparse
 
@@ -21,6 +23,9 @@ from qgis.PyQt.QtNetwork import QNetworkRequest, QNetworkReply
 from ..lib.pystac.stac_io import DefaultStacIO
 from ..lib.pystac.link import Link
 from ..lib.pystac_client.conformance import ConformanceClasses, CONFORMANCE_URIS
+from ..definitions.constants import MAX_REQUESTS_PER_HOST
+from .content_encoding import ACCEPT_ENCODING, decode_content
+from .http_cache import http_cache, request_key
 from ..logger import get_logger
 
 logger = get_logger(level="DEBUG")
@@ -39,6 +44,9 @@ class QgisStacApiIO(DefaultStacIO):
         headers: Optional[Dict] = None,
         conformance: Optional[list] = None,
         parameters: Optional[Dict] = None,
+        cache=http_cache,
+        max_in_flight_per_host: int = MAX_REQUESTS_PER_HOST,
+        prefetch_pages: bool = False,
     ):
         """
         Initialize QGIS-based API IO.
@@ -47,11 +55,20 @@ class QgisStacApiIO(DefaultStacIO):
             headers: Optional dictionary of headers to include in all requests
             conformance: Optional list of Conformance Classes
             parameters: Optional dictionary of query string parameters to include in all requests
+            cache: Optional HttpResponseCache used for the responses, None disables caching
+            max_in_flight_per_host: Maximum number of concurrent asynchronous requests per host
+            prefetch_pages: Whether get_pages requests the next page before
+                yielding the current one, only for use off the GUI thread
         """
         self.headers = headers or {}
         self.parameters = parameters or {}
         self._conformance = conformance
+        self.cache = cache
+        self.max_in_flight_per_host = max(1, max_in_flight_per_host)
+        self.prefetch_pages = prefetch_pages
         self.nam = QgsNetworkAccessManager.instance()
+        self._queues = {}
+        self._in_flight = {}
         
         logger.debug(f"QgisStacApiIO initialized with headers: {list(self.headers.keys())}")
     
@@ -119,6 +136,13 @@ class QgisStacApiIO(DefaultStacIO):
         Follows STAC API pagination by following 'next' links in the response.
         Common endpoints: /collections, /search
         
+        When prefetch_pages is enabled the next page request is started
+        before yielding the current page, so its download overlaps with
+        the processing of the current page. The pending request is
+        cancelled when the consumer stops iterating. Waiting for it runs
+        a local event loop, so prefetching is only enabled for the StacIO
+        instances used in background tasks.
+        
         Args:
             url: The URL to request
             method: HTTP method (GET or POST)
@@ -131,17 +155,68 @@ class QgisStacApiIO(DefaultStacIO):
         
         # Get first page
         page = self.read_json(url, method=method, parameters=parameters)
-        yield page
         
         # Follow 'next' links for pagination
-        next_link = next((link for link in page.get('links', []) if link['rel'] == 'next'), None)
-        while next_link:
-            link = Link.from_dict(next_link)
-            page = self.read_json(link, parameters=parameters)
-            yield page
-            
-            # Get the next link for the next iteration
+        while True:
             next_link = next((link for link in page.get('links', []) if link['rel'] == 'next'), None)
+            if next_link is None:
+                yield page
+                break
+            if not self.prefetch_pages:
+                yield page
+                page = self.read_json(
+                    Link.from_dict(next_link),
+                    parameters=parameters
+                )
+                continue
+            
+            next_page = self.read_json_async(
+                Link.from_dict(next_link),
+                parameters=parameters
+            )
+            resumed = False
+            try:
+                yield page
+                resumed = True
+            finally:
+                # The consumer stopped iterating, drop the pending request
+                if not resumed:
+                    next_page.cancel()
+            page = next_page.result()
+    
+    def _link_request(
+        self,
+        source: Link,
+        parameters: Optional[dict] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns the request arguments described by a STAC link.
+        
+        Args:
+            source: Link object
+            parameters: Additional POST body parameters
+            
+        Returns:
+            Dict: Keyword arguments for request() or request_async()
+        """
+        link = source.to_dict()
+        href = link['href']
+        merge = bool(link.get('merge', False))
+        method = link.get('method', 'GET')
+        headers = link.get('headers', None)
+        link_body = link.get('body', {})
+        
+        if method == 'POST':
+            parameters = {**(parameters or {}), **link_body} if merge else link_body
+        else:
+            parameters = {}
+        
+        return {
+            'href': href,
+            'method': method,
+            'headers': headers,
+            'parameters': parameters,
+        }
     
     def read_text(
         self,
@@ -160,38 +235,136 @@ class QgisStacApiIO(DefaultStacIO):
         Returns:
             str: Response text content
         """
+        return self._read_content(
+            source,
+            parameters=parameters,
+            **kwargs
+        ).decode('utf-8')
+    
+    def read_json(
+        self,
+        source: Union[str, Link],
+        *args: Any,
+        parameters: Optional[dict] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Read a dict from the given URI using QGIS network manager.
+        
+        The JSON is decoded from the response bytes, without the
+        intermediate text copy made by read_text().
+        
+        Args:
+            source: URL string or Link object
+            parameters: Additional query parameters
+            
+        Returns:
+            Dict: JSON content
+        """
+        return self.json_loads(
+            self._read_content(source, parameters=parameters, **kwargs)
+        )
+    
+    def _read_content(
+        self,
+        source: Union[str, Link],
+        parameters: Optional[dict] = None,
+        **kwargs: Any
+    ) -> bytes:
+        """
+        Read the raw content of the given URI.
+        
+        Args:
+            source: URL string or Link object
+            parameters: Additional query parameters
+            
+        Returns:
+            bytes: Response body
+        """
         parameters = parameters or {}
         
         if isinstance(source, str):
             href = source
             if bool(urlparse(href).scheme):
-                return self.request(href, parameters=parameters, **kwargs)
+                return self.request_content(href, parameters=parameters, **kwargs)
             else:
                 # Local file
-                with open(href) as f:
+                with open(href, 'rb') as f:
                     return f.read()
                     
         elif isinstance(source, Link):
-            link = source.to_dict()
-            href = link['href']
-            merge = bool(link.get('merge', False))
-            method = link.get('method', 'GET')
-            headers = link.get('headers', None)
-            link_body = link.get('body', {})
+            return self.request_content(**self._link_request(source, parameters))
+        
+        return b""
+    
+    def read_text_async(
+        self,
+        source: Union[str, Link],
+        parameters: Optional[dict] = None,
+        transform=None,
+        **kwargs: Any
+    ) -> "RequestFuture":
+        """
+        Asynchronous variant of read_text().
+        
+        Args:
+            source: URL string or Link object
+            parameters: Additional query parameters
+            transform: Optional callable applied to the response body bytes
             
-            if method == 'POST':
-                parameters = {**parameters, **link_body} if merge else link_body
-            else:
-                parameters = {}
-                
-            return self.request(
-                href,
-                method=method,
-                headers=headers,
-                parameters=parameters
+        Returns:
+            RequestFuture: Pending response text, or its transform result
+        """
+        parameters = parameters or {}
+        
+        if isinstance(source, Link):
+            return self.request_async(
+                transform=transform,
+                **self._link_request(source, parameters)
+            )
+        
+        if bool(urlparse(source).scheme):
+            return self.request_async(
+                source,
+                parameters=parameters,
+                transform=transform,
+                **kwargs
             )
         
-        return ""
+        # Local file
+        future = RequestFuture(self)
+        try:
+            with open(source, 'rb') as f:
+                content = f.read()
+            future.set_result(
+                transform(content) if transform else content.decode('utf-8')
+            )
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def read_json_async(
+        self,
+        source: Union[str, Link],
+        parameters: Optional[dict] = None,
+        **kwargs: Any
+    ) -> "RequestFuture":
+        """
+        Asynchronous variant of read_json().
+        
+        Args:
+            source: URL string or Link object
+            parameters: Additional query parameters
+            
+        Returns:
+            RequestFuture: Pending JSON content
+        """
+        return self.read_text_async(
+            source,
+            parameters=parameters,
+            transform=self.json_loads,
+            **kwargs
+        )
     
     def request(
         self,
@@ -216,8 +389,200 @@ class QgisStacApiIO(DefaultStacIO):
         Raises:
             Exception: If request fails
         """
+        return self.request_content(
+            href,
+            method=method,
+            headers=headers,
+            parameters=parameters,
+            **kwargs
+        ).decode('utf-8')
+    
+    def request_content(
+        self,
+        href: str,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        parameters: Optional[Dict] = None,
+        **kwargs: Any
+    ) -> bytes:
+        """
+        Make HTTP request using QGIS QgsNetworkAccessManager and
+        return the decompressed response body.
+        
+        Args:
+            href: URL to request
+            method: HTTP method (GET or POST)
+            headers: Optional headers to add to request
+            parameters: Optional parameters (query string for GET, body for POST)
+            
+        Returns:
+            bytes: Response body
+            
+        Raises:
+            Exception: If request fails
+        """
+        prepared = self._prepare_request(href, method, headers, parameters)
+        if prepared.content is not None:
+            return prepared.content
+        
+        # Make request
+        if method == 'GET':
+            reply = self.nam.blockingGet(prepared.request)
+        else:
+            reply = self.nam.blockingPost(prepared.request, prepared.body)
+        
+        return self._handle_reply(reply, prepared)
+    
+    def request_async(
+        self,
+        href: str,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        parameters: Optional[Dict] = None,
+        transform=None,
+        **kwargs: Any
+    ) -> "RequestFuture":
+        """
+        Starts an HTTP request using QGIS QgsNetworkAccessManager without
+        waiting for its reply.
+        
+        At most max_in_flight_per_host requests run at the same time for
+        each host, the other ones are queued. Replies are delivered by the
+        event loop of the calling thread, RequestFuture.result() and wait()
+        run that loop, so futures must be waited in the thread that
+        created them.
+        
+        Args:
+            href: URL to request
+            method: HTTP method (GET or POST)
+            headers: Optional headers to add to request
+            parameters: Optional parameters (query string for GET, body for POST)
+            transform: Optional callable applied to the response body bytes
+            
+        Returns:
+            RequestFuture: Pending response text, or its transform result
+        """
+        future = RequestFuture(self)
+        try:
+            prepared = self._prepare_request(href, method, headers, parameters)
+        except Exception as e:
+            future.set_exception(e)
+            return future
+        prepared.transform = transform
+        prepared.future = future
+        future._prepared = prepared
+        
+        if prepared.content is not None:
+            self._complete(prepared, prepared.content)
+            return future
+        
+        host = prepared.request.url().host()
+        self._queues.setdefault(host, collections.deque()).append(prepared)
+        self._schedule(host)
+        return future
+    
+    def wait(self, futures, first_completed: bool = False):
+        """
+        Runs the current thread event loop until the passed futures
+        are completed.
+        
+        Args:
+            futures: RequestFuture instances to wait for
+            first_completed: Whether to return as soon as any future completes
+        """
+        futures = list(futures)
+        
+        def completed():
+            done = [future.done() for future in futures]
+            return any(done) if first_completed else all(done)
+        
+        if not futures or completed():
+            return
+        
+        loop = QEventLoop()
+        
+        def quit_loop(_future):
+            if completed():
+                loop.quit()
+        
+        for future in futures:
+            future.add_done_callback(quit_loop)
+        loop.exec_()
+    
+    def _schedule(self, host: str):
+        """Starts the queued requests of the host, up to the in flight limit."""
+        queue = self._queues.get(host)
+        while queue and self._in_flight.get(host, 0) < self.max_in_flight_per_host:
+            prepared = queue.popleft()
+            nam = QgsNetworkAccessManager.instance()
+            if prepared.method == 'GET':
+                reply = nam.get(prepared.request)
+            else:
+                reply = nam.post(prepared.request, prepared.body)
+            prepared.reply = reply
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            reply.finished.connect(
+                partial(self._reply_finished, host, prepared)
+            )
+    
+    def _reply_finished(self, host: str, prepared: "_PreparedRequest"):
+        """Completes the future of a finished asynchronous request."""
+        self._in_flight[host] = max(self._in_flight.get(host, 1) - 1, 0)
+        reply = prepared.reply
+        prepared.reply = None
+        try:
+            content = QgsNetworkReplyContent(reply)
+            content.setContent(reply.readAll())
+            self._complete(prepared, self._handle_reply(content, prepared))
+        except Exception as e:
+            prepared.future.set_exception(e)
+        finally:
+            reply.deleteLater()
+            self._schedule(host)
+    
+    def _complete(self, prepared: "_PreparedRequest", content: bytes):
+        """Sets the future result from the response body."""
+        try:
+            result = prepared.transform(content) \
+                if prepared.transform else content.decode('utf-8')
+        except Exception as e:
+            prepared.future.set_exception(e)
+            return
+        prepared.future.set_result(result)
+    
+    def _cancel(self, prepared: "_PreparedRequest") -> bool:
+        """Removes a queued request or aborts a running one."""
+        host = prepared.request.url().host()
+        queue = self._queues.get(host)
+        if queue and prepared in queue:
+            queue.remove(prepared)
+            prepared.future.set_exception(RequestCancelledError(prepared.href))
+            return True
+        if prepared.reply is not None:
+            prepared.reply.abort()
+            return True
+        return False
+    
+    def _prepare_request(
+        self,
+        href: str,
+        method: str = 'GET',
+        headers: Optional[Dict] = None,
+        parameters: Optional[Dict] = None,
+    ) -> "_PreparedRequest":
+        """
+        Builds the network request, the cached response body is set on the
+        returned request when the cache holds a fresh response.
+        
+        Raises:
+            Exception: If the URL is invalid
+            ValueError: If the HTTP method is not supported
+        """
         logger.debug(f"{method} {href}")
         
+        if method not in ('GET', 'POST'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
         # Normalize URL - ensure it has a proper scheme
         if not href.startswith(('http://', 'https://')):
             href = 'https://' + href
@@ -247,6 +612,14 @@ class QgisStacApiIO(DefaultStacIO):
         request.setAttribute(QNetworkRequest.FollowRedirectsAttribute, True)
         request.setMaximumRedirectsAllowed(5)
         
+        # Use HTTP/2 when the server supports it
+        if hasattr(QNetworkRequest, 'Http2AllowedAttribute'):
+            request.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        
+        # Ask for compressed responses, Qt does not decompress them
+        # when the header is set explicitly, see _handle_reply()
+        request.setRawHeader(b"Accept-Encoding", ACCEPT_ENCODING.encode())
+        
         # Add Referer header (KADAS compatibility - used by all catalog providers)
         settings = QgsSettings()
         referer = settings.value("search/referer", "http://localhost")
@@ -261,15 +634,46 @@ class QgisStacApiIO(DefaultStacIO):
         logger.debug(f"Request headers: {list(all_headers.keys())}")
         logger.debug(f"Referer: {referer}")
         
-        # Make request
-        if method == 'GET':
-            reply = self.nam.blockingGet(request)
-        elif method == 'POST':
-            body = json.dumps(parameters or {}).encode() if parameters else b''
+        prepared = _PreparedRequest(href, method, request)
+        if method == 'POST':
+            prepared.body = json.dumps(parameters or {}).encode() if parameters else b''
             request.setHeader(QNetworkRequest.ContentTypeHeader, "application/json")
-            reply = self.nam.blockingPost(request, body)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
+        
+        # Serve fresh responses from the cache, revalidate the stale ones
+        if self.cache is not None:
+            prepared.cache_key = request_key(
+                method,
+                url.toString(),
+                parameters if method == 'POST' else None,
+                all_headers
+            )
+            cached = self.cache.get(prepared.cache_key)
+            if cached is not None and cached.is_fresh():
+                self.cache.record("hits")
+                logger.debug(f"Response served from cache: {url.toString()}")
+                prepared.content = cached.body
+            elif cached is not None:
+                prepared.cached = cached
+                for key, value in cached.validators().items():
+                    request.setRawHeader(key.encode(), value.encode())
+        
+        return prepared
+    
+    def _handle_reply(
+        self,
+        reply: QgsNetworkReplyContent,
+        prepared: "_PreparedRequest"
+    ) -> bytes:
+        """
+        Checks the reply for errors and returns its decompressed body,
+        updating the responses cache.
+        
+        Raises:
+            Exception: If request failed
+        """
+        request = prepared.request
+        href = prepared.href
+        cached = prepared.cached
         
         # Check for errors
         error = reply.error()
@@ -288,14 +692,160 @@ class QgisStacApiIO(DefaultStacIO):
             else:
                 raise Exception(f"HTTP {status_code}: {error_msg}")
         
-        # Get response content
-        # QgsNetworkReplyContent.content() returns QByteArray that needs bytes() conversion
-        content = reply.content()
-        text = bytes(content).decode('utf-8')
-        
         status_code = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
         # QgsNetworkReplyContent doesn't have url() method - use original request URL
         final_url = request.url().toString()
-        logger.debug(f"Response: status={status_code}, final_url={final_url}, length={len(text)}")
+        response_headers = self._response_headers(reply)
+        
+        if cached is not None and status_code == 304:
+            self.cache.record("not_modified")
+            self.cache.revalidated(
+                prepared.cache_key,
+                cached,
+                response_headers
+            )
+            logger.debug(f"Response not modified, served from cache: {final_url}")
+            return cached.body
+        
+        # Get response content
+        # QgsNetworkReplyContent.content() returns QByteArray that needs bytes() conversion
+        raw_content = bytes(reply.content())
+        content = decode_content(
+            raw_content,
+            response_headers.get('content-encoding')
+        )
+        
+        if prepared.cache_key is not None:
+            self.cache.record("misses")
+            self.cache.store(
+                prepared.cache_key,
+                content,
+                response_headers
+            )
+        
+        logger.debug(
+            f"Response: status={status_code}, final_url={final_url}, "
+            f"length={len(content)}, transferred={len(raw_content)}"
+        )
+        
+        return content
+    
+    @staticmethod
+    def _response_headers(reply: QgsNetworkReplyContent) -> Dict[str, str]:
+        """
+        Returns the reply raw headers with lower case names.
         
-        return text
+        Args:
+            reply: The network reply content
+            
+        Returns:
+            Dict: Response headers
+        """
+        return {
+            bytes(name).decode('latin-1').lower():
+                bytes(reply.rawHeader(name)).decode('latin-1')
+            for name in reply.rawHeaderList()
+        }
+
+
+class _PreparedRequest:
+    """
+    Network request built by QgisStacApiIO with its cache state.
+    """
+    
+    def __init__(self, href: str, method: str, request: QNetworkRequest):
+        self.href = href
+        self.method = method
+        self.request = request
+        self.body = b''
+        self.cache_key = None
+        self.cached = None
+        self.content = None
+        self.transform = None
+        self.future = None
+        self.reply = None
+
+
+class RequestCancelledError(Exception):
+    """Raised by the result of a cancelled asynchronous request."""
+
+
+class RequestFuture:
+    """
+    Pending result of an asynchronous QgisStacApiIO request.
+    
+    Mirrors the concurrent.futures.Future API, result() runs the event
+    loop of the calling thread until the reply is received.
+    """
+    
+    def __init__(self, stac_io: QgisStacApiIO):
+        self._stac_io = stac_io
+        self._prepared = None
+        self._done = False
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+    
+    def done(self) -> bool:
+        """Whether the request has completed."""
+        return self._done
+    
+    def result(self) -> Any:
+        """
+        Waits for the request to complete and returns its result.
+        
+        Raises:
+            Exception: The request error
+        """
+        if not self._done:
+            self._stac_io.wait([self])
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+    
+    def exception(self) -> Optional[Exception]:
+        """Waits for the request to complete and returns its error, if any."""
+        if not self._done:
+            self._stac_io.wait([self])
+        return self._exception
+    
+    def cancel(self) -> bool:
+        """
+        Cancels the request if it has not completed yet.
+        
+        Returns:
+            bool: Whether the request was cancelled
+        """
+        if self._done or self._prepared is None:
+            return False
+        return self._stac_io._cancel(self._prepared)
+    
+    def add_done_callback(self, callback):
+        """
+        Calls the callback with this future once the request completes.
+        
+        Args:
+            callback: Callable receiving the future
+        """
+        if self._done:
+            callback(self)
+        else:
+            self._callbacks.append(callback)
+    
+    def set_result(self, result: Any):
+        """Completes the future with the passed result."""
+        self._result = result
+        self._finish()
+    
+    def set_exception(self, exception: Exception):
+        """Completes the future with the passed error."""
+        self._exception = exception
+        self._finish()
+    
+    def _finish(self):
+        if self._done:
+            return
+        self._done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
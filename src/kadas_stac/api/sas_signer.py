@@ -0,0 +1,491 @@
+# -*- coding: utf-8 -*-
+"""
+    Signing of the Azure Blob Storage asset hrefs with SAS tokens.
+
+    Hrefs are signed when they are accessed, with one token per storage
+    account and container kept until its "msft:expiry", instead of
+    signing and storing again all the saved items whenever tokens expire.
+    The tokens are stored in the user profile so they outlive the
+    session, and are requested through the QGIS network stack.
+"""
+
+import datetime
+import json
+import os
+import threading
+import time
+import typing
+
+from concurrent.futures import Future
+from urllib.parse import (
+    parse_qs,
+    parse_qsl,
+    urlencode,
+    urlparse,
+    urlsplit,
+    urlunsplit,
+)
+
+from ..definitions.constants import SAS_TOKEN_RENEWAL_MARGIN
+
+BLOB_STORAGE_DOMAIN = ".blob.core.windows.net"
+
+# Asset fields holding the fsspec storage options of the tabular assets
+STORAGE_OPTIONS_FIELDS = ("table:storage_options", "xarray:storage_options")
+
+# Query parameters of the Azure shared access signatures
+SAS_QUERY_PARAMETERS = {
+    "se", "sig", "skoid", "sktid", "skt", "ske", "sks", "skv", "sp",
+    "spr", "sr", "srt", "ss", "st", "sv", "sip", "sdd",
+}
+
+
+def unsigned_url(url: str) -> str:
+    """Returns the URL without its SAS token query parameters.
+
+    :param url: Resource URL, signed or not
+    :type url: str
+
+    :returns: URL with the other query parameters in the same order
+    :rtype: str
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if not any(name == "sig" for name, _ in query):
+        return url
+    query = [
+        (name, value) for name, value in query
+        if name not in SAS_QUERY_PARAMETERS
+    ]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def unsigned_feature(feature: dict) -> dict:
+    """Returns the item feature without the SAS tokens of its asset
+    hrefs and storage options, the passed feature is not changed.
+
+    :param feature: STAC item feature, signed or not
+    :type feature: dict
+
+    :returns: Feature with copies of the unsigned assets
+    :rtype: dict
+    """
+    assets = feature.get("assets")
+    if not isinstance(assets, dict):
+        return feature
+    unsigned_assets = {}
+    for name, asset in assets.items():
+        if isinstance(asset, dict):
+            asset = dict(asset)
+            if isinstance(asset.get("href"), str):
+                asset["href"] = unsigned_url(asset["href"])
+            for field in STORAGE_OPTIONS_FIELDS:
+                options = asset.get(field)
+                if isinstance(options, dict) and \
+                        "sig=" in str(options.get("credential", "")):
+                    asset[field] = {
+                        key: value for key, value in options.items()
+                        if key != "credential"
+                    }
+        unsigned_assets[name] = asset
+    return dict(feature, assets=unsigned_assets)
+
+
+def expiry_timestamp(value: str) -> float:
+    """Converts a token "msft:expiry" date time to seconds since the epoch.
+
+    :param value: RFC 3339 date time
+    :type value: str
+
+    :returns: Timestamp
+    :rtype: float
+    """
+    text = value.strip()
+    if text[-1:] in ("Z", "z"):
+        text = f"{text[:-1]}+00:00"
+    parsed = datetime.datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.timestamp()
+
+
+def request_token(
+        account: str,
+        container: str,
+        subscription_key: typing.Optional[str] = None
+) -> typing.Tuple[str, float]:
+    """Requests a SAS token of a storage container from the Planetary
+    Computer token endpoint, through QgsNetworkAccessManager so the
+    QGIS proxy and SSL settings apply. Token responses are not cached.
+
+    :param account: Storage account name
+    :type account: str
+
+    :param container: Storage container name
+    :type container: str
+
+    :param subscription_key: Planetary Computer subscription key
+    :type subscription_key: str
+
+    :returns: The token and its expiry timestamp
+    :rtype: tuple
+    """
+    from planetary_computer.settings import Settings as SdkSettings
+    from .qgis_stac_io import QgisStacApiIO
+
+    settings = SdkSettings.get()
+    key = subscription_key or settings.subscription_key
+    stac_io = QgisStacApiIO(
+        headers={"Ocp-Apim-Subscription-Key": key} if key else None,
+        cache=None
+    )
+    content = stac_io.read_json(f"{settings.sas_url}/{account}/{container}")
+    return content["token"], expiry_timestamp(content["msft:expiry"])
+
+
+def blob_container(href: str) -> typing.Optional[typing.Tuple[str, str]]:
+    """Returns the storage account and container of a blob href.
+
+    :param href: Asset href
+    :type href: str
+
+    :returns: Account and container names, None when the href is
+    not a blob storage URL
+    :rtype: tuple
+    """
+    parsed = urlparse(href.rstrip("/"))
+    if not parsed.netloc.endswith(BLOB_STORAGE_DOMAIN):
+        return None
+    path = parsed.path.lstrip("/").split("/", 1)
+    if len(path) < 2 or not path[0]:
+        return None
+    return parsed.netloc.split(".")[0], path[0]
+
+
+class SasSigner:
+    """ Signs the blob storage hrefs with cached container tokens.
+
+    Tokens are requested on first use of a container and renewed when
+    less than the renewal margin is left before their expiry, concurrent
+    requests of the same container token share one token request. The
+    token listener is called with the expiry of each new token.
+    """
+
+    def __init__(
+            self,
+            token_provider: typing.Optional[typing.Callable] = None,
+            renewal_margin: float = SAS_TOKEN_RENEWAL_MARGIN,
+            path: typing.Optional[str] = None
+    ):
+        """
+        :param token_provider: Called with the account, container and
+        subscription key, returns the token and its expiry timestamp
+        :type token_provider: Callable
+
+        :param renewal_margin: Seconds before the expiry at which
+        tokens are renewed
+        :type renewal_margin: float
+
+        :param path: File storing the tokens, None keeps them in memory
+        :type path: str
+        """
+        self.token_provider = token_provider or request_token
+        self.renewal_margin = renewal_margin
+        self.path = path
+        self.token_listener = None
+        # (account, container) mapped to [token, expiry, used since renewal]
+        self._tokens = {}
+        self._loaded = False
+        self._pending = {}
+        self._lock = threading.RLock()
+
+    def configure(self, path: str):
+        """Sets the file storing the tokens, the stored tokens are
+        read on first use.
+
+        :param path: Tokens file path
+        :type path: str
+        """
+        with self._lock:
+            if path != self.path:
+                self.path = path
+                self._tokens.clear()
+                self._loaded = False
+
+    def sign(
+            self,
+            href: str,
+            subscription_key: typing.Optional[str] = None
+    ) -> str:
+        """Signs the passed href when it is a blob storage URL, a
+        previous SAS query of the href is replaced.
+
+        :param href: Asset href
+        :type href: str
+
+        :param subscription_key: Planetary Computer subscription key
+        :type subscription_key: str
+
+        :returns: The signed href or the same href
+        :rtype: str
+        """
+        container = blob_container(href)
+        if container is None:
+            return href
+        token = self.token(*container, subscription_key=subscription_key)
+        return self._signed_href(href, token)
+
+    def sign_features(
+            self,
+            features: typing.List[dict],
+            subscription_key: typing.Optional[str] = None
+    ) -> int:
+        """Signs the asset hrefs of the passed item features in place.
+
+        The assets are grouped by storage container so each container
+        token is looked up once for the page, hrefs already signed with
+        a valid token are kept.
+
+        :param features: STAC item features
+        :type features: list
+
+        :param subscription_key: Planetary Computer subscription key
+        :type subscription_key: str
+
+        :returns: Number of signed assets
+        :rtype: int
+        """
+        containers = {}
+        for feature in features:
+            for asset in (feature.get("assets") or {}).values():
+                href = asset.get("href")
+                if not isinstance(href, str):
+                    continue
+                container = blob_container(href)
+                if container is None:
+                    container = self._storage_container(asset)
+                if container is not None and not self.signed(href):
+                    containers.setdefault(container, []).append(asset)
+
+        signed = 0
+        for container, assets in containers.items():
+            token = self.token(*container, subscription_key=subscription_key)
+            for asset in assets:
+                if blob_container(asset["href"]) is not None:
+                    asset["href"] = self._signed_href(asset["href"], token)
+                for field in STORAGE_OPTIONS_FIELDS:
+                    if field in asset:
+                        asset[field]["credential"] = token
+                signed += 1
+        return signed
+
+    def signed(self, href: str) -> bool:
+        """Whether the href carries a SAS signature valid for longer
+        than the renewal margin.
+
+        :param href: Asset href
+        :type href: str
+
+        :returns: Whether the href is signed
+        :rtype: bool
+        """
+        _, _, query = href.partition("?")
+        if "sig=" not in query:
+            return False
+        expiry = parse_qs(query).get("se")
+        try:
+            return expiry_timestamp(expiry[0]) - time.time() > \
+                self.renewal_margin
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _signed_href(href: str, token: str) -> str:
+        """Returns the href with the passed token query, replacing a
+        previous SAS query.
+        """
+        base, _, query = href.partition("?")
+        if query and "sig=" not in query:
+            base = href
+        separator = "&" if "?" in base else "?"
+        return f"{base}{separator}{token}"
+
+    @staticmethod
+    def _storage_container(asset) -> typing.Optional[typing.Tuple[str, str]]:
+        """Returns the storage account and container of an fsspec
+        asset, None for other assets.
+        """
+        for field in STORAGE_OPTIONS_FIELDS:
+            options = asset.get(field)
+            if isinstance(options, dict) and options.get("account_name"):
+                parsed = urlparse(asset["href"])
+                if parsed.scheme in ("abfs", "az") and parsed.netloc:
+                    return options["account_name"], parsed.netloc
+        return None
+
+    def token(
+            self,
+            account: str,
+            container: str,
+            subscription_key: typing.Optional[str] = None
+    ) -> str:
+        """Returns a valid token of the storage container.
+
+        :param account: Storage account name
+        :type account: str
+
+        :param container: Storage container name
+        :type container: str
+
+        :param subscription_key: Planetary Computer subscription key
+        :type subscription_key: str
+
+        :returns: SAS token query
+        :rtype: str
+        """
+        key = (account, container)
+        with self._lock:
+            self._load()
+            entry = self._tokens.get(key)
+            if entry is not None and \
+                    entry[1] - time.time() > self.renewal_margin:
+                entry[2] = True
+                return entry[0]
+        return self._renew(key, subscription_key, used=True)
+
+    def _renew(self, key, subscription_key, used) -> str:
+        """Requests a new token of the container, or waits for the
+        token request of the container that is already running.
+        """
+        with self._lock:
+            future = self._pending.get(key)
+            requesting = future is None
+            if requesting:
+                future = Future()
+                self._pending[key] = future
+        if not requesting:
+            return future.result()
+
+        try:
+            token, expiry = self.token_provider(*key, subscription_key)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        with self._lock:
+            self._tokens[key] = [token, expiry, used]
+            self._save()
+        future.set_result(token)
+        if self.token_listener is not None:
+            self.token_listener(expiry)
+        return token
+
+    def _load(self):
+        """ Reads the stored tokens that have not expired."""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as tokens_file:
+                content = json.load(tokens_file)
+            now = time.time()
+            for entry in content:
+                if entry["expiry"] > now:
+                    self._tokens.setdefault(
+                        (entry["account"], entry["container"]),
+                        [entry["token"], entry["expiry"], False]
+                    )
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def _save(self):
+        """ Writes the cached tokens to the tokens file."""
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            temporary_path = f"{self.path}.tmp"
+            with open(temporary_path, "w") as tokens_file:
+                json.dump(
+                    [
+                        {
+                            "account": account,
+                            "container": container,
+                            "token": token,
+                            "expiry": expiry,
+                        }
+                        for (account, container), (token, expiry, _) in
+                        self._tokens.items()
+                    ],
+                    tokens_file
+                )
+            os.replace(temporary_path, self.path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def next_expiry(self) -> typing.Optional[float]:
+        """Returns the nearest expiry of the cached tokens.
+
+        :returns: Timestamp or None when no token is cached
+        :rtype: float
+        """
+        with self._lock:
+            self._load()
+            expiries = [entry[1] for entry in self._tokens.values()]
+        return min(expiries) if expiries else None
+
+    def refresh(
+            self,
+            within: float,
+            subscription_key: typing.Optional[str] = None
+    ) -> int:
+        """Renews the tokens expiring in the passed number of seconds
+        that have been used since they were issued, the unused ones
+        and the ones failing to renew are dropped and requested again
+        on their next use.
+
+        :param within: Seconds before the expiry
+        :type within: float
+
+        :param subscription_key: Planetary Computer subscription key
+        :type subscription_key: str
+
+        :returns: Number of renewed tokens
+        :rtype: int
+        """
+        deadline = time.time() + within
+        renewals = []
+        with self._lock:
+            self._load()
+            for key, (_, expiry, used) in list(self._tokens.items()):
+                if expiry > deadline:
+                    continue
+                if used:
+                    renewals.append(key)
+                else:
+                    del self._tokens[key]
+            self._save()
+        renewed = 0
+        for key in renewals:
+            try:
+                self._renew(key, subscription_key, used=False)
+                renewed += 1
+            except Exception:
+                # Requested again, reporting the error, on the next use
+                with self._lock:
+                    self._tokens.pop(key, None)
+                    self._save()
+        return renewed
+
+    def clear(self):
+        """ Drops all the cached and stored tokens."""
+        with self._lock:
+            self._tokens.clear()
+            self._save()
+
+
+sas_signer = SasSigner()
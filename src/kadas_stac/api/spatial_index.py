@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+    Spatial index of the search result items fetched in the session.
+
+    Item bounding boxes are inserted in a QgsSpatialIndex R-tree as the
+    result pages arrive, extent and point queries first select the
+    candidates from the tree and only test the exact footprint of those,
+    the footprint geometries are built on first use.
+"""
+
+import json
+import typing
+
+from osgeo import ogr
+
+from qgis.core import (
+    QgsGeometry,
+    QgsPointXY,
+    QgsRectangle,
+    QgsSpatialIndex,
+)
+
+
+def item_bbox(item) -> typing.Optional[typing.List[float]]:
+    """Returns the item two dimensional bounding box, computed from
+    its geometry when the item has no bbox.
+
+    :param item: Search result item
+    :type item: models.ItemView
+
+    :returns: The [min x, min y, max x, max y] bounding box or None
+    :rtype: list
+    """
+    bbox = item.bbox
+    if bbox and len(bbox) in (4, 6):
+        if len(bbox) == 6:
+            return [bbox[0], bbox[1], bbox[3], bbox[4]]
+        return list(bbox)
+
+    geometry = item.geometry
+    if not geometry:
+        return None
+    xs = []
+    ys = []
+
+    def visit(coordinates):
+        if coordinates and isinstance(coordinates[0], (int, float)):
+            xs.append(coordinates[0])
+            ys.append(coordinates[1])
+        else:
+            for child in coordinates or []:
+                visit(child)
+
+    if geometry.get("type") == "GeometryCollection":
+        for child in geometry.get("geometries") or []:
+            visit(child.get("coordinates"))
+    else:
+        visit(geometry.get("coordinates"))
+    if not xs:
+        return None
+    return [min(xs), min(ys), max(xs), max(ys)]
+
+
+class ItemSpatialIndex:
+    """ R-tree of the search result items footprints, in EPSG:4326.
+
+    Items are identified by their collection and id, adding an item
+    that is already indexed replaces the stored item instance.
+    """
+
+    def __init__(self):
+        self._index = QgsSpatialIndex()
+        self._items = {}
+        self._keys = {}
+        self._geometries = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def add_items(self, items: typing.List):
+        """Adds the passed items to the index.
+
+        :param items: Search result items
+        :type items: List[models.ItemView]
+        """
+        for item in items:
+            key = (item.collection, item.id)
+            feature_id = self._keys.get(key)
+            if feature_id is not None:
+                self._items[feature_id] = item
+                continue
+            bbox = item_bbox(item)
+            if bbox is None:
+                continue
+            feature_id = self._next_id
+            self._next_id += 1
+            self._keys[key] = feature_id
+            self._items[feature_id] = item
+            for rectangle in self._rectangles(bbox):
+                self._index.addFeature(feature_id, rectangle)
+
+    def clear(self):
+        """ Removes all the indexed items."""
+        self._index = QgsSpatialIndex()
+        self._items.clear()
+        self._keys.clear()
+        self._geometries.clear()
+
+    def items_in_extent(
+            self,
+            extent: QgsRectangle,
+            exact: bool = True
+    ) -> typing.List:
+        """Returns the items whose footprint intersects the passed extent.
+
+        :param extent: Extent in EPSG:4326
+        :type extent: QgsRectangle
+
+        :param exact: Whether to test the item footprints, otherwise
+        only the bounding boxes are tested
+        :type exact: bool
+
+        :returns: Indexed items
+        :rtype: List[models.ItemView]
+        """
+        candidates = set(self._index.intersects(extent))
+        if not exact:
+            return [self._items[feature_id] for feature_id in candidates]
+        extent_geometry = QgsGeometry.fromRect(extent)
+        return [
+            self._items[feature_id]
+            for feature_id in candidates
+            if self._intersects(feature_id, extent_geometry)
+        ]
+
+    def items_at(
+            self,
+            point: QgsPointXY,
+            tolerance: float = 0.0
+    ) -> typing.List:
+        """Returns the items whose footprint contains the passed point.
+
+        :param point: Point in EPSG:4326
+        :type point: QgsPointXY
+
+        :param tolerance: Search distance in degrees
+        :type tolerance: float
+
+        :returns: Indexed items
+        :rtype: List[models.ItemView]
+        """
+        search_rectangle = QgsRectangle(
+            point.x() - tolerance,
+            point.y() - tolerance,
+            point.x() + tolerance,
+            point.y() + tolerance
+        )
+        search_geometry = QgsGeometry.fromPointXY(point) \
+            if tolerance <= 0 \
+            else QgsGeometry.fromRect(search_rectangle)
+        return [
+            self._items[feature_id]
+            for feature_id in set(self._index.intersects(search_rectangle))
+            if self._intersects(feature_id, search_geometry)
+        ]
+
+    def _intersects(self, feature_id, geometry: QgsGeometry) -> bool:
+        footprint = self._footprint(feature_id)
+        return footprint is None or footprint.intersects(geometry)
+
+    def _footprint(self, feature_id) -> typing.Optional[QgsGeometry]:
+        """Returns the item footprint geometry, None when the item
+        has no geometry and the bounding box is used instead.
+        """
+        if feature_id not in self._geometries:
+            geometry = self._items[feature_id].geometry
+            footprint = None
+            if geometry:
+                ogr_geometry = ogr.CreateGeometryFromJson(json.dumps(geometry))
+                if ogr_geometry is not None:
+                    footprint = QgsGeometry.fromWkt(ogr_geometry.ExportToWkt())
+            self._geometries[feature_id] = footprint
+        return self._geometries[feature_id]
+
+    @staticmethod
+    def _rectangles(bbox) -> typing.List[QgsRectangle]:
+        """Returns the rectangles covering the bbox, bboxes crossing
+        the antimeridian are split in two rectangles.
+        """
+        min_x, min_y, max_x, max_y = bbox
+        if min_x > max_x:
+            return [
+                QgsRectangle(min_x, min_y, 180.0, max_y),
+                QgsRectangle(-180.0, min_y, max_x, max_y),
+            ]
+        return [QgsRectangle(min_x, min_y, max_x, max_y)]
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+    Cache of the search result items thumbnails.
+
+    Thumbnails are kept already scaled to the results list size, in a
+    memory LRU of the decoded images and in an on-disk store of the
+    downscaled encoded images. Entries are keyed by the thumbnail URL
+    without its SAS token query, so renewed tokens reuse the entries.
+"""
+
+import collections
+import hashlib
+import os
+import threading
+import typing
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .sas_signer import unsigned_url
+
+MEMORY_SIZE_DEFAULT = 32 * 1024 * 1024
+DISK_SIZE_DEFAULT = 20 * 1024 * 1024
+
+def thumbnail_key(url: str) -> str:
+    """Builds the cache key of a thumbnail URL, the SAS token query
+    parameters are dropped and the other ones sorted.
+
+    :param url: Thumbnail URL
+    :type url: str
+
+    :returns: Hex digest identifying the thumbnail
+    :rtype: str
+    """
+    parts = urlsplit(unsigned_url(url))
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    normalized = urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path,
+            urlencode(sorted(query)),
+            ""
+        )
+    )
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+class ThumbnailCache:
+    """ Memory and disk cache of the scaled thumbnails."""
+
+    def __init__(
+            self,
+            directory: typing.Optional[str] = None,
+            max_memory_size: int = MEMORY_SIZE_DEFAULT,
+            max_disk_size: int = DISK_SIZE_DEFAULT,
+    ):
+        self.directory = directory
+        self.max_memory_size = max_memory_size
+        self.max_disk_size = max_disk_size
+        self._memory = collections.OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.RLock()
+        self._stats = collections.Counter()
+
+    def configure(
+            self,
+            directory: typing.Optional[str] = None,
+            max_disk_size: typing.Optional[int] = None,
+    ):
+        """Updates the cache configuration.
+
+        :param directory: Folder of the on-disk store
+        :type directory: str
+
+        :param max_disk_size: On-disk store size limit in bytes,
+        0 disables the on-disk store
+        :type max_disk_size: int
+        """
+        with self._lock:
+            if directory is not None:
+                self.directory = directory
+            if max_disk_size is not None:
+                self.max_disk_size = max_disk_size
+                self._trim_disk()
+
+    def image(self, url: str):
+        """Returns the decoded thumbnail of the URL kept in memory.
+
+        :param url: Thumbnail URL
+        :type url: str
+
+        :returns: Decoded thumbnail, e.g. a QPixmap, or None
+        :rtype: object
+        """
+        key = thumbnail_key(url)
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            self._memory.move_to_end(key)
+            self._stats["memory_hits"] += 1
+            return entry[0]
+
+    def store_image(self, url: str, image, cost: int):
+        """Keeps the decoded thumbnail of the URL in memory, the least
+        recently used thumbnails are dropped over the memory limit.
+
+        :param url: Thumbnail URL
+        :type url: str
+
+        :param image: Decoded thumbnail, e.g. a QPixmap
+        :type image: object
+
+        :param cost: Memory used by the thumbnail in bytes
+        :type cost: int
+        """
+        key = thumbnail_key(url)
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_size -= previous[1]
+            if cost > self.max_memory_size:
+                return
+            self._memory[key] = (image, cost)
+            self._memory_size += cost
+            while self._memory_size > self.max_memory_size:
+                _, (_, dropped_cost) = self._memory.popitem(last=False)
+                self._memory_size -= dropped_cost
+
+    def data(self, url: str) -> typing.Optional[bytes]:
+        """Returns the stored encoded thumbnail of the URL.
+
+        :param url: Thumbnail URL
+        :type url: str
+
+        :returns: Encoded downscaled image or None
+        :rtype: bytes
+        """
+        path = self._disk_path(thumbnail_key(url))
+        content = None
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as image_file:
+                    content = image_file.read()
+                # Read entries are kept the longest when trimming
+                os.utime(path)
+            except OSError:
+                content = None
+        self.record("disk_hits" if content else "misses")
+        return content
+
+    def store_data(self, url: str, content: bytes):
+        """Stores the encoded thumbnail of the URL on disk.
+
+        :param url: Thumbnail URL
+        :type url: str
+
+        :param content: Encoded downscaled image
+        :type content: bytes
+        """
+        path = self._disk_path(thumbnail_key(url))
+        if not path or self.max_disk_size <= 0 or \
+                len(content) > self.max_disk_size:
+            return
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temporary_path = f"{path}.tmp"
+                with open(temporary_path, "wb") as image_file:
+                    image_file.write(content)
+                os.replace(temporary_path, path)
+            except OSError:
+                return
+            self._stats["stores"] += 1
+            self._trim_disk()
+
+    def clear(self):
+        """ Removes all the cached thumbnails."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+            if self.directory and os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    os.remove(os.path.join(self.directory, name))
+
+    def record(self, name: str):
+        """Increments the named statistics counter.
+
+        :param name: Counter name, e.g. "memory_hits" or "misses"
+        :type name: str
+        """
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> dict:
+        """Returns the cache statistics counters.
+
+        :returns: Counters of the memory and disk hits, misses and
+        stored thumbnails, with the hit rate of the lookups
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_size"] = self._memory_size
+        hits = stats.get("memory_hits", 0) + stats.get("disk_hits", 0)
+        lookups = hits + stats.get("misses", 0)
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def _disk_path(self, key: str) -> typing.Optional[str]:
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, f"{key}.img")
+
+    def _trim_disk(self):
+        """ Removes the least recently used thumbnails until the
+        on-disk store fits in its size limit."""
+        if not self.directory or not os.path.isdir(self.directory):
+            return
+        entries = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".img"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, name, stat.st_size))
+            total_size += stat.st_size
+        for _, name, size in sorted(entries):
+            if total_size <= self.max_disk_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            total_size -= size
+
+
+thumbnail_cache = ThumbnailCache()
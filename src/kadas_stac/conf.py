@@ -7,6 +7,9 @@ import contextlib
 import dataclasses
 import datetime
 import enum
+import json
+import os
+import threading
 import typing
 import uuid
 
@@ -14,15 +17,14 @@ from qgis.PyQt import (
     QtCore,
     QtWidgets,
 )
-from qgis.core import QgsRectangle, QgsSettings
+from qgis.core import QgsApplication, QgsRectangle, QgsSettings
 
 from .api.models import (
     ApiCapability,
     Collection,
     Conformance,
     FilterLang,
-    Item,
-    ResourceAsset,
+    ItemView,
     ResourceExtent,
     ResourceLink,
     ResourceProvider,
@@ -32,6 +34,7 @@ from .api.models import (
     SpatialExtent,
     TemporalExtent,
 )
+from .item_store import item_store
 
 
 @contextlib.contextmanager
@@ -56,23 +59,88 @@ def qgis_settings(group_root: str, settings=None):
         settings.endGroup()
 
 
+class ConnectionResource:
+    """ Connection settings sub-resource loaded from the plugin
+    settings on first access.
+
+    Used as the default value of the ConnectionSettings collections,
+    conformances and search items fields, so that listing connections
+    only reads their own settings values. A value passed to the
+    constructor or assigned later is used as is.
+    """
+
+    def __init__(self, loader: str):
+        """
+        :param loader: Name of the SettingsManager method loading
+        the resource for a connection identifier
+        :type loader: str
+        """
+        self.loader = loader
+        self.attribute = None
+
+    def __set_name__(self, owner, name):
+        self.attribute = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # Dataclass default value, the resource is loaded lazily
+            return None
+        value = instance.__dict__.get(self.attribute)
+        if value is None:
+            value = getattr(settings_manager, self.loader)(instance.id)
+            instance.__dict__[self.attribute] = value
+        return value
+
+    def __set__(self, instance, value):
+        if value is None or value is self:
+            # The dataclass default, the resource is loaded lazily
+            instance.__dict__.pop(self.attribute, None)
+            return
+        instance.__dict__[self.attribute] = value
+
+    def reset(self, instance):
+        """ Drops the loaded value, the resource is read again
+        on next access.
+
+        :param instance: Connection settings
+        :type instance: ConnectionSettings
+        """
+        instance.__dict__.pop(self.attribute, None)
+
+
 @dataclasses.dataclass
 class ConnectionSettings:
     """Manages the plugin connection settings.
+
+    The collections, conformances and search items are
+    loaded from the plugin settings when first accessed.
     """
 
     id: uuid.UUID
     name: str
     url: str
     page_size: int
-    collections: list
-    conformances: list
-    search_items: list
     capability: ApiCapability
     catalog_type: str  # 'api' or 'static'
     sas_subscription_key: str
     created_date: datetime.datetime = datetime.datetime.now()
     auth_config: typing.Optional[str] = None
+    # Not part of the repr and comparisons, which would load them
+    collections: list = dataclasses.field(
+        default=ConnectionResource("get_collections"),
+        repr=False,
+        compare=False
+    )
+    conformances: list = dataclasses.field(
+        default=ConnectionResource("get_conformances"),
+        repr=False,
+        compare=False
+    )
+    search_items: dict = dataclasses.field(
+        default=ConnectionResource("get_items"),
+        repr=False,
+        compare=False
+    )
 
     @classmethod
     def from_qgs_settings(
@@ -91,20 +159,9 @@ class ConnectionSettings:
         :returns: Connection settings object
         :rtype: ConnectionSettings
         """
-        collections = []
-        conformances = []
         auth_cfg = None
         capability = None
         try:
-            collections = settings_manager.get_collections(
-                uuid.UUID(identifier)
-            )
-            conformances = settings_manager.get_conformances(
-                uuid.UUID(identifier)
-            )
-            items = settings_manager.get_items(
-                uuid.UUID(identifier)
-            )
             capability_value = settings.value("capability", defaultValue=None)
             capability = ApiCapability(capability_value) \
                 if capability_value else None
@@ -123,16 +180,22 @@ class ConnectionSettings:
             name=settings.value("name"),
             url=settings.value("url"),
             page_size=int(settings.value("page_size", defaultValue=10)),
-            collections=collections,
-            conformances=conformances,
             capability=capability,
             catalog_type=catalog_type_value,
             sas_subscription_key=settings.value("sas_subscription_key"),
             created_date=created_date,
             auth_config=auth_cfg,
-            search_items=items,
         )
 
+    def reset_resource(self, name: str):
+        """ Drops the loaded collections, conformances or search items,
+        they are read again from the plugin settings on next access.
+
+        :param name: Field name of the resource
+        :type name: str
+        """
+        type(self).__dict__[name].reset(self)
+
 
 @dataclasses.dataclass
 class CollectionSettings(Collection):
@@ -279,81 +342,22 @@ class ConformanceSettings(Conformance):
 class Settings(enum.Enum):
     """ Plugin settings names"""
     AUTO_ASSET_LOADING = "auto_asset_loading"
+    CLIENT_CACHE_TTL = "client_cache/ttl"
+    HTTP_CACHE_SIZE = "http_cache/size"
+    THUMBNAIL_CACHE_SIZE = "thumbnail_cache/size"
+    THUMBNAIL_MAX_REQUESTS = "thumbnail_cache/max_requests"
+    CRAWLER_MAX_REQUESTS = "crawler/max_requests"
+    PREFETCH_PAGES = "prefetch_pages"
+    LEAN_SEARCH = "lean_search"
+    OFFLINE_INDEX = "offline_index/enabled"
+    OFFLINE_INDEX_MAX_AGE = "offline_index/max_age"
+    OFFLINE_INDEX_SIZE = "offline_index/size"
+    OFFLINE_SEARCH = "offline_index/search"
     DOWNLOAD_FOLDER = "download_folder"
-    REFRESH_FREQUENCY = "refresh/period"
-    REFRESH_FREQUENCY_UNIT = "refresh/unit"
     REFRESH_LAST_UPDATE = "refresh/last_update"
     REFRESH_STATE = "refresh/state"
 
 
-@dataclasses.dataclass
-class ItemSettings(Item):
-    """Plugin STAC API Item settings class
-    """
-
-    @classmethod
-    def from_qgs_settings(
-            cls,
-            identifier: str,
-            settings: QgsSettings):
-        """Reads QGIS settings and parses them into the item
-        settings instance with the respective settings values as properties.
-
-        :param identifier: Item identifier
-        :type identifier: str
-
-        :param settings: QGIS settings.
-        :type settings: QgsSettings
-
-        :returns: Conformance settings object
-        :rtype: ConformanceSettings
-        """
-        assets = cls.get_assets(settings)
-        item_uuid = None
-        try:
-            item_uuid = uuid.UUID(identifier)
-        except:
-            pass
-        return cls(
-            item_uuid=item_uuid,
-            id=settings.value("id"),
-            stac_version=settings.value("stac_version"),
-            assets=assets,
-            stac_object=settings.value("stac_object")
-        )
-
-    @classmethod
-    def get_assets(cls, item_settings):
-        """Gets the store item assets from the given settings.
-
-        :param name: Plugin item settings
-        :type name: QgsSettings()
-
-        :returns: Plugin STAC Item assets list
-        :rtype: []
-        """
-        assets = []
-        key = "assets"
-
-        with qgis_settings(key, item_settings) as settings:
-
-            title = settings.value("title", None)
-            href = settings.value("href", None)
-            description = settings.value("description", None)
-            roles = settings.value("roles", None)
-            type = settings.value("type", None)
-
-            asset = ResourceAsset(
-                title=title,
-                href=href,
-                roles=roles,
-                type=type,
-                description=description,
-            )
-            assets.append(asset)
-        return assets
-
-
 class SettingsManager(QtCore.QObject):
     """Manages saving/loading settings for the plugin in QgsSettings.
     """
@@ -362,14 +366,64 @@ class SettingsManager(QtCore.QObject):
     CONNECTION_GROUP_NAME: str = "connections"
     SELECTED_CONNECTION_KEY: str = "selected_connection"
     COLLECTION_GROUP_NAME: str = "collections"
+    COLLECTION_INDEX_KEY: str = "collection_index"
     CONFORMANCE_GROUP_NAME: str = "conformance"
     ITEMS_GROUP_NAME: str = "items"
-    ASSETS_GROUP_NAME: str = "assets"
 
     settings = QgsSettings()
 
     connections_settings_updated = QtCore.pyqtSignal()
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Registry of the read connections settings, by identifier,
+        # reset when the connections are saved or removed.
+        self._connections = {}
+        self._connection_ids = None
+        # Collections STAC id to settings identifier index, by connection
+        self._collection_indexes = {}
+        self._connections_lock = threading.RLock()
+
+    def _invalidate_connections(self, identifier=None):
+        """ Drops the registered connection with the passed identifier
+        and the connections list, or all the registered connections
+        when no identifier is passed.
+
+        :param identifier: Connection identifier
+        :type identifier: uuid.UUID
+        """
+        with self._connections_lock:
+            self._connection_ids = None
+            if identifier is None:
+                self._connections.clear()
+                self._collection_indexes.clear()
+            else:
+                identifier = uuid.UUID(str(identifier))
+                self._connections.pop(identifier, None)
+                self._collection_indexes.pop(identifier, None)
+
+    def _reset_connection_resource(self, name, identifier=None):
+        """ Drops the loaded collections, conformances or search items
+        of the registered connection with the passed identifier, or of
+        all the registered connections when no identifier is passed.
+
+        :param name: Connection settings resource field name
+        :type name: str
+
+        :param identifier: Connection identifier
+        :type identifier: uuid.UUID
+        """
+        with self._connections_lock:
+            if identifier is None:
+                connections = list(self._connections.values())
+            else:
+                connection = self._connections.get(
+                    uuid.UUID(str(identifier))
+                )
+                connections = [connection] if connection else []
+        for connection in connections:
+            connection.reset_resource(name)
+
     def set_value(self, name: str, value):
         """Adds a new setting key and value on the plugin specific settings.
 
@@ -432,23 +486,23 @@ class SettingsManager(QtCore.QObject):
         :return: Plugin connections
         :rtype: List[ConnectionSettings]
         """
-        result = []
-        with qgis_settings(
-                f"{self.BASE_GROUP_NAME}/"
-                f"{self.CONNECTION_GROUP_NAME}") \
-                as settings:
-            for connection_id in settings.childGroups():
-                connection_settings_key = self._get_connection_settings_base(
-                    connection_id
-                )
-                with qgis_settings(connection_settings_key) \
-                        as connection_settings:
-                    result.append(
-                        ConnectionSettings.from_qgs_settings(
-                            connection_id, connection_settings
-                        )
-                    )
-        return result
+        with self._connections_lock:
+            connection_ids = self._connection_ids
+        if connection_ids is None:
+            with qgis_settings(
+                    f"{self.BASE_GROUP_NAME}/"
+                    f"{self.CONNECTION_GROUP_NAME}") \
+                    as settings:
+                connection_ids = [
+                    uuid.UUID(connection_id)
+                    for connection_id in settings.childGroups()
+                ]
+            with self._connections_lock:
+                self._connection_ids = connection_ids
+        return [
+            self.get_connection_settings(connection_id)
+            for connection_id in connection_ids
+        ]
 
     def delete_all_connections(self):
         """Deletes all the plugin connections settings in QgsSettings.
@@ -459,6 +513,7 @@ class SettingsManager(QtCore.QObject):
                 as settings:
             for connection_name in settings.childGroups():
                 settings.remove(connection_name)
+        self._invalidate_connections()
         self.clear_current_connection()
         self.connections_settings_updated.emit()
 
@@ -471,26 +526,13 @@ class SettingsManager(QtCore.QObject):
         :returns: Connection settings instance
         :rtype: ConnectionSettings
         """
-        with qgis_settings(
-                f"{self.BASE_GROUP_NAME}/"
-                f"{self.CONNECTION_GROUP_NAME}") \
-                as settings:
-            for connection_id in settings.childGroups():
-                connection_settings_key = self._get_connection_settings_base(
-                    connection_id
-                )
-                with qgis_settings(connection_settings_key) \
-                        as connection_settings:
-                    connection_name = connection_settings.value("name")
-                    if connection_name == name:
-                        found_id = uuid.UUID(connection_id)
-                        break
-            else:
-                raise ValueError(
-                    f"Could not find a connection named "
-                    f"{name!r} in QgsSettings"
-                )
-        return self.get_connection_settings(found_id)
+        for connection in self.list_connections():
+            if connection.name == name:
+                return connection
+        raise ValueError(
+            f"Could not find a connection named "
+            f"{name!r} in QgsSettings"
+        )
 
     def get_connection_settings(
             self,
@@ -503,11 +545,20 @@ class SettingsManager(QtCore.QObject):
         :returns: Connection settings instance
         :rtype: ConnectionSettings
         """
-        settings_key = self._get_connection_settings_base(identifier)
-        with qgis_settings(settings_key) as settings:
-            connection_settings = ConnectionSettings.from_qgs_settings(
-                str(identifier), settings
-            )
+        identifier = uuid.UUID(str(identifier))
+        with self._connections_lock:
+            connection_settings = self._connections.get(identifier)
+        if connection_settings is None:
+            settings_key = self._get_connection_settings_base(identifier)
+            with qgis_settings(settings_key) as settings:
+                connection_settings = ConnectionSettings.from_qgs_settings(
+                    str(identifier), settings
+                )
+            with self._connections_lock:
+                connection_settings = self._connections.setdefault(
+                    identifier,
+                    connection_settings
+                )
         return connection_settings
 
     def save_connection_settings(
@@ -544,6 +595,7 @@ class SettingsManager(QtCore.QObject):
             )
             settings.setValue("created_date", created_date)
             settings.setValue("auth_config", connection_settings.auth_config)
+        self._invalidate_connections(connection_settings.id)
         self.connections_settings_updated.emit()
 
     def delete_connection(self, identifier: uuid.UUID):
@@ -559,6 +611,8 @@ class SettingsManager(QtCore.QObject):
                 f"{self.CONNECTION_GROUP_NAME}")\
                 as settings:
             settings.remove(str(identifier))
+        self._item_store().delete_items(identifier)
+        self._invalidate_connections(identifier)
         self.connections_settings_updated.emit()
 
     def get_current_connection(self) -> typing.Optional[ConnectionSettings]:
@@ -694,33 +748,6 @@ class SettingsManager(QtCore.QObject):
                f"{self.CONFORMANCE_GROUP_NAME}/" \
                f"{str(identifier)}"
 
-    def _get_item_settings_base(
-            self,
-            connection_identifier,
-            page,
-            identifier
-    ):
-        """Gets the items settings base group.
-
-        :param connection_identifier: Connection settings identifier
-        :type connection_identifier: uuid.UUID
-
-        :param page: The result page that the item was when fetched.
-        :type page: str
-
-        :param identifier: The item settings identifier
-        :type identifier: uuid.UUID
-
-        :returns Items settings base group
-        :rtype str
-        """
-        return f"{self.BASE_GROUP_NAME}/" \
-               f"{self.CONNECTION_GROUP_NAME}/" \
-               f"{connection_identifier}/" \
-               f"{self.ITEMS_GROUP_NAME}/" \
-               f"{page}/" \
-               f"{identifier}"
-
     def save_collection(self, connection, collection_settings):
         """ Save the passed colection settings into the plugin settings
 
@@ -730,14 +757,31 @@ class SettingsManager(QtCore.QObject):
         :param collection_settings: Collection settings
         :type collection_settings:  CollectionSettings
         """
-        settings_key = self._get_collection_settings_base(
-            connection.id,
-            collection_settings.uuid
-        )
+        self.save_collections(connection, [collection_settings])
 
-        with qgis_settings(settings_key) as settings:
-            settings.setValue("title", collection_settings.title)
-            settings.setValue("id", collection_settings.id)
+    def save_collections(self, connection, collections_settings):
+        """ Save the passed collections settings into the plugin settings,
+        the collections index is written once for all the collections.
+
+        :param connection: Connection settings
+        :type connection:  ConnectionSettings
+
+        :param collections_settings: Collections settings
+        :type collections_settings:  List[CollectionSettings]
+        """
+        index = dict(self._get_collection_index(connection.id))
+        for collection_settings in collections_settings:
+            settings_key = self._get_collection_settings_base(
+                connection.id,
+                collection_settings.uuid
+            )
+            with qgis_settings(settings_key) as settings:
+                settings.setValue("title", collection_settings.title)
+                settings.setValue("id", collection_settings.id)
+            index[collection_settings.id] = str(collection_settings.uuid)
+
+        self._save_collection_index(connection.id, index)
+        self._reset_connection_resource("collections", connection.id)
 
     def save_collection_links(self, links, key):
         """ Saves the collection links into plugin settings
@@ -798,65 +842,85 @@ class SettingsManager(QtCore.QObject):
         with qgis_settings(temporal_key) as settings:
             settings.setValue("interval", interval)
 
-    def save_items(self, connection, items, page):
-        """ Save the passed items into the plugin connection settings
+    def _item_store(self):
+        """ Returns the search result items store, located in the
+        QGIS profile folder.
 
-        :param connection: Connection settings
-        :type connection:  ConnectionSettings
+        :returns: Items store
+        :rtype: ItemStore
         """
-        for item in items:
-            item_setting = ItemSettings(
-                item_uuid=item.item_uuid,
-                id=item.id,
-                assets=item.assets,
-                stac_object=item.stac_object
+        if item_store.path is None:
+            item_store.configure(
+                os.path.join(
+                    QgsApplication.qgisSettingsDirPath(),
+                    self.BASE_GROUP_NAME,
+                    "items.sqlite"
+                )
             )
-            self.save_item(connection, item_setting, page)
+        return item_store
 
-    def save_item(self, connection, item_settings, page):
-        """ Save the passed item settings into the plugin settings
+    @staticmethod
+    def item_record(item) -> dict:
+        """ Converts the passed item into an items store record.
 
-        :param connection: Connection settings
-        :type connection:  ConnectionSettings
+        Only the raw feature is stored, serialized when the record is
+        built, the item assets are read from the feature when needed.
+
+        :param item: Plugin item
+        :type item: ItemView
+
+        :returns: Items store record
+        :rtype: dict
         """
-        settings_key = self._get_item_settings_base(
-            connection.id,
-            page,
-            item_settings.item_uuid
-        )
+        return {
+            "uuid": item.item_uuid,
+            "id": item.id,
+            "stac_version": item.feature.get("stac_version"),
+            "feature": json.dumps(item.feature),
+        }
 
-        with qgis_settings(settings_key) as settings:
-            settings.setValue("id", item_settings.id)
-            settings.setValue("item_uuid", item_settings.item_uuid)
-            settings.setValue("stac_version", item_settings.stac_version)
-            settings.setValue("stac_object", item_settings.stac_object)
-        self.save_item_assets(item_settings.assets, settings_key)
+    def save_items(self, connection_id, records, page, replace_page=False):
+        """ Save the passed item records into the plugin items store,
+        all the items are written in one transaction.
 
-    def save_item_assets(self, assets, key):
-        """ Saves the collection provider into plugin settings
-        using the provided settings group key.
+        :param connection_id: Connection identifier
+        :type connection_id: uuid.UUID
 
-        :param links: List of collection providers
-        :type links: []
+        :param records: Item records, as returned by item_record()
+        :type records: list
 
-        :param key: QgsSettings group key.
-        :type key: str
+        :param page: The result page of the items
+        :type page: int
+
+        :param replace_page: Whether to remove the other stored
+        items of the page
+        :type replace_page: bool
         """
-        for asset in assets or []:
-            asset_uuid = uuid.uuid4()
-            settings_key = f"{key}/{self.ASSETS_GROUP_NAME}/{asset_uuid}"
-            with qgis_settings(settings_key) as settings:
-                settings.setValue("title", asset.title)
-                settings.setValue("description", asset.description)
-                settings.setValue("href", asset.href)
-                settings.setValue("roles", asset.roles)
-                settings.setValue("type", asset.type)
+        self._item_store().save_items(
+            connection_id,
+            page,
+            records,
+            replace_page=replace_page
+        )
+        self._reset_connection_resource("search_items", connection_id)
 
-    def get_collection(self, identifier, connection):
+    def update_items(self, items):
+        """ Updates the passed items in the plugin items store,
+        the items keep their stored result page.
+
+        :param items: Items to update
+        :type items: List[ItemView]
+        """
+        self._item_store().update_items(
+            [self.item_record(item) for item in items]
+        )
+        self._reset_connection_resource("search_items")
+
+    def get_collection_by_uuid(self, identifier, connection):
         """ Retrieves the collection that matches the passed identifier.
 
-        :param identifier: Collection identifier
-        :type identifier: str
+        :param identifier: Collection settings identifier
+        :type identifier: uuid.UUID
 
         :param connection: Connection that the collection belongs to.
         :type connection: ConnectionSettings
@@ -876,7 +940,8 @@ class SettingsManager(QtCore.QObject):
         return collection_settings
 
     def get_collection(self, collection_id, connection):
-        """ Retrieves the first collection that matched the passed collection id.
+        """ Retrieves the collection that matches the passed collection id,
+        using the connection collections index.
 
         :param collection_id: STAC collection id
         :type collection_id: str
@@ -887,30 +952,77 @@ class SettingsManager(QtCore.QObject):
         :returns Collection settings instance
         :rtype CollectionSettings
         """
+        if connection is None or collection_id is None:
+            return None
+        identifier = self._get_collection_index(connection.id).get(
+            collection_id
+        )
+        if identifier is None:
+            return None
+        return self.get_collection_by_uuid(identifier, connection)
 
-        connection_identifier = connection.id
+    def _get_collection_index(self, connection_identifier) -> dict:
+        """ Gets the index of the connection collections settings
+        identifiers by STAC collection id.
+
+        The index is stored in the connection settings, it is built
+        from the stored collections when missing.
+
+        :param connection_identifier: Connection identifier
+        :type connection_identifier: uuid.UUID
+
+        :returns Collection ids mapped to the collection settings identifiers
+        :rtype dict
+        """
+        connection_identifier = uuid.UUID(str(connection_identifier))
+        with self._connections_lock:
+            index = self._collection_indexes.get(connection_identifier)
+        if index is not None:
+            return index
 
-        result = []
         with qgis_settings(
-                f"{self.BASE_GROUP_NAME}/"
-                f"{self.CONNECTION_GROUP_NAME}/"
-                f"{str(connection_identifier)}/"
-                f"{self.COLLECTION_GROUP_NAME}"
-        ) \
-                as settings:
-            for uuid in settings.childGroups():
-                collection_settings_key = self._get_collection_settings_base(
-                    connection_identifier,
-                    uuid
-                )
-                with qgis_settings(collection_settings_key) \
-                        as collection_settings:
-                    collection = CollectionSettings.from_qgs_settings(
-                            uuid, collection_settings
-                    )
-                    if collection.id == collection_id:
-                        return collection
-        return None
+                self._get_connection_settings_base(connection_identifier)
+        ) as settings:
+            value = settings.value(self.COLLECTION_INDEX_KEY, None)
+        if value is not None:
+            index = json.loads(value)
+        else:
+            index = {}
+            with qgis_settings(
+                    f"{self.BASE_GROUP_NAME}/"
+                    f"{self.CONNECTION_GROUP_NAME}/"
+                    f"{str(connection_identifier)}/"
+                    f"{self.COLLECTION_GROUP_NAME}"
+            ) as settings:
+                for identifier in settings.childGroups():
+                    collection_id = settings.value(f"{identifier}/id", None)
+                    if collection_id is not None:
+                        index.setdefault(collection_id, identifier)
+            self._save_collection_index(connection_identifier, index)
+
+        with self._connections_lock:
+            return self._collection_indexes.setdefault(
+                connection_identifier,
+                index
+            )
+
+    def _save_collection_index(self, connection_identifier, index: dict):
+        """ Stores the connection collections index.
+
+        :param connection_identifier: Connection identifier
+        :type connection_identifier: uuid.UUID
+
+        :param index: Collection ids mapped to the collection
+        settings identifiers
+        :type index: dict
+        """
+        connection_identifier = uuid.UUID(str(connection_identifier))
+        with qgis_settings(
+                self._get_connection_settings_base(connection_identifier)
+        ) as settings:
+            settings.setValue(self.COLLECTION_INDEX_KEY, json.dumps(index))
+        with self._connections_lock:
+            self._collection_indexes[connection_identifier] = index
 
     def get_collections(self, connection_identifier):
         """ Gets all the available collections settings in the
@@ -962,6 +1074,8 @@ class SettingsManager(QtCore.QObject):
                 as settings:
             for collection_name in settings.childGroups():
                 settings.remove(collection_name)
+        self._save_collection_index(connection.id, {})
+        self._reset_connection_resource("collections", connection.id)
 
     def get_conformances(self, connection_identifier):
         """ Gets all the available conformances settings in the
@@ -1014,6 +1128,7 @@ class SettingsManager(QtCore.QObject):
         with qgis_settings(settings_key) as settings:
             settings.setValue("name", conformance_settings.name)
             settings.setValue("uri", conformance_settings.uri)
+        self._reset_connection_resource("conformances", connection.id)
 
     def delete_all_conformance(self, connection):
         """Deletes all the connection conformance settings,
@@ -1032,10 +1147,10 @@ class SettingsManager(QtCore.QObject):
                 as settings:
             for conformance_name in settings.childGroups():
                 settings.remove(conformance_name)
+        self._reset_connection_resource("conformances", connection.id)
 
     def get_items(self, connection_identifier, items_uuids=None):
-        """ Gets all the available items settings in the
-        provided connection.
+        """ Gets all the stored items of the provided connection.
 
         :param connection_identifier: Connection identifier from which
         to get all the available collections
@@ -1044,63 +1159,46 @@ class SettingsManager(QtCore.QObject):
         :param items_uuids: List of target items ids
         :type items_uuids: []
 
-        :returns List of the item settings instances
-        :rtype list
+        :returns Result pages mapped to the lists of items
+        :rtype dict
         """
         result = {}
-        with qgis_settings(
-                f"{self.BASE_GROUP_NAME}/"
-                f"{self.CONNECTION_GROUP_NAME}/"
-                f"{str(connection_identifier)}/"
-                f"{self.ITEMS_GROUP_NAME}"
-        ) \
-                as settings:
-            for page in settings.childGroups():
-                with qgis_settings(
-                        f"{self.BASE_GROUP_NAME}/"
-                        f"{self.CONNECTION_GROUP_NAME}/"
-                        f"{str(connection_identifier)}/"
-                        f"{self.ITEMS_GROUP_NAME}/"
-                        f"{page}"
-                ) as page_settings:
-                    result[f"{page}"] = []
-                    for item_id in page_settings.childGroups():
-                        if items_uuids and item_id not in items_uuids:
-                            continue
-                        item_setting_key = self._get_item_settings_base(
-                            connection_identifier,
-                            page,
-                            item_id
-                        )
-                        with qgis_settings(item_setting_key) \
-                                as item_settings:
-                            result[f"{page}"].append(
-                                ItemSettings.from_qgs_settings(
-                                    item_id,
-                                    item_settings
-                                )
-                            )
+        pages = self._item_store().get_items(
+            connection_identifier,
+            items_uuids=items_uuids
+        )
+        for page, records in pages.items():
+            result[page] = []
+            for record in records:
+                result[page].append(
+                    ItemView(
+                        record["feature"] or {"id": record["id"]},
+                        item_uuid=uuid.UUID(record["uuid"])
+                    )
+                )
         return result
 
     def delete_all_items(self, connection, page=None):
-        """Deletes all the plugin connections items settings,
+        """Deletes all the plugin connections stored items,
         in the connection.
 
         :param connection: Connection from which to delete all the
         available collections
         :type connection: ConnectionSettings
-        """
-        key = f"{self.BASE_GROUP_NAME}/" \
-              f"{self.CONNECTION_GROUP_NAME}/" \
-              f"{str(connection.id)}/" \
-              f"{self.ITEMS_GROUP_NAME}"
 
-        if page:
-            key = f"{key}/{page}"
+        :param page: Result page of the items to delete
+        :type page: int
+        """
+        self._item_store().delete_items(connection.id, page)
 
-        with qgis_settings(key) as settings:
-            for item_name in settings.childGroups():
-                settings.remove(item_name)
+        # Items saved in the settings by the previous plugin versions
+        with qgis_settings(
+                f"{self.BASE_GROUP_NAME}/"
+                f"{self.CONNECTION_GROUP_NAME}/"
+                f"{str(connection.id)}"
+        ) as settings:
+            settings.remove(self.ITEMS_GROUP_NAME)
+        self._reset_connection_resource("search_items", connection.id)
 
     def save_search_filters(
         self,
@@ -1160,16 +1258,17 @@ class SettingsManager(QtCore.QObject):
         current_connection = self.get_current_connection()
         if filters.collections:
             self.delete_all_collections(current_connection)
-            for collection in filters.collections:
-                collection = CollectionSettings(
-                    uuid=uuid.uuid4(),
-                    id=collection.id,
-                    title=collection.title
-                )
-                self.save_collection(
-                    current_connection,
-                    collection
-                )
+            self.save_collections(
+                current_connection,
+                [
+                    CollectionSettings(
+                        uuid=uuid.uuid4(),
+                        id=collection.id,
+                        title=collection.title
+                    )
+                    for collection in filters.collections
+                ]
+            )
 
     def get_search_filters(self):
         """ Retrieve the store fitlers settings"""
@@ -9,9 +9,90 @@ THUMBNAIL_WIDTH_PARAM = 'width'
 THUMBNAIL_HEIGHT = 200
 THUMBNAIL_WIDTH = 200
 
+# Pixels of the thumbnails side in the search results list
+RESULT_THUMBNAIL_SIZE = 120
+
+# Date format of the search results list
+RESULT_DATE_FORMAT = "%m/%d/%Y"
+
+# Item properties matched by the search results filter, besides the
+# id, collection and dates
+RESULT_FILTER_PROPERTIES = (
+    "title",
+    "platform",
+    "constellation",
+    "instruments",
+    "mission",
+)
+
+# Milliseconds without typing after which the results filter is applied
+RESULT_FILTER_DELAY = 150
+
 SAS_SUBSCRIPTION_VARIABLE = "PC_SDK_SUBSCRIPTION_KEY"
 
+# Seconds before their expiry at which the SAS tokens are renewed
+SAS_TOKEN_RENEWAL_MARGIN = 60
+
 GDAL_SUBDATASETS_KEY = "SUBDATASETS"
 GDAL_METADATA_NAME = "NAME"
 
 STAC_QUERYABLE_TIMESTAMP = "TIMESTAMP"
+
+# Minutes during which the opened catalogs landing pages are reused
+CLIENT_CACHE_TTL_DEFAULT = 10
+
+# Megabytes of disk space used by the network responses cache
+HTTP_CACHE_SIZE_DEFAULT = 50
+
+# Megabytes of disk space used by the downscaled thumbnails cache
+THUMBNAIL_CACHE_SIZE_DEFAULT = 20
+
+# Number of result thumbnails fetched at the same time
+THUMBNAIL_MAX_REQUESTS_DEFAULT = 4
+
+# Static catalogs crawl limits and concurrent requests
+STATIC_CATALOG_MAX_ITEMS = 100
+STATIC_CATALOG_MAX_DEPTH = 3
+CRAWLER_MAX_REQUESTS_DEFAULT = 4
+
+# Days during which the fetched items are kept in the offline index
+OFFLINE_INDEX_MAX_AGE_DEFAULT = 30
+
+# Megabytes of item documents kept in the offline index
+OFFLINE_INDEX_SIZE_DEFAULT = 200
+
+# Priority of the result pages prefetch tasks, lower than the user searches
+PREFETCH_TASK_PRIORITY = -1
+
+# Number of prepared items sent to the results view in each streamed batch
+STREAM_BATCH_SIZE = 10
+
+# Maximum number of concurrent asynchronous requests sent to the same host
+MAX_REQUESTS_PER_HOST = 6
+
+# Item fields requested by the lean searches, enough for the results list
+# and its filter
+LEAN_SEARCH_FIELDS = {
+    "include": [
+        "id",
+        "type",
+        "stac_version",
+        "stac_extensions",
+        "collection",
+        "geometry",
+        "bbox",
+        "links",
+        "properties.datetime",
+        "properties.start_datetime",
+        "properties.end_datetime",
+        "properties.start_date",
+        "properties.end_date",
+        "properties.eo:cloud_cover",
+        *(f"properties.{name}" for name in RESULT_FILTER_PROPERTIES),
+        "assets.thumbnail",
+        "assets.rendered_preview",
+        "assets.overview",
+        "assets.preview",
+    ],
+    "exclude": [],
+}
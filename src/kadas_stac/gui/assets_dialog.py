@@ -32,19 +32,14 @@ from qgis.core import (
     QgsVectorLayer,
 
 )
-from ..lib import planetary_computer as pc
 
 from ..resources import *
 
-from ..api.models import (
-    AssetLayerType,
-    ApiCapability
-)
+from ..api.models import AssetLayerType
 
 from ..definitions.constants import (
     GDAL_METADATA_NAME,
     GDAL_SUBDATASETS_KEY,
-    SAS_SUBSCRIPTION_VARIABLE
 )
 
 from ..conf import (
@@ -53,6 +48,7 @@ from ..conf import (
 )
 
 from .asset_widget import AssetWidget
+from .result_item_delegate import href_signer, sign_asset_href
 
 from ..utils import log, tr
 
@@ -87,6 +83,7 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
         self.assets = item.assets
         self.parent = parent
         self.main_widget = main_widget
+        self.signer = href_signer()
         self.vis_url_string = '/vsicurl/'
         self.download_result = {}
         self.load_assets = {}
@@ -327,7 +324,7 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
             )
             return
 
-        url = self.sign_asset_href(asset.href)
+        url = sign_asset_href(asset.href, self.signer)
         
         # Check if this is Copernicus
         connection = settings_manager.get_current_connection()
@@ -521,33 +518,6 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
                 tr("Error in downloading file, {}").format(str(e))
             )
 
-    def sign_asset_href(self, asset_href):
-        """ Signs the SAS based asset href.
-
-        :param asset_href: Asset resource href
-        :type asset_href: str
-
-        :returns Signed href or same href if not signing is required
-        :rtype str
-        """
-
-        # If the plugin current connection has a sas subscription key
-        # use it instead of the environment one.
-        sas_key = os.getenv(SAS_SUBSCRIPTION_VARIABLE)
-        connection = settings_manager.get_current_connection()
-
-        if connection and \
-                connection.capability == ApiCapability.SUPPORT_SAS_TOKEN:
-            sas_key = connection.sas_subscription_key \
-                if connection.sas_subscription_key else sas_key
-
-            pc.set_subscription_key(sas_key) if sas_key else None
-
-            signed_href = pc.sign(asset_href)
-            return signed_href
-
-        return asset_href
-
     def _get_copernicus_s3_credentials(self):
         """Get temporary S3 credentials from Copernicus Data Space using OAuth2 token.
         
@@ -736,7 +706,7 @@ class AssetsDialog(QtWidgets.QDialog, DialogUi):
             AssetLayerType.COPC.value,
         ])
         current_asset_href = asset.href
-        asset.href = self.sign_asset_href(asset.href)
+        asset.href = sign_asset_href(asset.href, self.signer)
         
         # Check if this is Copernicus
         connection = settings_manager.get_current_connection()
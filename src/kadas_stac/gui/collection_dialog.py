@@ -14,6 +14,8 @@ from qgis.gui import QgsMessageBar
 
 from ..conf import settings_manager
 from ..api.client import Client
+from ..api.collection_cache import collection_cache
+from ..api.models import Collection
 from ..utils import tr
 
 from qgis.PyQt.uic import loadUiType
@@ -44,6 +46,14 @@ class CollectionDialog(QtWidgets.QDialog, DialogUi):
         self.prepare_message_bar()
 
         connection = settings_manager.get_current_connection()
+        document = collection_cache.get_document(
+            connection.id,
+            collection.id
+        )
+        if document is not None:
+            self.handle_collection(Collection.from_dict(document))
+            return
+
         api_client = Client.from_connection_settings(connection)
 
         api_client.collection_received.connect(self.handle_collection)
@@ -24,6 +24,9 @@ from ..conf import (
 
 from ..api.models import ApiCapability, ItemSearch
 from ..api.client import Client
+from ..api.client_cache import landing_pages
+from ..api.collection_cache import collection_cache
+from ..api.pagination import pagination_cursors
 from ..utils import tr
 
 DialogUi, _ = loadUiType(
@@ -115,6 +118,7 @@ class ConnectionDialog(QtWidgets.QDialog, DialogUi):
 
         if connection is not None:
             self.update_connection_inputs(False)
+            landing_pages.invalidate(connection.url)
             api_client = Client.from_connection_settings(connection)
             api_client.conformance_received.connect(self.display_conformances)
             api_client.error_received.connect(self.show_message)
@@ -303,6 +307,13 @@ class ConnectionDialog(QtWidgets.QDialog, DialogUi):
         connection_id = uuid.uuid4()
         if self.connection is not None:
             connection_id = self.connection.id
+            saved_connection = settings_manager.get_connection_settings(
+                connection_id
+            )
+            if saved_connection is not None and saved_connection.url:
+                landing_pages.invalidate(saved_connection.url)
+                if saved_connection.url != self.url_edit.text().strip():
+                    collection_cache.remove(connection_id)
 
         capability = None
         if self.capabilities.currentText() != "":
@@ -341,6 +352,8 @@ class ConnectionDialog(QtWidgets.QDialog, DialogUi):
                                        f"({len(existing_connection_names)})"
         settings_manager.save_connection_settings(connection_settings)
         settings_manager.set_current_connection(connection_settings.id)
+        pagination_cursors.invalidate(connection_settings.id)
+        landing_pages.invalidate(connection_settings.url)
         super().accept()
 
     def update_ok_buttons(self):
@@ -370,6 +383,7 @@ class ConnectionDialog(QtWidgets.QDialog, DialogUi):
         connection = self.get_connection()
         if connection is not None:
             self.update_connection_inputs(False)
+            landing_pages.invalidate(connection.url)
             api_client = Client.from_connection_settings(connection)
             connection_test_success = partial(
                 self.connection_test,
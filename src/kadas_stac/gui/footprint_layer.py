@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+"""
+    Footprints layer of the search result items.
+
+    The footprints added during the session are kept in a single memory
+    layer with typed attributes and a spatial index. Features are only
+    appended, an item already in the layer, identified by its
+    connection, collection and id, is not added again. The item
+    geometries are converted to features in background tasks and added
+    to the layer in batches.
+"""
+
+import datetime
+import json
+import threading
+import typing
+
+from osgeo import ogr
+
+from qgis.PyQt import QtCore
+
+from qgis.core import (
+    QgsApplication,
+    QgsFeature,
+    QgsField,
+    QgsFields,
+    QgsGeometry,
+    QgsProject,
+    QgsRectangle,
+    QgsTask,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+
+from ..api.spatial_index import item_bbox
+from ..api.sas_signer import unsigned_url
+from ..utils import log, tr
+
+from .result_item_delegate import item_thumbnail_url
+
+FOOTPRINT_LAYER_URI = "MultiPolygon?crs=EPSG:4326"
+
+
+def footprint_fields() -> QgsFields:
+    """Returns the attribute fields of the footprints layers.
+
+    :returns: Connection name, item id, collection, datetime, cloud
+    cover and thumbnail URL fields
+    :rtype: QgsFields
+    """
+    fields = QgsFields()
+    fields.append(QgsField("connection", QtCore.QVariant.String))
+    fields.append(QgsField("id", QtCore.QVariant.String))
+    fields.append(QgsField("collection", QtCore.QVariant.String))
+    fields.append(QgsField("datetime", QtCore.QVariant.DateTime))
+    fields.append(QgsField("cloud_cover", QtCore.QVariant.Double))
+    fields.append(QgsField("thumbnail", QtCore.QVariant.String))
+    return fields
+
+
+def footprint_geometry(item) -> typing.Optional[QgsGeometry]:
+    """Returns the item footprint as a multi polygon, the item bounding
+    box is used when the item geometry is not a polygon.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :returns: Footprint geometry in EPSG:4326, None when the item has
+    neither geometry nor bounding box
+    :rtype: QgsGeometry
+    """
+    geometry = None
+    if item.geometry:
+        ogr_geometry = ogr.CreateGeometryFromJson(json.dumps(item.geometry))
+        if ogr_geometry is not None:
+            geometry = QgsGeometry.fromWkt(ogr_geometry.ExportToWkt())
+    if geometry is None or geometry.isNull() or \
+            geometry.type() != QgsWkbTypes.PolygonGeometry:
+        bbox = item_bbox(item)
+        if bbox is None:
+            return None
+        geometry = QgsGeometry.fromRect(QgsRectangle(*bbox))
+    geometry.convertToMultiType()
+    return geometry
+
+
+def footprint_feature(
+        item,
+        fields: QgsFields,
+        connection_name: typing.Optional[str] = None
+) -> typing.Optional[QgsFeature]:
+    """Builds the footprint feature of the item.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :param fields: Footprints layer fields
+    :type fields: QgsFields
+
+    :param connection_name: Name of the connection the item comes from
+    :type connection_name: str
+
+    :returns: Footprint feature, None when the item has no footprint
+    :rtype: QgsFeature
+    """
+    geometry = footprint_geometry(item)
+    if geometry is None:
+        return None
+    item_datetime = item.properties.resource_datetime
+    if item_datetime is not None and item_datetime.tzinfo is not None:
+        item_datetime = item_datetime.astimezone(datetime.timezone.utc)
+    # The result page hrefs are signed in place, the layer keeps the
+    # thumbnail URL without the expiring SAS token.
+    thumbnail_url = item_thumbnail_url(item)
+    if thumbnail_url:
+        thumbnail_url = unsigned_url(thumbnail_url)
+    feature = QgsFeature(fields)
+    feature.setGeometry(geometry)
+    feature.setAttributes(
+        [
+            connection_name,
+            item.id,
+            item.collection,
+            QtCore.QDateTime(
+                QtCore.QDate(
+                    item_datetime.year,
+                    item_datetime.month,
+                    item_datetime.day
+                ),
+                QtCore.QTime(
+                    item_datetime.hour,
+                    item_datetime.minute,
+                    item_datetime.second
+                ),
+                QtCore.Qt.UTC
+            ) if item_datetime is not None else None,
+            item.properties.eo_cloud_cover,
+            thumbnail_url,
+        ]
+    )
+    return feature
+
+
+def footprint_features(
+        items: typing.List,
+        fields: QgsFields,
+        connection_name: typing.Optional[str] = None,
+        canceled: typing.Optional[typing.Callable] = None
+) -> typing.List[QgsFeature]:
+    """Builds the footprint features of the items that have a footprint.
+
+    :param items: Search result items
+    :type items: list
+
+    :param fields: Footprints layer fields
+    :type fields: QgsFields
+
+    :param connection_name: Name of the connection the items come from
+    :type connection_name: str
+
+    :param canceled: Returns whether to stop building the features
+    :type canceled: Callable
+
+    :returns: Footprint features
+    :rtype: list
+    """
+    features = []
+    for item in items:
+        if canceled is not None and canceled():
+            break
+        feature = footprint_feature(item, fields, connection_name)
+        if feature is not None:
+            features.append(feature)
+    return features
+
+
+class FootprintTask(QgsTask):
+    """ Converts the items footprints to layer features."""
+
+    def __init__(
+            self,
+            items: typing.List,
+            fields: QgsFields,
+            connection_name: str,
+            handler: typing.Callable
+    ):
+        """
+        :param items: Search result items
+        :type items: list
+
+        :param fields: Footprints layer fields
+        :type fields: QgsFields
+
+        :param connection_name: Name of the connection the items come from
+        :type connection_name: str
+
+        :param handler: Called in the main thread with the built
+        features, None when the features could not be built
+        :type handler: Callable
+        """
+        super().__init__(tr("Add footprints"))
+        self.items = list(items)
+        self.fields = fields
+        self.connection_name = connection_name
+        self.handler = handler
+        self.features = []
+        self.error = None
+
+    def run(self):
+        """ Builds the footprint features of the items."""
+        try:
+            self.features = footprint_features(
+                self.items,
+                self.fields,
+                self.connection_name,
+                self.isCanceled
+            )
+        except Exception as e:
+            self.error = str(e)
+            return False
+        return not self.isCanceled()
+
+    def finished(self, result: bool):
+        """ Sends the built features to the handler.
+
+        :param result: Whether the run() operation finished successfully
+        :type result: bool
+        """
+        if not result and self.error:
+            log(tr("Error loading items footprints, {}").format(self.error))
+        self.handler(self.features if result else None)
+
+
+class FootprintStore(QtCore.QObject):
+    """ Session footprints layer, keyed by the connection, collection
+    and id of the items.
+
+    The layer is registered in the project when its first footprints
+    are added. When the layer is removed from the project the store is
+    emptied and the next footprints create a new layer.
+    """
+
+    footprints_added = QtCore.pyqtSignal(str, int)
+    features_ready = QtCore.pyqtSignal(list)
+
+    def __init__(self, layer_name: str, parent=None):
+        """
+        :param layer_name: Name of the footprints layer
+        :type layer_name: str
+
+        :param parent: Parent object
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.layer_name = layer_name
+        self.fields = footprint_fields()
+        self._keys = set()
+        self._layer_id = None
+        self._lock = threading.Lock()
+        self._tasks = []
+        self.features_ready.connect(self._add_page_features)
+        QgsProject.instance().layerWillBeRemoved[str].connect(
+            self._layer_removed
+        )
+
+    def __len__(self):
+        return len(self._keys)
+
+    def layer(self) -> typing.Optional[QgsVectorLayer]:
+        """Returns the footprints layer.
+
+        :returns: Layer, None when no footprints have been added or the
+        layer was removed from the project
+        :rtype: QgsVectorLayer
+        """
+        if self._layer_id is None:
+            return None
+        return QgsProject.instance().mapLayer(self._layer_id)
+
+    def add_items(
+            self,
+            connection_key: str,
+            connection_name: str,
+            items: typing.List
+    ):
+        """Adds the footprints of the items that are not in the layer,
+        the features are built in a background task.
+
+        :param connection_key: Identifier of the items connection
+        :type connection_key: str
+
+        :param connection_name: Name of the items connection
+        :type connection_name: str
+
+        :param items: Search result items
+        :type items: list
+        """
+        keys, items = self._reserve(connection_key, items)
+        if not items:
+            self.footprints_added.emit(self.layer_name, 0)
+            return
+        task = FootprintTask(
+            items,
+            self.fields,
+            connection_name,
+            lambda features: self._add_task_features(keys, features)
+        )
+        self._tasks.append(task)
+        task.taskCompleted.connect(lambda: self._tasks.remove(task))
+        task.taskTerminated.connect(lambda: self._tasks.remove(task))
+        QgsApplication.taskManager().addTask(task)
+
+    def add_page(
+            self,
+            connection_key: str,
+            connection_name: str,
+            items: typing.List
+    ):
+        """Adds the footprints of the items of a result page that are
+        not in the layer. Called in the thread fetching the pages, the
+        built features are sent to the main thread and the items are
+        not kept.
+
+        :param connection_key: Identifier of the items connection
+        :type connection_key: str
+
+        :param connection_name: Name of the items connection
+        :type connection_name: str
+
+        :param items: Result page items
+        :type items: list
+        """
+        _, items = self._reserve(connection_key, items)
+        features = footprint_features(items, self.fields, connection_name)
+        if features:
+            self.features_ready.emit(features)
+
+    def _reserve(self, connection_key: str, items: typing.List):
+        """ Returns the keys and the items that are not in the store
+        yet, their keys are added to the store."""
+        keys = []
+        new_items = []
+        with self._lock:
+            for item in items:
+                key = (connection_key, item.collection, item.id)
+                if key in self._keys:
+                    continue
+                self._keys.add(key)
+                keys.append(key)
+                new_items.append(item)
+        return keys, new_items
+
+    def _add_task_features(self, keys: typing.List, features):
+        """ Adds the features built by a task, the reserved keys are
+        released when the task failed."""
+        if features is None:
+            with self._lock:
+                self._keys.difference_update(keys)
+            return
+        self._add_features(features)
+        self.footprints_added.emit(self.layer_name, len(features))
+
+    def _add_page_features(self, features: typing.List[QgsFeature]):
+        self._add_features(features)
+
+    def _add_features(self, features: typing.List[QgsFeature]):
+        """ Appends the features to the layer in one batch."""
+        if not features:
+            return
+        layer = self.layer()
+        new_layer = layer is None
+        if new_layer:
+            layer = QgsVectorLayer(
+                FOOTPRINT_LAYER_URI,
+                self.layer_name,
+                "memory"
+            )
+            provider = layer.dataProvider()
+            provider.addAttributes(self.fields.toList())
+            layer.updateFields()
+            provider.createSpatialIndex()
+        layer.dataProvider().addFeatures(features)
+        layer.updateExtents()
+        if new_layer:
+            QgsProject.instance().addMapLayer(layer)
+            self._layer_id = layer.id()
+        else:
+            layer.triggerRepaint()
+
+    def _layer_removed(self, layer_id: str):
+        """ Empties the store when its layer is removed from the project."""
+        if layer_id != self._layer_id:
+            return
+        self._layer_id = None
+        with self._lock:
+            self._keys.clear()
@@ -4,7 +4,9 @@
  The plugin main window class file
 """
 
+import dataclasses
 import os
+import time
 
 from functools import partial
 
@@ -21,6 +23,9 @@ from qgis.core import (
     Qgis,
     QgsApplication,
     QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsProject,
     QgsTask
 )
 from qgis.gui import QgsMessageBar
@@ -28,6 +33,7 @@ from qgis.utils import iface
 
 from ..resources import *
 
+from ..gui.assets_dialog import AssetsDialog
 from ..gui.connection_dialog import ConnectionDialog
 from ..gui.collection_dialog import CollectionDialog
 from ..gui.queryable_property import QueryablePropertyWidget
@@ -35,6 +41,7 @@ from ..gui.queryable_property import QueryablePropertyWidget
 from ..conf import ConnectionSettings, Settings, settings_manager
 
 from ..api.models import (
+    Collection,
     FilterLang,
     ItemSearch,
     ResourceType,
@@ -44,10 +51,31 @@ from ..api.models import (
     QueryableFetchType
 )
 from ..api.client import Client
+from ..api.client_cache import landing_pages
+from ..api.collection_cache import collection_cache, diff_collections
+from ..api.http_cache import http_cache
+from ..api.offline_index import offline_index
+from ..api.pagination import pagination_cursors, search_key
+from ..api.prefetch import page_buffer
+from ..api.sas_signer import sas_signer
+from ..api.spatial_index import ItemSpatialIndex
+from ..api.thumbnail_cache import thumbnail_cache
+from ..jobs.token_manager import SASManager
 
 from .result_item_model import ItemsModel, ItemsSortFilterProxyModel
 from .json_highlighter import JsonHighlighter
 from ..logger import get_logger
+from ..definitions.constants import (
+    CLIENT_CACHE_TTL_DEFAULT,
+    CRAWLER_MAX_REQUESTS_DEFAULT,
+    HTTP_CACHE_SIZE_DEFAULT,
+    LEAN_SEARCH_FIELDS,
+    OFFLINE_INDEX_MAX_AGE_DEFAULT,
+    OFFLINE_INDEX_SIZE_DEFAULT,
+    RESULT_FILTER_DELAY,
+    THUMBNAIL_CACHE_SIZE_DEFAULT,
+    THUMBNAIL_MAX_REQUESTS_DEFAULT
+)
 
 from ..utils import (
     open_folder,
@@ -55,7 +83,13 @@ from ..utils import (
     tr,
 )
 
-from .result_item_widget import add_footprint_helper, ResultItemWidget
+from .footprint_layer import FootprintStore
+from .result_item_delegate import (
+    href_signer,
+    item_thumbnail_url,
+    ResultItemDelegate,
+)
+from .thumbnail_loader import ThumbnailLoader
 
 WidgetUi, _ = loadUiType(
     os.path.join(os.path.dirname(__file__), "../ui/kadas_stac_main.ui")
@@ -72,6 +106,16 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
 
     result_items = []
 
+    api_client = None
+    current_item_search = None
+    search_footprints_running = False
+    search_footprints_canceled = False
+    prefetch_generation = 0
+
+    streamed_items = []
+    search_start_time = None
+    thumbnail_signer = None
+
     def __init__(
             self,
             parent=None,
@@ -89,7 +133,14 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             self.update_connection_buttons
         )
 
+        # Renews the SAS tokens in use before they expire
+        self.sas_manager = SASManager(self)
+
         self.footprint_items = {}
+        self.footprint_store = FootprintStore(tr("STAC footprints"), self)
+        self.footprint_store.footprints_added.connect(self.footprints_added)
+        # Footprints of the items fetched in the session
+        self.item_index = ItemSpatialIndex()
         self.footprint_btn.clicked.connect(
             self.footprint_btn_clicked
         )
@@ -99,6 +150,10 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         self.all_footprints_btn.setEnabled(
             len(self.result_items) > 0
         )
+        self.search_footprints_btn.clicked.connect(
+            self.search_footprints_btn_clicked
+        )
+        self.search_footprints_btn.setEnabled(False)
 
         self.search_btn.clicked.connect(
             self.search_items_api
@@ -156,6 +211,11 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
 
         self.filter_text.textChanged.connect(self.filter_changed)
 
+        self.current_collections = []
+        # Connections whose cached collections have been revalidated
+        self.revalidated_collections = set()
+        self.collections_refresh_connection = None
+
         self.update_connections_box()
         self.update_connection_buttons()
         self.connections_box.activated.connect(self.update_current_connection)
@@ -166,8 +226,6 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         self.page = 1
         self.total_pages = 0
 
-        self.current_collections = []
-
         self.highlighter = None
         self.prepare_filter_box()
 
@@ -205,7 +263,45 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         self.items_proxy_model.setDynamicSortFilter(True)
         self.items_proxy_model.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
 
-        self.items_filter.textChanged.connect(self.items_filter_changed)
+        # Result items rows are painted by the delegate, only the
+        # visible rows are painted and get their thumbnail fetched.
+        self.result_item_delegate = ResultItemDelegate(self.result_items_view)
+        self.result_item_delegate.footprint_toggled.connect(
+            self.footprint_toggled
+        )
+        self.result_item_delegate.assets_requested.connect(
+            self.open_assets_dialog
+        )
+        self.result_item_delegate.thumbnail_requested.connect(
+            self.load_thumbnail
+        )
+        self.items_proxy_model.modelReset.connect(
+            self.result_item_delegate.clear
+        )
+        self.result_items_view.setItemDelegate(self.result_item_delegate)
+        self.result_items_view.setModel(self.items_proxy_model)
+
+        # Thumbnails are loaded off the main thread, the requests of
+        # the rows scrolled out of view or of previous pages are dropped.
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
+        self.thumbnail_loader.thumbnail_loaded.connect(
+            self.item_model.set_thumbnail
+        )
+        self.items_proxy_model.modelReset.connect(
+            self.thumbnail_loader.clear
+        )
+        scroll_bar = self.result_items_view.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self.visible_items_changed)
+        scroll_bar.rangeChanged.connect(self.visible_items_changed)
+
+        # The items filter is applied after a pause in typing
+        self.items_filter_timer = QtCore.QTimer(self)
+        self.items_filter_timer.setSingleShot(True)
+        self.items_filter_timer.setInterval(RESULT_FILTER_DELAY)
+        self.items_filter_timer.timeout.connect(self.items_filter_edited)
+        self.items_filter.textChanged.connect(self.items_filter_text_changed)
+        self.map_extent_filter.toggled.connect(self.map_extent_filter_toggled)
+        iface.mapCanvas().xyCoordinates.connect(self.map_cursor_moved)
 
         self.get_filters()
         self.prepare_plugin_settings()
@@ -227,9 +323,142 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             setting_type=bool
         )
         self.asset_loading.setChecked(auto_asset_loading)
+        self.prefetch_pages.setChecked(self.prefetch_enabled())
+        self.lean_search.setChecked(self.lean_search_enabled())
+
+        client_cache_ttl = settings_manager.get_value(
+            Settings.CLIENT_CACHE_TTL,
+            CLIENT_CACHE_TTL_DEFAULT,
+            setting_type=int
+        )
+        self.client_cache_ttl.setValue(client_cache_ttl)
+
+        http_cache_size = settings_manager.get_value(
+            Settings.HTTP_CACHE_SIZE,
+            HTTP_CACHE_SIZE_DEFAULT,
+            setting_type=int
+        )
+        self.http_cache_size.setValue(http_cache_size)
+        http_cache.configure(
+            directory=os.path.join(
+                QgsApplication.qgisSettingsDirPath(),
+                "kadas_stac",
+                "http_cache"
+            ),
+            max_disk_size=http_cache_size * 1024 * 1024
+        )
+        collection_cache.configure(
+            os.path.join(
+                QgsApplication.qgisSettingsDirPath(),
+                "kadas_stac",
+                "collections"
+            )
+        )
+        sas_signer.configure(
+            os.path.join(
+                QgsApplication.qgisSettingsDirPath(),
+                "kadas_stac",
+                "sas_tokens.json"
+            )
+        )
+
+        thumbnail_cache_size = settings_manager.get_value(
+            Settings.THUMBNAIL_CACHE_SIZE,
+            THUMBNAIL_CACHE_SIZE_DEFAULT,
+            setting_type=int
+        )
+        self.thumbnail_cache_size.setValue(thumbnail_cache_size)
+        thumbnail_cache.configure(
+            directory=os.path.join(
+                QgsApplication.qgisSettingsDirPath(),
+                "kadas_stac",
+                "thumbnails"
+            ),
+            max_disk_size=thumbnail_cache_size * 1024 * 1024
+        )
+        thumbnail_max_requests = settings_manager.get_value(
+            Settings.THUMBNAIL_MAX_REQUESTS,
+            THUMBNAIL_MAX_REQUESTS_DEFAULT,
+            setting_type=int
+        )
+        self.thumbnail_max_requests.setValue(thumbnail_max_requests)
+        self.thumbnail_loader.set_max_requests(thumbnail_max_requests)
+
+        crawler_max_requests = settings_manager.get_value(
+            Settings.CRAWLER_MAX_REQUESTS,
+            CRAWLER_MAX_REQUESTS_DEFAULT,
+            setting_type=int
+        )
+        self.crawler_max_requests.setValue(crawler_max_requests)
+
+        self.offline_index.setChecked(
+            settings_manager.get_value(
+                Settings.OFFLINE_INDEX,
+                False,
+                setting_type=bool
+            )
+        )
+        self.offline_search.setChecked(
+            settings_manager.get_value(
+                Settings.OFFLINE_SEARCH,
+                False,
+                setting_type=bool
+            )
+        )
+        self.offline_index_size.setValue(
+            settings_manager.get_value(
+                Settings.OFFLINE_INDEX_SIZE,
+                OFFLINE_INDEX_SIZE_DEFAULT,
+                setting_type=int
+            )
+        )
+        self.offline_index_max_age.setValue(
+            settings_manager.get_value(
+                Settings.OFFLINE_INDEX_MAX_AGE,
+                OFFLINE_INDEX_MAX_AGE_DEFAULT,
+                setting_type=int
+            )
+        )
+        offline_index.configure(
+            os.path.join(
+                QgsApplication.qgisSettingsDirPath(),
+                "kadas_stac",
+                "offline_index.sqlite"
+            ),
+            max_age=self.offline_index_max_age.value() * 24 * 60 * 60,
+            max_size=self.offline_index_size.value() * 1024 * 1024
+        )
 
         self.asset_loading.toggled.connect(self.update_plugin_settings)
         self.asset_loading.stateChanged.connect(self.update_plugin_settings)
+        self.prefetch_pages.toggled.connect(self.update_plugin_settings)
+        self.lean_search.toggled.connect(self.update_plugin_settings)
+        self.client_cache_ttl.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.http_cache_size.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.thumbnail_cache_size.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.thumbnail_max_requests.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.crawler_max_requests.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.offline_index.toggled.connect(self.update_plugin_settings)
+        self.offline_search.toggled.connect(self.update_plugin_settings)
+        self.offline_index_size.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.offline_index_max_age.valueChanged.connect(
+            self.update_plugin_settings
+        )
+        self.clear_http_cache_btn.clicked.connect(http_cache.clear)
+        self.clear_thumbnail_cache_btn.clicked.connect(thumbnail_cache.clear)
+        self.clear_offline_index_btn.clicked.connect(offline_index.clear_all)
 
     def update_plugin_settings(self):
         """ Makes updates to all the plugin settings
@@ -239,6 +468,65 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             Settings.AUTO_ASSET_LOADING,
             self.asset_loading.isChecked(),
         )
+        settings_manager.set_value(
+            Settings.PREFETCH_PAGES,
+            self.prefetch_pages.isChecked(),
+        )
+        if not self.prefetch_pages.isChecked():
+            self.cancel_prefetch()
+        settings_manager.set_value(
+            Settings.LEAN_SEARCH,
+            self.lean_search.isChecked(),
+        )
+        settings_manager.set_value(
+            Settings.CLIENT_CACHE_TTL,
+            self.client_cache_ttl.value(),
+        )
+        settings_manager.set_value(
+            Settings.HTTP_CACHE_SIZE,
+            self.http_cache_size.value(),
+        )
+        http_cache.configure(
+            max_disk_size=self.http_cache_size.value() * 1024 * 1024
+        )
+        settings_manager.set_value(
+            Settings.THUMBNAIL_CACHE_SIZE,
+            self.thumbnail_cache_size.value(),
+        )
+        thumbnail_cache.configure(
+            max_disk_size=self.thumbnail_cache_size.value() * 1024 * 1024
+        )
+        settings_manager.set_value(
+            Settings.THUMBNAIL_MAX_REQUESTS,
+            self.thumbnail_max_requests.value(),
+        )
+        self.thumbnail_loader.set_max_requests(
+            self.thumbnail_max_requests.value()
+        )
+        settings_manager.set_value(
+            Settings.CRAWLER_MAX_REQUESTS,
+            self.crawler_max_requests.value(),
+        )
+        settings_manager.set_value(
+            Settings.OFFLINE_INDEX,
+            self.offline_index.isChecked(),
+        )
+        settings_manager.set_value(
+            Settings.OFFLINE_SEARCH,
+            self.offline_search.isChecked(),
+        )
+        settings_manager.set_value(
+            Settings.OFFLINE_INDEX_SIZE,
+            self.offline_index_size.value(),
+        )
+        settings_manager.set_value(
+            Settings.OFFLINE_INDEX_MAX_AGE,
+            self.offline_index_max_age.value(),
+        )
+        offline_index.configure(
+            max_age=self.offline_index_max_age.value() * 24 * 60 * 60,
+            max_size=self.offline_index_size.value() * 1024 * 1024
+        )
 
     def prepare_filter_box(self):
         """ Prepares the advanced filter group box inputs
@@ -297,6 +585,8 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         )
         if reply == QtWidgets.QMessageBox.Yes:
             settings_manager.delete_connection(connection.id)
+            landing_pages.invalidate(connection.url)
+            collection_cache.remove(connection.id)
             latest_connection = settings_manager.get_latest_connection()
             settings_manager.set_current_connection(
                 latest_connection.id
@@ -328,11 +618,7 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             self.update_api_client()
             # Update the collections view to show the current connection
             # collections
-            collections = settings_manager.get_collections(
-                current_connection.id
-            )
-            self.model.removeRows(0, self.model.rowCount())
-            self.load_collections(collections)
+            self.load_connection_collections(current_connection)
             # self.handle_queryable(Queryable())
 
         self.search_btn.setEnabled(current_connection is not None)
@@ -431,13 +717,20 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         Updates the api client for the current active connection
 
         """
+        self.cancel_prefetch()
         current_connection = settings_manager.get_current_connection()
         if current_connection:
+            if self.api_client is None or \
+                    self.api_client.connection_id != str(current_connection.id):
+                self.item_index.clear()
             self.api_client = Client.from_connection_settings(
                 current_connection
             )
             if self.api_client:
                 self.api_client.items_received.connect(self.display_results)
+                self.api_client.items_batch_received.connect(
+                    self.display_items_batch
+                )
                 self.api_client.collections_received.connect(self.display_results)
                 self.api_client.queryable_received.connect(self.handle_queryable)
                 self.api_client.error_received.connect(self.display_search_error)
@@ -459,11 +752,7 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
                 self.connections_box.setCurrentIndex(current_index)
                 # Update the collections view to show the current connection
                 # collections
-                collections = settings_manager.get_collections(
-                    current_connection.id
-                )
-                self.model.removeRows(0, self.model.rowCount())
-                self.load_collections(collections)
+                self.load_connection_collections(current_connection)
             else:
                 self.connections_box.setCurrentIndex(0)
 
@@ -475,6 +764,11 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             "Searching items..."
         )
         self.page = 1
+        # A new search starts from fresh results, drop the
+        # pagination cursors and prefetched pages of the previous one.
+        self.cancel_prefetch()
+        if self.api_client:
+            pagination_cursors.invalidate(self.connection_key())
         self.search_items()
 
     def previous_items(self):
@@ -502,6 +796,36 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         search operation.
         """
         self.search_type = ResourceType.FEATURE
+        item_search = self.prepare_item_search(self.page)
+        self.current_item_search = item_search
+
+        prefetched_page = page_buffer.get(
+            self.connection_key(),
+            search_key(item_search.params()),
+            self.page
+        ) if self.prefetch_enabled() else None
+
+        self.streamed_items = []
+        # The thumbnails of the page rows are signed with the current
+        # connection signer, resolved once per page.
+        self.thumbnail_signer = href_signer()
+        self.search_start_time = time.perf_counter()
+        self.search_started.emit()
+        if prefetched_page is not None:
+            self.display_results(*prefetched_page)
+        else:
+            self.api_client.get_items(item_search)
+
+    def prepare_item_search(self, page):
+        """ Creates the items search for the passed results page
+        from the current filters on the search tab.
+
+        :param page: Results page number
+        :type page: int
+
+        :returns: Items search
+        :rtype: ItemSearch
+        """
         use_start_date = self.date_filter_group.isChecked() and \
                          not self.start_dte.dateTime().isNull()
         use_end_date = self.date_filter_group.isChecked() and \
@@ -522,12 +846,12 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
                 collection_id = collections[0]
                 try:
                     collection_settings = settings_manager.get_collection(
-                        current_connection.id,
-                        collection_id
+                        collection_id,
+                        current_connection
                     )
                     if collection_settings and hasattr(collection_settings, 'links'):
                         # Find the 'self' link
-                        for link in collection_settings.links:
+                        for link in collection_settings.links or []:
                             if hasattr(link, 'rel') and link.rel == 'self' and hasattr(link, 'href'):
                                 collection_url = link.href
                                 logger = get_logger()
@@ -562,33 +886,231 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         sort_order = SortOrder.DESCENDING \
             if self.reverse_order_box.isChecked() else SortOrder.ASCENDING
 
-        self.api_client.get_items(
-            ItemSearch(
-                collections=collections,
-                collection_url=collection_url,  # Pass collection URL for static catalogs
-                page_size=page_size,
-                page=self.page,
-                start_datetime=start_dte,
-                end_datetime=end_dte,
-                spatial_extent=spatial_extent,
-                filter_text=filter_text,
-                filter_lang=filter_lang,
-                sortby=sort_field,
-                sort_order=sort_order,
+        return ItemSearch(
+            collections=collections,
+            collection_url=collection_url,  # Pass collection URL for static catalogs
+            page_size=page_size,
+            page=page,
+            start_datetime=start_dte,
+            end_datetime=end_dte,
+            spatial_extent=spatial_extent,
+            filter_text=filter_text,
+            filter_lang=filter_lang,
+            sortby=sort_field,
+            sort_order=sort_order,
+            fields=LEAN_SEARCH_FIELDS if self.lean_search_enabled() else None,
+        )
+
+    def connection_key(self):
+        """ Returns the identifier of the current API client connection,
+        used to scope the pagination cursors and the prefetched pages.
+
+        :returns: Connection identifier
+        :rtype: str
+        """
+        if self.api_client is None:
+            return None
+        return self.api_client.connection_id or self.api_client.url
+
+    def prefetch_enabled(self):
+        """ Whether the next results pages should be prefetched.
+
+        :returns: Prefetch setting value
+        :rtype: bool
+        """
+        return settings_manager.get_value(
+            Settings.PREFETCH_PAGES,
+            False,
+            setting_type=bool
+        )
+
+    def lean_search_enabled(self):
+        """ Whether searches should request only the result list fields.
+
+        :returns: Lean search setting value
+        :rtype: bool
+        """
+        return settings_manager.get_value(
+            Settings.LEAN_SEARCH,
+            True,
+            setting_type=bool
+        )
+
+    def prefetch_next_page(self, results, pagination):
+        """ Keeps the displayed results page in the page buffer and
+        starts fetching the next page in the background.
+
+        :param results: Displayed page items
+        :type results: list
+
+        :param pagination: Displayed page pagination details
+        :type pagination: ResourcePagination
+        """
+        item_search = self.current_item_search
+        if not self.prefetch_enabled() or \
+                item_search is None or \
+                pagination is None or \
+                self.api_client is None:
+            return
+        connection_key = self.connection_key()
+        key = search_key(item_search.params())
+        page_buffer.put(connection_key, key, self.page, results, pagination)
+
+        next_page = pagination.next_page
+        if not next_page or \
+                page_buffer.get(connection_key, key, next_page) is not None:
+            return
+        next_search = dataclasses.replace(item_search, page=next_page)
+        self.api_client.prefetch_items(
+            next_search,
+            partial(
+                self.handle_prefetched_page,
+                connection_key,
+                key,
+                next_page,
+                self.prefetch_generation
             )
         )
-        self.search_started.emit()
+
+    def handle_prefetched_page(
+            self,
+            connection_key,
+            key,
+            page,
+            generation,
+            results,
+            pagination
+    ):
+        """ Stores the prefetched results page in the page buffer, pages
+        prefetched before the last filters or connection change are ignored.
+        """
+        if generation != self.prefetch_generation:
+            return
+        if not results or (pagination and pagination.total_pages > 0):
+            return
+        page_buffer.put(connection_key, key, page, results, pagination)
+
+    def cancel_prefetch(self):
+        """ Cancels the running page prefetch and drops the prefetched pages.
+        """
+        self.prefetch_generation += 1
+        if self.api_client is not None:
+            self.api_client.cancel_prefetch()
+        page_buffer.clear()
 
     def fetch_collections(self):
         """ Fetches the collections available on the current
-            STAC API connection.
+            STAC API connection. The cached collections are shown
+            immediately and revalidated in the background.
         """
+        connection = settings_manager.get_current_connection()
+        if connection is not None and \
+                self.show_cached_collections(connection):
+            self.refresh_collections(connection)
+            return
+
         self.search_type = ResourceType.COLLECTION
         self.current_progress_message = tr("Fetching collections...")
 
         self.api_client.get_collections()
         self.search_started.emit()
 
+    def load_connection_collections(self, connection):
+        """ Shows the collections of the passed connection, from the
+        collections cache when available, otherwise from the plugin settings.
+        Cached collections are revalidated once in the background.
+
+        :param connection: Connection settings
+        :type connection: ConnectionSettings
+        """
+        if self.show_cached_collections(connection):
+            if connection.id not in self.revalidated_collections:
+                self.refresh_collections(connection)
+            return
+        collections = settings_manager.get_collections(connection.id)
+        self.model.removeRows(0, self.model.rowCount())
+        self.load_collections(collections)
+
+    def show_cached_collections(self, connection):
+        """ Shows the cached collections of the passed connection.
+
+        :param connection: Connection settings
+        :type connection: ConnectionSettings
+
+        :returns: Whether the connection collections were cached
+        :rtype: bool
+        """
+        documents = collection_cache.get(connection.id)
+        if documents is None:
+            return False
+        self.current_collections = [
+            Collection.from_dict(document) for document in documents
+        ]
+        self.load_collections(self.current_collections)
+        return True
+
+    def refresh_collections(self, connection):
+        """ Revalidates the cached collections of the passed connection
+        in a background task.
+
+        :param connection: Connection settings
+        :type connection: ConnectionSettings
+        """
+        if self.api_client is None or \
+                self.api_client.connection_id != str(connection.id) or \
+                self.collections_refresh_connection == connection.id:
+            return
+        self.collections_refresh_connection = connection.id
+        self.revalidated_collections.add(connection.id)
+        self.api_client.refresh_collections(
+            partial(self.collections_refreshed, connection.id),
+            partial(self.collections_refresh_error, connection.id)
+        )
+
+    def collections_refreshed(self, connection_id, collections, pagination):
+        """ Updates the collections view when the revalidated
+        collections listing differs from the displayed one.
+
+        :param connection_id: Identifier of the refreshed connection
+        :type connection_id: uuid.UUID
+
+        :param collections: Fetched collections
+        :type collections: list
+
+        :param pagination: Pagination details
+        :type pagination: ResourcePagination
+        """
+        self.collections_refresh_connection = None
+        current_connection = settings_manager.get_current_connection()
+        if current_connection is None or current_connection.id != connection_id:
+            return
+        added, removed = diff_collections(self.current_collections, collections)
+        self.current_collections = collections
+        if not added and not removed:
+            log("Collections are up to date")
+            return
+        self.load_collections(collections)
+        self.save_filters(collections=collections)
+        self.show_message(
+            tr(
+                "Collections updated, {} added and {} removed"
+            ).format(len(added), len(removed)),
+            level=Qgis.Info
+        )
+
+    def collections_refresh_error(self, connection_id, message):
+        """ Logs a failed collections revalidation, the cached
+        collections stay displayed.
+
+        :param connection_id: Identifier of the refreshed connection
+        :type connection_id: uuid.UUID
+
+        :param message: Error message
+        :type message: str
+        """
+        self.collections_refresh_connection = None
+        log(f"Collections refresh failed: {message}")
+
     def show_message(
             self,
             message,
@@ -760,13 +1282,15 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
                             len(results)
                         )
                     )
-                    self.item_model = ItemsModel(results)
-                    self.items_proxy_model.setSourceModel(self.item_model)
-                    settings_manager.delete_all_items(
-                        settings_manager.get_current_connection(),
-                        self.page
-                    )
-                    self.populate_results(results)
+                    self.item_index.add_items(results)
+                    if self.streamed_items == results:
+                        # Items are already displayed by the streamed batches
+                        self.result_items = results
+                    else:
+                        self.populate_results(results)
+                    if self.map_extent_filter.isChecked():
+                        self.items_filter_changed(self.items_filter.text())
+                    self.prefetch_next_page(results, pagination)
                 else:
 
                     self.clear_search_results()
@@ -795,13 +1319,56 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
                 self.all_footprints_btn.setEnabled(
                     len(self.result_items) > 0
                 )
+                self.search_footprints_btn.setEnabled(
+                    len(self.result_items) > 0 or
+                    self.search_footprints_running
+                )
                 self.footprint_items = {}
             self.container.setCurrentIndex(1)
+            self.streamed_items = []
+            if self.search_start_time is not None:
+                log(
+                    tr("Search completed in {:.0f} ms").format(
+                        (time.perf_counter() - self.search_start_time) * 1000
+                    ),
+                    notify=False
+                )
+                self.search_start_time = None
 
         else:
             raise NotImplementedError
         self.search_completed.emit()
 
+    def display_items_batch(self, items):
+        """ Appends a streamed batch of search results items to the
+        results view, while the search is still running.
+
+        :param items: Prepared search results items
+        :type items: list
+        """
+        # Batches arriving after the search results display are ignored
+        if self.search_type != ResourceType.FEATURE or \
+                self.search_start_time is None or not items:
+            return
+        if not self.streamed_items:
+            self.item_model.set_items([])
+            self.container.setCurrentIndex(1)
+            log(
+                tr("Time to first result: {:.0f} ms").format(
+                    (time.perf_counter() - self.search_start_time) * 1000
+                ),
+                notify=False
+            )
+        self.streamed_items = self.streamed_items + items
+        self.item_index.add_items(items)
+        self.item_model.add_items(items)
+        self.result_items_la.setText(
+            tr("Loading page {} of results, {} item(s)...").format(
+                self.page,
+                len(self.streamed_items)
+            )
+        )
+
     def display_search_error(self, message):
         """
         Shows the search error message.
@@ -823,51 +1390,29 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             self.display_results(items)
 
     def populate_results(self, results):
-        """ Add the found results into the widget scroll area.
+        """ Shows the found results in the results list view.
 
         :param results: List of items results
         :type results: list
         """
 
         self.result_items = results
-        scroll_container = QtWidgets.QWidget()
-        layout = QtWidgets.QVBoxLayout()
-        layout.setContentsMargins(1, 1, 1, 1)
-        layout.setSpacing(1)
-        for result in results:
-            search_result_widget = ResultItemWidget(
-                result,
-                main_widget=self,
-                parent=self
-            )
-            footprint_selected_partial = partial(
-                self.footprint_selected,
-                result
-            )
-            footprint_deselected_partial = partial(
-                self.footprint_deselected,
-                result
-            )
-            search_result_widget.footprint_selected.connect(
-                footprint_selected_partial
-            )
-            search_result_widget.footprint_deselected.connect(
-                footprint_deselected_partial
-            )
+        self.item_model.set_items(results)
 
-            layout.addWidget(search_result_widget)
-            layout.setAlignment(search_result_widget, QtCore.Qt.AlignTop)
-        vertical_spacer = QtWidgets.QSpacerItem(
-            20,
-            40,
-            QtWidgets.QSizePolicy.Minimum,
-            QtWidgets.QSizePolicy.Expanding
-        )
-        layout.addItem(vertical_spacer)
-        scroll_container.setLayout(layout)
-        self.scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.scroll_area.setWidgetResizable(True)
-        self.scroll_area.setWidget(scroll_container)
+    def footprint_toggled(self, item, checked):
+        """ Updates the list of the footprints to be added after an
+        item footprint box has been toggled.
+
+        :param item: Search result item
+        :type item: ItemView
+
+        :param checked: Whether the footprint box is checked
+        :type checked: bool
+        """
+        if checked:
+            self.footprint_selected(item)
+        else:
+            self.footprint_deselected(item)
 
     def footprint_selected(self, item):
         """ Adds the passed item to the list of the
@@ -885,7 +1430,7 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         """ Removes the passed item from the  list of the
         footprints to be added.
         """
-        self.footprint_items.pop(item.id)
+        self.footprint_items.pop(item.id, None)
         self.footprint_btn.setText(
             f"Add the selected footprint(s) ({len(self.footprint_items.items())})"
         ) if self.footprint_items else \
@@ -896,39 +1441,253 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
             len(self.footprint_items.items()) > 0
         )
 
-    def footprint_btn_clicked(self):
-        """ Adds selected footprints as map layers."""
-        for key, item in self.footprint_items.items():
-            try:
-                footprint_task = QgsTask.fromFunction(
-                    'Add footprints',
-                    add_footprint_helper(item, self)
-                )
-                QgsApplication.taskManager().addTask(footprint_task)
-            except Exception as err:
-                log(
-                    tr("Error loading item footprint {}, {}".
-                       format(item.id, err))
+    def load_thumbnail(self, item):
+        """ Requests the thumbnail of a result item whose row has been
+        painted, from the thumbnails cache or else from its URL.
+
+        :param item: Search result item
+        :type item: ItemView
+        """
+        if self.thumbnail_loader.pending(item.item_uuid):
+            return
+        cache_url = item_thumbnail_url(item)
+        if not cache_url:
+            self.item_model.set_thumbnail(item.item_uuid, QtGui.QPixmap())
+            return
+        self.thumbnail_loader.load(
+            item.item_uuid,
+            cache_url,
+            signer=self.thumbnail_signer
+        )
+
+    def visible_items_changed(self):
+        """ Cancels the thumbnail requests of the result items rows
+        that are no longer visible in the results view.
+        """
+        view = self.result_items_view
+        viewport = view.viewport().rect()
+        first_index = view.indexAt(
+            QtCore.QPoint(viewport.center().x(), viewport.top())
+        )
+        last_index = view.indexAt(
+            QtCore.QPoint(viewport.center().x(), viewport.bottom())
+        )
+        visible_items = set()
+        if first_index.isValid():
+            last_row = last_index.row() if last_index.isValid() \
+                else self.items_proxy_model.rowCount() - 1
+            for row in range(first_index.row(), last_row + 1):
+                item = self.items_proxy_model.index(row, 0).data(
+                    ItemsModel.ItemRole
                 )
+                visible_items.add(item.item_uuid)
+        self.thumbnail_loader.retain(visible_items)
+
+    def open_assets_dialog(self, item):
+        """  Opens the assets dialog for the STAC item.
+            Items returned by lean searches only carry the result list
+            fields, their full document is fetched first.
+
+        :param item: Search result item
+        :type item: ItemView
+        """
+        item_href = item.self_href if item.lean else None
+
+        if item_href and self.api_client is not None:
+            self.update_inputs(False)
+            self.api_client.get_full_item(
+                item_href,
+                partial(self.full_item_received, item),
+                partial(self.full_item_error, item)
+            )
+        else:
+            self.show_assets_dialog(item)
+
+    def full_item_received(self, result_item, item, pagination):
+        """ Callback to handle the full item of a lean search result,
+        updates the item assets and opens the assets dialog.
+
+        :param result_item: Lean search result item
+        :type result_item: ItemView
+
+        :param item: Prepared full item
+        :type item: ItemView
+
+        :param pagination: Pagination details
+        :type pagination: ResourcePagination
+        """
+        self.update_inputs(True)
+        if item is not None:
+            result_item.update(item.feature)
+            settings_manager.update_items([result_item])
+        self.show_assets_dialog(result_item)
+
+    def full_item_error(self, item, message):
+        """ Callback to handle a failed full item fetch, the assets
+        dialog is opened with the assets returned by the lean search.
+
+        :param item: Lean search result item
+        :type item: ItemView
+
+        :param message: Error message
+        :type message: str
+        """
+        log(message)
+        self.update_inputs(True)
+        self.show_assets_dialog(item)
+
+    def show_assets_dialog(self, item):
+        """  Shows the assets dialog for the STAC item.
+
+        :param item: Search result item
+        :type item: ItemView
+        """
+        assets_dialog = AssetsDialog(
+            item,
+            parent=self,
+            main_widget=self
+        )
+        assets_dialog.exec_()
+
+    def update_inputs(self, enabled):
+        """ Updates the results view state while the item assets
+        are being fetched or loaded.
+
+        :param enabled: Whether to enable the results view or disable it.
+        :type enabled: bool
+        """
+        self.result_items_view.setEnabled(enabled)
+
+    def footprint_btn_clicked(self):
+        """ Adds the selected footprints to the footprints layer."""
+        self.add_footprints(list(self.footprint_items.values()))
 
     def all_footprints_btn_clicked(self):
-        """ Adds all footprints for the current page items as map layers."""
-        for item in self.result_items:
-            try:
-                footprint_task = QgsTask.fromFunction(
-                    'Add footprint',
-                    add_footprint_helper(item, self)
-                )
-                QgsApplication.taskManager().addTask(footprint_task)
-            except Exception as err:
-                log(
-                    tr("Error loading item footprint {}, {}".
-                       format(item.id, err))
-                )
+        """ Adds the footprints of the current page items to the
+        footprints layer."""
+        self.add_footprints(self.result_items)
+
+    def add_footprints(self, items):
+        """ Adds the items footprints to the session footprints layer,
+        the footprints already in the layer are not added again.
+
+        :param items: Search result items
+        :type items: list
+        """
+        if self.api_client is None:
+            return
+        connection = settings_manager.get_current_connection()
+        self.footprint_store.add_items(
+            self.connection_key(),
+            connection.name,
+            items
+        )
+
+    def footprints_added(self, layer_name, count):
+        """ Notifies that footprints have been added to a layer.
+
+        :param layer_name: Footprints layer name
+        :type layer_name: str
+
+        :param count: Number of added footprints
+        :type count: int
+        """
+        message = tr(
+            "Added {} footprint(s) to the layer {}."
+        ).format(count, layer_name) if count else tr(
+            "The footprints are already in the layer {}."
+        ).format(layer_name)
+        self.show_message(message, level=Qgis.Info)
+
+    def search_footprints_btn_clicked(self):
+        """ Adds the footprints of all the result pages of the current
+        search to the footprints layer. The pages are fetched one after
+        the other and only their footprints are kept. Cancels the pages
+        walk when it is running.
+        """
+        if self.search_footprints_running:
+            self.search_footprints_canceled = True
+            self.search_footprints_btn.setEnabled(False)
+            self.api_client.cancel_all_items()
+            return
+        if self.current_item_search is None or self.api_client is None:
+            return
+        connection = settings_manager.get_current_connection()
+        self.search_footprints_running = True
+        self.search_footprints_canceled = False
+        self.search_footprints_btn.setText(
+            tr("Cancel adding the search footprints")
+        )
+        self.api_client.get_all_items(
+            dataclasses.replace(self.current_item_search, page=1),
+            partial(
+                self.footprint_store.add_page,
+                self.connection_key(),
+                connection.name
+            ),
+            self.search_footprints_fetched,
+            self.search_footprints_error
+        )
+
+    def search_footprints_fetched(self, items, pagination):
+        """ Notifies that the footprints of all the search result pages
+        have been added.
+
+        :param items: Items left after the pages, usually empty
+        :type items: list
+
+        :param pagination: Walked pages details
+        :type pagination: ResourcePagination
+        """
+        self.search_footprints_finished()
+        self.show_message(
+            tr(
+                "Added the footprints of {} result page(s), the layer {} "
+                "has {} footprint(s)."
+            ).format(
+                pagination.total_pages if pagination else 1,
+                self.footprint_store.layer_name,
+                len(self.footprint_store)
+            ),
+            level=Qgis.Info
+        )
+
+    def search_footprints_error(self, message):
+        """ Shows the error of the search footprints fetch, or that
+        it has been canceled.
+
+        :param message: Error message
+        :type message: str
+        """
+        canceled = self.search_footprints_canceled
+        self.search_footprints_finished()
+        if canceled:
+            self.show_message(
+                tr(
+                    "Canceled adding the search footprints, the layer {} "
+                    "has {} footprint(s)."
+                ).format(
+                    self.footprint_store.layer_name,
+                    len(self.footprint_store)
+                ),
+                level=Qgis.Info
+            )
+            return
+        log(message)
+        self.show_message(message)
+
+    def search_footprints_finished(self):
+        """ Enables adding the search footprints again."""
+        self.search_footprints_running = False
+        self.search_footprints_canceled = False
+        self.search_footprints_btn.setText(
+            tr("Add the search footprints")
+        )
+        self.search_footprints_btn.setEnabled(len(self.result_items) > 0)
 
     def clear_search_results(self):
         """ Clear current search results from the UI"""
-        self.scroll_area.setWidget(QtWidgets.QWidget())
+        self.item_model.set_items([])
         self.result_items_la.clear()
         self.result_items = []
 
@@ -955,19 +1714,99 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
         :param filter_text: Filter text
         :type: str
         """
-        # TODO update to use QtCore.QRegExp, QRegularExpression will be
-        # deprecated.
-        options = QtCore.QRegularExpression.NoPatternOption
-        options |= QtCore.QRegularExpression.CaseInsensitiveOption
-        regular_expression = QtCore.QRegularExpression(filter_text, options)
-        self.items_proxy_model.setFilterRegularExpression(regular_expression)
+        self.items_proxy_model.set_filter(
+            filter_text,
+            self.items_in_map_extent()
+            if self.map_extent_filter.isChecked() else None
+        )
+
+    def items_filter_text_changed(self, filter_text):
+        """ Restarts the items filter delay after each edit of the
+        filter text.
+
+        :param filter_text: Filter text
+        :type: str
+        """
+        self.items_filter_timer.start()
+
+    def items_filter_edited(self):
+        """ Applies the items filter once the filter text has not
+        changed during the filter delay.
+        """
+        self.items_filter_changed(self.items_filter.text())
 
-        filtered_data = []
-        for index in range(0, self.items_proxy_model.rowCount()):
-            model_index = self.items_proxy_model.index(index, 0)
-            filtered_data.append(self.items_proxy_model.data(model_index))
+    def map_extent_filter_toggled(self, checked):
+        """ Filters the results items to the ones whose footprint
+        intersects the map canvas extent, the filter follows the canvas
+        extent changes while enabled.
 
-        self.populate_results(filtered_data)
+        :param checked: Whether the map extent filter is enabled
+        :type checked: bool
+        """
+        map_canvas = iface.mapCanvas()
+        if checked:
+            map_canvas.extentsChanged.connect(self.map_extent_changed)
+        else:
+            try:
+                map_canvas.extentsChanged.disconnect(self.map_extent_changed)
+            except TypeError:
+                pass
+        self.items_filter_changed(self.items_filter.text())
+
+    def map_extent_changed(self):
+        """ Applies the map extent filter to the results items."""
+        self.items_filter_changed(self.items_filter.text())
+
+    def items_in_map_extent(self):
+        """ Returns the identifiers of the fetched items whose
+        footprint intersects the map canvas extent.
+
+        :returns: Items identifiers, None when the extent cannot be
+        transformed to EPSG:4326 and the items are not filtered
+        :rtype: set
+        """
+        map_canvas = iface.mapCanvas()
+        try:
+            extent = self.canvas_transform().transformBoundingBox(
+                map_canvas.extent()
+            )
+        except QgsCsException as e:
+            log(tr("Map extent filter not applied, {}").format(str(e)))
+            return None
+        return {
+            item.item_uuid for item in self.item_index.items_in_extent(extent)
+        }
+
+    def map_cursor_moved(self, point):
+        """ Highlights the results items whose footprint is under
+        the map canvas cursor.
+
+        :param point: Cursor position in the map canvas CRS
+        :type point: QgsPointXY
+        """
+        if not self.item_model.rowCount() or not self.isVisible():
+            return
+        try:
+            point = self.canvas_transform().transform(point)
+        except QgsCsException:
+            self.item_model.set_highlighted(set())
+            return
+        self.item_model.set_highlighted(
+            {item.item_uuid for item in self.item_index.items_at(point)}
+        )
+
+    def canvas_transform(self):
+        """ Returns the transform from the map canvas CRS to the
+        EPSG:4326 CRS of the items index.
+
+        :returns: Coordinate transform
+        :rtype: QgsCoordinateTransform
+        """
+        return QgsCoordinateTransform(
+            iface.mapCanvas().mapSettings().destinationCrs(),
+            QgsCoordinateReferenceSystem("EPSG:4326"),
+            QgsProject.instance()
+        )
 
     def populate_sorting_field(self):
         """" Initializes sorting field combo box list items"""
@@ -1082,6 +1921,7 @@ class KadasStacWidget(QtWidgets.QWidget, WidgetUi):
 
     def save_filters(self, collections=None):
         """ Save search filters fetched from the corresponding UI inputs """
+        self.cancel_prefetch()
         filter_lang = self.filter_lang_cmb.itemData(
             self.filter_lang_cmb.currentIndex()
         )
@@ -0,0 +1,473 @@
+# -*- coding: utf-8 -*-
+"""
+    Result item delegate, paints the search result items rows of the
+    results list view.
+
+    Only the rows visible in the view are painted, the thumbnail of an
+    item is requested when its row is painted without thumbnail.
+"""
+
+import datetime
+import os
+
+from functools import partial
+
+from qgis.PyQt import (
+    QtCore,
+    QtGui,
+    QtWidgets,
+)
+
+try:
+    import urlparse
+    from urllib import urlencode
+except: # For Python 3
+    import urllib.parse as urlparse
+    from urllib.parse import urlencode
+
+from ..utils import tr
+from ..definitions import constants
+from ..definitions.constants import SAS_SUBSCRIPTION_VARIABLE
+
+from ..api.models import (
+    ApiCapability,
+    AssetRoles,
+)
+from ..api.sas_signer import sas_signer
+
+from ..conf import settings_manager
+
+from .result_item_model import ItemsModel
+
+def item_thumbnail_href(item):
+    """ Returns the href of the item thumbnail asset, or of the item
+    overview asset when the item has no thumbnail.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :returns: Asset href, None when the item has neither asset
+    :rtype: str
+    """
+    return item.asset_href(AssetRoles.THUMBNAIL.value) or \
+        item.asset_href(AssetRoles.OVERVIEW.value)
+
+
+def item_thumbnail_url(item, signer=None):
+    """ Returns the URL used to fetch the item thumbnail, the
+    overview is requested at the thumbnail size.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :param signer: Signs the SAS based URL, see href_signer()
+    :type signer: Callable
+
+    :returns: Thumbnail URL, None when the item has no thumbnail
+    :rtype: str
+    """
+    thumbnail_url = item.asset_href(AssetRoles.THUMBNAIL.value)
+    if thumbnail_url:
+        return sign_asset_href(thumbnail_url, signer)
+
+    overview_url = item.asset_href(AssetRoles.OVERVIEW.value)
+    if not overview_url:
+        return None
+    params = {
+        constants.THUMBNAIL_HEIGHT_PARAM:
+            constants.THUMBNAIL_HEIGHT,
+        constants.THUMBNAIL_WIDTH_PARAM:
+            constants.THUMBNAIL_WIDTH,
+    }
+    overview_url = sign_asset_href(overview_url, signer)
+    return append_url_params(overview_url, params)
+
+
+def sign_asset_href(asset_href, signer=None):
+    """ Signs the SAS based asset href.
+
+    :param asset_href: Asset resource href
+    :type asset_href: str
+
+    :param signer: Function signing the href, resolved once by the
+    caller with href_signer()
+    :type signer: Callable
+
+    :returns Signed href or same href if not signing is required
+    :rtype str
+    """
+    # Hrefs of the result pages are signed when they are fetched
+    if signer is None or sas_signer.signed(asset_href):
+        return asset_href
+
+    return signer(asset_href)
+
+
+def href_signer():
+    """ Returns the function signing the asset hrefs of the current
+    connection, the function can be called from worker threads.
+
+    :returns: Function signing an href, None when the current
+    connection hrefs are not signed
+    :rtype: Callable
+    """
+    connection = settings_manager.get_current_connection()
+
+    if connection and \
+            connection.capability == ApiCapability.SUPPORT_SAS_TOKEN:
+        # If the plugin defined connection sas subscription key
+        # exists use it instead of the environment one.
+        sas_key = connection.sas_subscription_key \
+            if connection.sas_subscription_key \
+            else os.getenv(SAS_SUBSCRIPTION_VARIABLE)
+
+        return partial(sas_signer.sign, subscription_key=sas_key)
+
+    return None
+
+
+def append_url_params(url, params):
+    """ Appends the passed params into the url.
+    :param url: HTTP URL
+    :type url: str
+
+    :param url: URL params
+    :type url: dict
+
+    :returns New url updated with params
+    :rtype str
+    """
+    parts = list(urlparse.urlparse(url))
+
+    query = urlparse.parse_qsl(parts[4])
+    query += params.items()
+
+    parts[4] = urlencode(query)
+
+    return urlparse.urlunparse(parts)
+
+
+def item_texts(item):
+    """ Returns the texts shown in the item row.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :returns: The collection label, acquisition date and cloud cover
+    texts, the texts that are not available are None
+    :rtype: tuple
+    """
+    datetime_str = None
+    if item.properties and \
+            item.properties.start_date and \
+            item.properties.end_date:
+
+        start_date = datetime.datetime.strftime(
+            item.properties.start_date,
+            constants.RESULT_DATE_FORMAT
+        )
+        end_date = datetime.datetime.strftime(
+            item.properties.end_date,
+            constants.RESULT_DATE_FORMAT
+        )
+
+        datetime_str = f"{start_date} - {end_date}"
+
+    elif item.properties and \
+            item.properties.resource_datetime:
+
+        datetime_str = datetime.datetime.strftime(
+            item.properties.resource_datetime,
+            constants.RESULT_DATE_FORMAT
+        )
+
+    cloud_cover_str = None
+    if item.properties.eo_cloud_cover:
+        cloud_cover = round(
+            item.properties.eo_cloud_cover,
+            2)
+
+        cloud_cover_integer = int(cloud_cover)
+
+        cloud_cover = cloud_cover_integer \
+            if cloud_cover == cloud_cover_integer \
+            else cloud_cover
+
+        cloud_cover_str = tr("Cloud cover: {}%").format(cloud_cover)
+
+    # Get item collection name if catalogs collections have been stored
+    # in the plugin catalog connection settings.
+    collection = settings_manager.get_collection(
+        collection_id=item.collection,
+        connection=settings_manager.get_current_connection()
+    )
+
+    collection_label = collection.title \
+        if collection else item.collection
+
+    return collection_label, datetime_str, cloud_cover_str
+
+
+class ResultItemDelegate(QtWidgets.QStyledItemDelegate):
+    """
+     Paints the search result items, their properties, thumbnail,
+     footprint selection box and assets button, and handles the clicks
+     on the box and the button.
+    """
+
+    footprint_toggled = QtCore.pyqtSignal(object, bool)
+    assets_requested = QtCore.pyqtSignal(object)
+    thumbnail_requested = QtCore.pyqtSignal(object)
+
+    margin = 8
+    spacing = 4
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.texts = {}
+
+    def clear(self):
+        """ Drops the rows texts of the previous results, called when
+        the view model is reset.
+        """
+        self.texts.clear()
+
+    def sizeHint(self, option, index):
+        return QtCore.QSize(
+            option.rect.width(),
+            constants.RESULT_THUMBNAIL_SIZE + 2 * self.margin
+        )
+
+    def thumbnail_rect(self, rect):
+        """ Returns the thumbnail area of the row rectangle."""
+        size = constants.RESULT_THUMBNAIL_SIZE
+        return QtCore.QRect(
+            rect.right() - self.margin - size,
+            rect.top() + self.margin,
+            size,
+            size
+        )
+
+    def control_rects(self, option):
+        """ Returns the footprint box and the assets button rectangles
+        of the row.
+        """
+        style = self.style(option)
+        metrics = option.fontMetrics
+        thumbnail_rect = self.thumbnail_rect(option.rect)
+
+        button_option = QtWidgets.QStyleOptionButton()
+        button_option.text = tr("View assets")
+        button_size = style.sizeFromContents(
+            QtWidgets.QStyle.CT_PushButton,
+            button_option,
+            QtCore.QSize(
+                metrics.horizontalAdvance(button_option.text),
+                metrics.height()
+            ),
+            option.widget
+        )
+        button_rect = QtCore.QRect(
+            QtCore.QPoint(0, 0),
+            button_size
+        )
+        button_rect.moveBottomRight(
+            QtCore.QPoint(
+                thumbnail_rect.left() - self.margin,
+                option.rect.bottom() - self.margin
+            )
+        )
+
+        box_option = QtWidgets.QStyleOptionButton()
+        box_option.text = tr("Select footprint")
+        box_size = style.sizeFromContents(
+            QtWidgets.QStyle.CT_CheckBox,
+            box_option,
+            QtCore.QSize(
+                metrics.horizontalAdvance(box_option.text),
+                metrics.height()
+            ),
+            option.widget
+        )
+        box_rect = QtCore.QRect(
+            QtCore.QPoint(0, 0),
+            box_size
+        )
+        box_rect.moveBottomRight(
+            QtCore.QPoint(
+                button_rect.left() - self.margin,
+                button_rect.center().y() + box_size.height() // 2
+            )
+        )
+        return box_rect, button_rect
+
+    @staticmethod
+    def style(option):
+        return option.widget.style() \
+            if option.widget else QtWidgets.QApplication.style()
+
+    def paint(self, painter, option, index):
+        item = index.data(ItemsModel.ItemRole)
+        if item is None:
+            return
+        option = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(option, index)
+        style = self.style(option)
+
+        painter.save()
+        style.drawPrimitive(
+            QtWidgets.QStyle.PE_PanelItemViewItem,
+            option,
+            painter,
+            option.widget
+        )
+        if index.data(ItemsModel.HighlightRole) and \
+                not option.state & QtWidgets.QStyle.State_Selected:
+            # The item footprint is under the map canvas cursor
+            highlight = option.palette.color(QtGui.QPalette.Highlight)
+            highlight.setAlpha(64)
+            painter.fillRect(option.rect, highlight)
+        painter.setPen(option.palette.color(QtGui.QPalette.Mid))
+        painter.drawLine(option.rect.bottomLeft(), option.rect.bottomRight())
+
+        texts = self.texts.get(item.item_uuid)
+        if texts is None:
+            texts = item_texts(item)
+            self.texts[item.item_uuid] = texts
+        collection_label, datetime_str, cloud_cover_str = texts
+
+        thumbnail_rect = self.thumbnail_rect(option.rect)
+        text_color = option.palette.color(
+            QtGui.QPalette.HighlightedText
+            if option.state & QtWidgets.QStyle.State_Selected
+            else QtGui.QPalette.Text
+        )
+        painter.setPen(text_color)
+        left = option.rect.left() + self.margin
+        width = thumbnail_rect.left() - self.margin - left
+        top = option.rect.top() + self.margin
+
+        title_font = QtGui.QFont(option.font)
+        title_font.setPointSizeF(title_font.pointSizeF() * 1.2)
+        title_font.setBold(True)
+        lines = [(title_font, item.id)]
+        lines += [
+            (option.font, text)
+            for text in (
+                collection_label,
+                tr("Date acquired: {}").format(datetime_str)
+                if datetime_str else None,
+                cloud_cover_str,
+            )
+            if text
+        ]
+        for font, text in lines:
+            metrics = QtGui.QFontMetrics(font)
+            painter.setFont(font)
+            painter.drawText(
+                QtCore.QRect(left, top, width, metrics.height()),
+                QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter,
+                metrics.elidedText(text, QtCore.Qt.ElideRight, width)
+            )
+            top += metrics.height() + self.spacing
+        painter.setFont(option.font)
+
+        pixmap = index.data(QtCore.Qt.DecorationRole)
+        if pixmap is not None and not pixmap.isNull():
+            target = QtCore.QRect(
+                QtCore.QPoint(0, 0),
+                pixmap.size().scaled(
+                    thumbnail_rect.size(),
+                    QtCore.Qt.KeepAspectRatio
+                )
+            )
+            target.moveCenter(thumbnail_rect.center())
+            painter.drawPixmap(target, pixmap)
+        else:
+            thumbnail_text = tr("Thumbnail not available")
+            if pixmap is None and item_thumbnail_href(item):
+                thumbnail_text = tr("Loading thumbnail...")
+                self.thumbnail_requested.emit(item)
+            painter.drawText(
+                thumbnail_rect,
+                QtCore.Qt.AlignCenter | QtCore.Qt.TextWordWrap,
+                thumbnail_text
+            )
+
+        box_rect, button_rect = self.control_rects(option)
+        enabled = option.state & QtWidgets.QStyle.State_Enabled
+
+        box_option = QtWidgets.QStyleOptionButton()
+        box_option.rect = box_rect
+        box_option.text = tr("Select footprint")
+        box_option.palette = option.palette
+        box_option.state = QtWidgets.QStyle.State_On \
+            if index.data(QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked \
+            else QtWidgets.QStyle.State_Off
+        if enabled and item.geometry is not None:
+            box_option.state |= QtWidgets.QStyle.State_Enabled
+        style.drawControl(
+            QtWidgets.QStyle.CE_CheckBox,
+            box_option,
+            painter,
+            option.widget
+        )
+
+        button_option = QtWidgets.QStyleOptionButton()
+        button_option.rect = button_rect
+        button_option.text = tr("View assets")
+        button_option.palette = option.palette
+        button_option.state = QtWidgets.QStyle.State_Raised
+        if enabled and (item.lean or bool(item.feature.get("assets"))):
+            button_option.state |= QtWidgets.QStyle.State_Enabled
+        style.drawControl(
+            QtWidgets.QStyle.CE_PushButton,
+            button_option,
+            painter,
+            option.widget
+        )
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != QtCore.QEvent.MouseButtonRelease or \
+                event.button() != QtCore.Qt.LeftButton:
+            return super().editorEvent(event, model, option, index)
+        item = index.data(ItemsModel.ItemRole)
+        if item is None:
+            return False
+        box_rect, button_rect = self.control_rects(option)
+
+        if box_rect.contains(event.pos()) and item.geometry is not None:
+            checked = index.data(QtCore.Qt.CheckStateRole) != \
+                QtCore.Qt.Checked
+            model.setData(
+                index,
+                QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked,
+                QtCore.Qt.CheckStateRole
+            )
+            self.footprint_toggled.emit(item, checked)
+            return True
+
+        if button_rect.contains(event.pos()) and \
+                (item.lean or bool(item.feature.get("assets"))):
+            self.assets_requested.emit(item)
+            return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QtCore.QEvent.ToolTip:
+            box_rect, button_rect = self.control_rects(option)
+            tooltip = None
+            if box_rect.contains(event.pos()):
+                tooltip = tr(
+                    "Select footprint and add it to the list "
+                    "of footprints to be added."
+                )
+            elif button_rect.contains(event.pos()):
+                tooltip = tr("View the item assets on a another dialog.")
+            if tooltip:
+                QtWidgets.QToolTip.showText(event.globalPos(), tooltip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
@@ -8,13 +8,153 @@ from qgis.PyQt import (
     QtWidgets
 )
 
+from ..definitions.constants import (
+    RESULT_DATE_FORMAT,
+    RESULT_FILTER_PROPERTIES,
+)
+
+DATETIME_PROPERTIES = (
+    "datetime",
+    "start_datetime",
+    "end_datetime",
+    "start_date",
+    "end_date",
+)
+
+
+def item_search_text(item) -> str:
+    """ Returns the lower case text matched by the results filter,
+    the item id, collection, dates and filter properties values
+    separated by new lines.
+
+    :param item: Search result item
+    :type item: ItemView
+
+    :returns: Item search text
+    :rtype: str
+    """
+    properties = item.feature.get("properties") or {}
+    values = [item.id, item.collection]
+    values += [properties.get(name) for name in DATETIME_PROPERTIES]
+    if item.properties.resource_datetime:
+        values.append(
+            item.properties.resource_datetime.strftime(RESULT_DATE_FORMAT)
+        )
+    for name in RESULT_FILTER_PROPERTIES:
+        value = properties.get(name)
+        if isinstance(value, (list, tuple)):
+            values.extend(value)
+        else:
+            values.append(value)
+    return "\n".join(
+        str(value) for value in values if value not in (None, "")
+    ).lower()
+
 
 class ItemsModel(QtCore.QAbstractItemModel):
-    """ Stores the search result items"""
+    """ Stores the search result items, their footprint selection
+    state, their loaded thumbnails and the items highlighted from the
+    map canvas.
+    """
+
+    ItemRole = QtCore.Qt.UserRole
+    HighlightRole = QtCore.Qt.UserRole + 1
 
     def __init__(self, items, parent=None):
         super().__init__(parent)
-        self.items = items
+        self.items = []
+        self.rows = {}
+        self.checked = set()
+        self.thumbnails = {}
+        self.search_texts = {}
+        self.highlighted = set()
+        self.set_items(items)
+
+    def set_items(self, items):
+        """ Replaces the stored items, the footprint selections,
+        thumbnails and highlights of the previous items are dropped.
+
+        :param items: Search result items
+        :type items: list
+        """
+        self.beginResetModel()
+        self.items = list(items)
+        self.rows = {
+            item.item_uuid: row for row, item in enumerate(self.items)
+        }
+        self.checked.clear()
+        self.thumbnails.clear()
+        self.search_texts.clear()
+        self.highlighted.clear()
+        self.endResetModel()
+
+    def add_items(self, items):
+        """ Appends the passed items after the stored items.
+
+        :param items: Search result items
+        :type items: list
+        """
+        if not items:
+            return
+        first_row = len(self.items)
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            first_row,
+            first_row + len(items) - 1
+        )
+        for row, item in enumerate(items, first_row):
+            self.items.append(item)
+            self.rows[item.item_uuid] = row
+        self.endInsertRows()
+
+    def search_text(self, item) -> str:
+        """ Returns the filter search text of the stored item, the
+        texts are built once per item.
+
+        :param item: Search result item
+        :type item: ItemView
+
+        :returns: Item search text
+        :rtype: str
+        """
+        text = self.search_texts.get(item.item_uuid)
+        if text is None:
+            text = item_search_text(item)
+            self.search_texts[item.item_uuid] = text
+        return text
+
+    def set_thumbnail(self, item_uuid, pixmap):
+        """ Sets the thumbnail of the stored item with the passed
+        identifier, a null pixmap marks the thumbnail as unavailable.
+
+        :param item_uuid: Plugin item identifier
+        :type item_uuid: UUID
+
+        :param pixmap: Item thumbnail
+        :type pixmap: QPixmap
+        """
+        row = self.rows.get(item_uuid)
+        if row is None:
+            return
+        self.thumbnails[item_uuid] = pixmap
+        index = self.index(row, 0, QtCore.QModelIndex())
+        self.dataChanged.emit(index, index, [QtCore.Qt.DecorationRole])
+
+    def set_highlighted(self, items_uuids):
+        """ Highlights the stored items with the passed identifiers,
+        only the rows whose highlight changed are updated.
+
+        :param items_uuids: Plugin items identifiers
+        :type items_uuids: set
+        """
+        highlighted = {
+            item_uuid for item_uuid in items_uuids if item_uuid in self.rows
+        }
+        changed = highlighted ^ self.highlighted
+        self.highlighted = highlighted
+        for item_uuid in changed:
+            index = self.index(self.rows[item_uuid], 0, QtCore.QModelIndex())
+            self.dataChanged.emit(index, index, [self.HighlightRole])
 
     def index(
             self,
@@ -50,16 +190,42 @@ class ItemsModel(QtCore.QAbstractItemModel):
         result = None
         if index.isValid():
             item = index.internalPointer()
-            result = item
+            if role in (QtCore.Qt.DisplayRole, self.ItemRole):
+                result = item
+            elif role == QtCore.Qt.DecorationRole:
+                result = self.thumbnails.get(item.item_uuid)
+            elif role == self.HighlightRole:
+                result = item.item_uuid in self.highlighted
+            elif role == QtCore.Qt.CheckStateRole:
+                result = QtCore.Qt.Checked \
+                    if item.item_uuid in self.checked \
+                    else QtCore.Qt.Unchecked
         return result
 
+    def setData(
+            self,
+            index: QtCore.QModelIndex,
+            value,
+            role: QtCore.Qt.ItemDataRole = QtCore.Qt.EditRole
+    ):
+        if not index.isValid() or role != QtCore.Qt.CheckStateRole:
+            return False
+        item = index.internalPointer()
+        if value == QtCore.Qt.Checked:
+            self.checked.add(item.item_uuid)
+        else:
+            self.checked.discard(item.item_uuid)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        return True
+
     def flags(
             self,
             index: QtCore.QModelIndex = QtCore.QModelIndex()
     ):
         if index.isValid():
-            flags = super().flags(index)
-            result = QtCore.Qt.ItemIsEditable | flags
+            result = QtCore.Qt.ItemIsEnabled | \
+                QtCore.Qt.ItemIsSelectable | \
+                QtCore.Qt.ItemIsUserCheckable
         else:
             result = QtCore.Qt.NoItemFlags
         return result
@@ -72,11 +238,65 @@ class ItemsSortFilterProxyModel(QtCore.QSortFilterProxyModel):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.accepted_items = None
+        self.filter_text = ""
+        self.filter_terms = []
+        # Items identifiers mapped to whether they match the filter terms
+        self.matches = {}
+
+    def setSourceModel(self, source_model):
+        if self.sourceModel() is not None:
+            self.sourceModel().modelAboutToBeReset.disconnect(
+                self.clear_matches
+            )
+        super().setSourceModel(source_model)
+        source_model.modelAboutToBeReset.connect(self.clear_matches)
+        self.clear_matches()
+
+    def clear_matches(self):
+        """ Drops the filter results of the previous source items."""
+        self.matches = {}
+
+    def set_filter(self, filter_text, accepted_items=None):
+        """ Filters the rows to the items matching all the words of the
+        filter text and, when passed, to the accepted items.
+
+        When the filter text extends the previous one only the items
+        matching the previous text are tested again.
+
+        :param filter_text: Filter text
+        :type filter_text: str
+
+        :param accepted_items: Accepted items identifiers, None accepts
+        all items
+        :type accepted_items: set
+        """
+        filter_text = filter_text.lower()
+        narrowing = bool(self.filter_terms) and \
+            filter_text.startswith(self.filter_text)
+        self.matches = {
+            item_uuid: matched
+            for item_uuid, matched in self.matches.items()
+            if not matched
+        } if narrowing else {}
+        self.filter_text = filter_text
+        self.filter_terms = filter_text.split()
+        self.accepted_items = accepted_items
+        self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex):
-        index = self.sourceModel().index(source_row, 0, source_parent)
+        source_model = self.sourceModel()
+        index = source_model.index(source_row, 0, source_parent)
+        item = source_model.data(index)
 
-        match = self.filterRegularExpression().match(
-            self.sourceModel().data(index).id
-        )
-        return match.hasMatch()
+        if self.accepted_items is not None and \
+                item.item_uuid not in self.accepted_items:
+            return False
+        if not self.filter_terms:
+            return True
+        matched = self.matches.get(item.item_uuid)
+        if matched is None:
+            text = source_model.search_text(item)
+            matched = all(term in text for term in self.filter_terms)
+            self.matches[item.item_uuid] = matched
+        return matched
@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+"""
+    Loader of the search result items thumbnails.
+
+    Thumbnails are fetched with asynchronous requests, at most a set
+    number at the same time, in the order the rows were painted. The
+    cached images are read, and the fetched ones decoded and scaled,
+    in worker threads so the results view is never blocked.
+"""
+
+import collections
+import typing
+
+from concurrent.futures import ThreadPoolExecutor
+
+from qgis.PyQt import (
+    QtCore,
+    QtGui,
+)
+
+from ..api.qgis_stac_io import QgisStacApiIO
+from ..api.sas_signer import sas_signer
+from ..api.thumbnail_cache import thumbnail_cache
+from ..definitions.constants import (
+    RESULT_THUMBNAIL_SIZE,
+    THUMBNAIL_MAX_REQUESTS_DEFAULT,
+)
+from ..utils import log, tr
+
+
+class ThumbnailRequest:
+    """ A requested thumbnail and its loading state."""
+
+    __slots__ = ("key", "cache_url", "signer", "url", "future")
+
+    def __init__(
+            self,
+            key,
+            cache_url: str,
+            signer: typing.Optional[typing.Callable] = None
+    ):
+        self.key = key
+        self.cache_url = cache_url
+        self.signer = signer
+        self.url = None
+        self.future = None
+
+
+def scaled_thumbnail(content: bytes) -> typing.Optional[QtGui.QImage]:
+    """Decodes the fetched image and scales it down to the results
+    list thumbnail size.
+
+    :param content: Encoded image
+    :type content: bytes
+
+    :returns: Scaled image, None when the content is not an image
+    :rtype: QImage
+    """
+    image = QtGui.QImage.fromData(content)
+    if image.isNull():
+        return None
+    size = RESULT_THUMBNAIL_SIZE
+    if image.width() > size or image.height() > size:
+        image = image.scaled(
+            size,
+            size,
+            QtCore.Qt.KeepAspectRatio,
+            QtCore.Qt.SmoothTransformation
+        )
+    return image
+
+
+def encoded_thumbnail(image: QtGui.QImage) -> bytes:
+    """Encodes the scaled thumbnail for the on-disk cache, as PNG when
+    it has transparency and as JPEG otherwise.
+
+    :param image: Scaled image
+    :type image: QImage
+
+    :returns: Encoded image
+    :rtype: bytes
+    """
+    content = QtCore.QByteArray()
+    image_buffer = QtCore.QBuffer(content)
+    image_buffer.open(QtCore.QIODevice.WriteOnly)
+    if image.hasAlphaChannel():
+        image.save(image_buffer, "PNG")
+    else:
+        image.save(image_buffer, "JPEG", 85)
+    image_buffer.close()
+    return bytes(content)
+
+
+class ThumbnailLoader(QtCore.QObject):
+    """ Loads the thumbnails of the result items rows.
+
+    Requests are identified by a key, the loaded thumbnail pixmap, or
+    a null pixmap when the thumbnail is not available, is sent with
+    the key by the thumbnail_loaded signal. Requests of the rows that
+    are no longer visible are cancelled with retain() or clear().
+    """
+
+    thumbnail_loaded = QtCore.pyqtSignal(object, QtGui.QPixmap)
+    image_ready = QtCore.pyqtSignal(object, object)
+
+    def __init__(
+            self,
+            max_requests: int = THUMBNAIL_MAX_REQUESTS_DEFAULT,
+            parent=None
+    ):
+        """
+        :param max_requests: Maximum number of thumbnails loaded at
+        the same time
+        :type max_requests: int
+
+        :param parent: Parent object
+        :type parent: QObject
+        """
+        super().__init__(parent)
+        self.max_requests = max(1, max_requests)
+        self.stac_io = QgisStacApiIO(
+            cache=None,
+            max_in_flight_per_host=self.max_requests
+        )
+        self._queue = collections.OrderedDict()
+        self._running = {}
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self.image_ready.connect(self._image_ready)
+
+    def set_max_requests(self, max_requests: int):
+        """Sets the maximum number of thumbnails loaded at the same time.
+
+        :param max_requests: Number of concurrent thumbnail requests
+        :type max_requests: int
+        """
+        self.max_requests = max(1, max_requests)
+        self.stac_io.max_in_flight_per_host = self.max_requests
+        self._schedule()
+
+    def pending(self, key) -> bool:
+        """Whether the thumbnail of the key is queued or loading.
+
+        :param key: Request key
+        :type key: object
+
+        :returns: Whether the thumbnail is being loaded
+        :rtype: bool
+        """
+        return key in self._queue or key in self._running
+
+    def load(
+            self,
+            key,
+            cache_url: str,
+            signer: typing.Optional[typing.Callable] = None
+    ):
+        """Requests the thumbnail of the passed URL, thumbnails kept in
+        the memory cache are sent right away.
+
+        :param key: Request key, e.g. the result item identifier
+        :type key: object
+
+        :param cache_url: Unsigned thumbnail URL, used as cache key
+        :type cache_url: str
+
+        :param signer: Called with the URL in a worker thread, returns
+        the signed URL to fetch
+        :type signer: Callable
+        """
+        pixmap = thumbnail_cache.image(cache_url)
+        if pixmap is not None:
+            self.thumbnail_loaded.emit(key, pixmap)
+            return
+        if self.pending(key):
+            return
+        self._queue[key] = ThumbnailRequest(key, cache_url, signer)
+        self._schedule()
+
+    def retain(self, keys: typing.Set):
+        """Cancels the queued and running requests whose key is not
+        in the passed keys, e.g. of the rows scrolled out of view.
+
+        :param keys: Keys of the requests to keep
+        :type keys: set
+        """
+        for key in [key for key in self._queue if key not in keys]:
+            del self._queue[key]
+        for key in [key for key in self._running if key not in keys]:
+            request = self._running.pop(key)
+            if request.future is not None:
+                request.future.cancel()
+        self._schedule()
+
+    def clear(self):
+        """ Cancels all the requests, e.g. when another page is shown."""
+        self.retain(set())
+
+    def _schedule(self):
+        """ Starts the queued requests, up to the concurrent limit."""
+        while self._queue and len(self._running) < self.max_requests:
+            _, request = self._queue.popitem(last=False)
+            self._running[request.key] = request
+            self._executor.submit(self._read_cached, request)
+
+    def _active(self, request: ThumbnailRequest) -> bool:
+        return self._running.get(request.key) is request
+
+    def _read_cached(self, request: ThumbnailRequest):
+        """ Reads the thumbnail from the on-disk cache, or signs the
+        URL to fetch, in a worker thread."""
+        image = None
+        try:
+            content = thumbnail_cache.data(request.cache_url)
+            if content:
+                image = QtGui.QImage.fromData(content)
+            if image is None or image.isNull():
+                image = None
+                request.url = request.cache_url
+                if request.signer is not None and \
+                        not sas_signer.signed(request.cache_url):
+                    request.url = request.signer(request.cache_url)
+        except Exception as e:
+            log(
+                tr("Problem loading thumbnail {}, {}").format(
+                    request.cache_url, e
+                ),
+                notify=False
+            )
+            request.url = None
+        self.image_ready.emit(request, image)
+
+    def _scale(self, request: ThumbnailRequest, content: bytes):
+        """ Decodes, scales and caches the fetched thumbnail in a
+        worker thread."""
+        image = None
+        try:
+            image = scaled_thumbnail(content)
+            if image is not None:
+                thumbnail_cache.store_data(
+                    request.cache_url,
+                    encoded_thumbnail(image)
+                )
+        except Exception as e:
+            log(
+                tr("Problem loading thumbnail {}, {}").format(
+                    request.cache_url, e
+                ),
+                notify=False
+            )
+        self.image_ready.emit(request, image)
+
+    def _image_ready(self, request: ThumbnailRequest, image):
+        """ Handles the worker threads results in the main thread."""
+        if not self._active(request):
+            return
+        if image is None and request.future is None and request.url:
+            request.future = self.stac_io.request_async(
+                request.url,
+                transform=bytes
+            )
+            request.future.add_done_callback(
+                lambda future: self._fetched(request, future)
+            )
+            return
+        self._finish(request, image)
+
+    def _fetched(self, request: ThumbnailRequest, future):
+        """ Handles the finished thumbnail request."""
+        if not self._active(request):
+            return
+        error = future.exception()
+        if error is not None:
+            log(
+                tr("Problem fetching thumbnail {}, {}").format(
+                    request.cache_url, error
+                ),
+                notify=False
+            )
+            self._finish(request, None)
+            return
+        self._executor.submit(self._scale, request, future.result())
+
+    def _finish(self, request: ThumbnailRequest, image):
+        """ Sends the loaded thumbnail and starts the next request."""
+        del self._running[request.key]
+        pixmap = QtGui.QPixmap()
+        if image is not None:
+            pixmap = QtGui.QPixmap.fromImage(image)
+            thumbnail_cache.store_image(
+                request.cache_url,
+                pixmap,
+                pixmap.width() * pixmap.height() *
+                max(pixmap.depth(), 8) // 8
+            )
+        self.thumbnail_loaded.emit(request.key, pixmap)
+        self._schedule()
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+    SQLite store of the plugin search result items.
+
+    The items of the displayed result pages are kept in a database in
+    the user profile instead of one QgsSettings group per item and
+    asset, so that saving a result page is one transaction.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import typing
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    uuid TEXT PRIMARY KEY,
+    connection TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT,
+    stac_version TEXT,
+    feature TEXT
+);
+CREATE INDEX IF NOT EXISTS items_connection_page
+    ON items (connection, page, position);
+CREATE INDEX IF NOT EXISTS items_connection_id
+    ON items (connection, id);
+"""
+
+
+class ItemStore:
+    """ Stores the search result items by connection and result page.
+
+    Items are passed and returned as records, dictionaries with the
+    "uuid", "id", "stac_version" and "feature" keys. The passed
+    features can be already serialized to JSON text, the item assets
+    are read from the features.
+    """
+
+    def __init__(self, path: typing.Optional[str] = None):
+        self.path = path
+        self._connection = None
+        self._lock = threading.RLock()
+
+    def configure(self, path: str):
+        """Sets the database file path, the database is
+        opened on first use.
+
+        :param path: Database file path
+        :type path: str
+        """
+        with self._lock:
+            if path == self.path:
+                return
+            self.close()
+            self.path = path
+
+    def close(self):
+        """ Closes the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _database(self) -> sqlite3.Connection:
+        if self._connection is None:
+            if self.path is None:
+                raise RuntimeError("The items store path is not configured")
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            connection = sqlite3.connect(
+                self.path,
+                check_same_thread=False
+            )
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def save_items(
+            self,
+            connection_id,
+            page: int,
+            records: typing.List[dict],
+            replace_page: bool = False
+    ):
+        """Saves the item records of a result page in one transaction.
+
+        :param connection_id: Connection identifier
+        :type connection_id: uuid.UUID
+
+        :param page: Result page of the items
+        :type page: int
+
+        :param records: Item records
+        :type records: list
+
+        :param replace_page: Whether to remove the other items of the page
+        :type replace_page: bool
+        """
+        connection_id = str(connection_id)
+        item_rows = [
+            (str(record["uuid"]), connection_id, int(page), position) +
+            self._item_values(record)
+            for position, record in enumerate(records)
+        ]
+
+        with self._lock:
+            database = self._database()
+            with database:
+                if replace_page:
+                    database.execute(
+                        "DELETE FROM items WHERE connection = ? AND page = ?",
+                        (connection_id, int(page))
+                    )
+                database.executemany(
+                    "INSERT OR REPLACE INTO items "
+                    "(uuid, connection, page, position, id, "
+                    "stac_version, feature) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    item_rows
+                )
+
+    def update_items(self, records: typing.List[dict]):
+        """Updates the feature of already stored items, keeping
+        their connection and result page.
+
+        :param records: Item records
+        :type records: list
+        """
+        with self._lock:
+            database = self._database()
+            with database:
+                database.executemany(
+                    "UPDATE items SET id = ?, stac_version = ?, "
+                    "feature = ? WHERE uuid = ?",
+                    [
+                        self._item_values(record) + (str(record["uuid"]),)
+                        for record in records
+                    ]
+                )
+
+    @staticmethod
+    def _item_values(record) -> tuple:
+        feature = record.get("feature")
+        return (
+            record.get("id"),
+            record.get("stac_version"),
+            feature if feature is None or isinstance(feature, str)
+            else json.dumps(feature),
+        )
+
+    def get_items(
+            self,
+            connection_id,
+            items_uuids: typing.Optional[typing.List[str]] = None,
+            page: typing.Optional[int] = None
+    ) -> typing.Dict[str, typing.List[dict]]:
+        """Gets the stored item records of a connection by page.
+
+        :param connection_id: Connection identifier
+        :type connection_id: uuid.UUID
+
+        :param items_uuids: Identifiers of the items to get
+        :type items_uuids: list
+
+        :param page: Result page of the items to get
+        :type page: int
+
+        :returns: Page numbers mapped to the item records
+        :rtype: dict
+        """
+        query = (
+            "SELECT uuid, page, id, stac_version, feature FROM items "
+            "WHERE connection = ?"
+        )
+        parameters = [str(connection_id)]
+        if page is not None:
+            query += " AND page = ?"
+            parameters.append(int(page))
+        if items_uuids:
+            uuids = [str(item_uuid) for item_uuid in items_uuids]
+            query += f" AND uuid IN ({', '.join('?' * len(uuids))})"
+            parameters.extend(uuids)
+        query += " ORDER BY page, position"
+
+        result = {}
+        with self._lock:
+            database = self._database()
+            for item_uuid, item_page, item_id, stac_version, feature in \
+                    database.execute(query, parameters):
+                record = {
+                    "uuid": item_uuid,
+                    "id": item_id,
+                    "stac_version": stac_version,
+                    "feature": json.loads(feature) if feature else None,
+                }
+                result.setdefault(str(item_page), []).append(record)
+        return result
+
+    def delete_items(self, connection_id, page: typing.Optional[int] = None):
+        """Deletes the stored items of a connection, only the items
+        of the passed page when a page is passed.
+
+        :param connection_id: Connection identifier
+        :type connection_id: uuid.UUID
+
+        :param page: Result page of the items to delete
+        :type page: int
+        """
+        query = "DELETE FROM items WHERE connection = ?"
+        parameters = [str(connection_id)]
+        if page is not None:
+            query += " AND page = ?"
+            parameters.append(int(page))
+        with self._lock:
+            database = self._database()
+            with database:
+                database.execute(query, parameters)
+
+
+item_store = ItemStore()
@@ -5,6 +5,7 @@
 
 import os
 import enum
+import time
 
 from qgis.PyQt import (
     QtCore,
@@ -16,17 +17,16 @@ from qgis.core import (
 )
 
 from ..conf import Settings, settings_manager
-from ..lib import planetary_computer as pc
 
-from ..api.models import (
-    ApiCapability,
-    ResourceAsset,
-    TimeUnits
-)
+from ..api.models import ApiCapability
+from ..api.sas_signer import sas_signer
 
 from ..utils import log
 
-from ..definitions.constants import SAS_SUBSCRIPTION_VARIABLE
+from ..definitions.constants import (
+    SAS_SUBSCRIPTION_VARIABLE,
+    SAS_TOKEN_RENEWAL_MARGIN
+)
 
 
 class RefreshState(enum.Enum):
@@ -37,13 +37,44 @@ class RefreshState(enum.Enum):
 
 class SASManager(QtCore.QObject):
     """ Manager to help updates on the SAS token based connections.
+
+    The cached SAS tokens are renewed shortly before the nearest
+    token expiry, the asset hrefs are signed when they are accessed.
     """
     token_refresh_started = QtCore.pyqtSignal()
     token_refresh_finished = QtCore.pyqtSignal()
     token_refresh_error = QtCore.pyqtSignal()
+    token_issued = QtCore.pyqtSignal(float)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.refresh_task = None
+        self.refresh_timer = QtCore.QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.run_refresh_task)
+        # Tokens may be issued from the tasks threads, the signal
+        # schedules the refresh in the thread of this manager.
+        self.token_issued.connect(self.schedule_refresh)
+        sas_signer.token_listener = self.token_issued.emit
+
+    def schedule_refresh(self, expiry=None):
+        """ Starts the refresh timer for the nearest token expiry,
+        leaving twice the renewal margin for the refresh.
+
+        :param expiry: Expiry timestamp of a newly issued token
+        :type expiry: float
+        """
+        next_expiry = sas_signer.next_expiry()
+        if next_expiry is None:
+            self.refresh_timer.stop()
+            return
+        delay = max(
+            0,
+            int((next_expiry - 2 * SAS_TOKEN_RENEWAL_MARGIN - time.time()) * 1000)
+        )
+        if not self.refresh_timer.isActive() or \
+                self.refresh_timer.remainingTime() > delay:
+            self.refresh_timer.start(delay)
 
     def refresh_started(self):
         self.token_refresh_started.emit()
@@ -54,6 +85,8 @@ class SASManager(QtCore.QObject):
             Settings.REFRESH_STATE,
             RefreshState.IDLE
         )
+        self.refresh_task = None
+        self.schedule_refresh()
         self.token_refresh_finished.emit()
 
     def refresh_error(self):
@@ -62,24 +95,21 @@ class SASManager(QtCore.QObject):
             Settings.REFRESH_STATE,
             RefreshState.IDLE
         )
+        self.refresh_task = None
+        self.schedule_refresh()
         self.token_refresh_error.emit()
 
     def run_refresh_task(self):
 
-        refresh_state = settings_manager.get_value(
-            Settings.REFRESH_STATE,
-            RefreshState.IDLE
-        )
-
-        if refresh_state == RefreshState.RUNNING:
+        if self.refresh_task is not None:
             return
 
         self.token_refresh_started.emit()
 
-        task = RefreshTask()
-        task.taskCompleted.connect(self.refresh_complete)
-        task.taskTerminated.connect(self.refresh_error)
-        task.run()
+        self.refresh_task = RefreshTask()
+        self.refresh_task.taskCompleted.connect(self.refresh_complete)
+        self.refresh_task.taskTerminated.connect(self.refresh_error)
+        QgsApplication.taskManager().addTask(self.refresh_task)
 
 
 class RefreshTask(QgsTask):
@@ -99,63 +129,15 @@ class RefreshTask(QgsTask):
         return True
 
     def token_refresh(self):
-        """ Refreshes the current SAS token available in search results
-         items store in the plugin settings.
-         """
-        updated_items = []
-
-        last_update = settings_manager.get_value(
-            Settings.REFRESH_LAST_UPDATE,
-            None
-        )
-
-        refresh_frequency = settings_manager.get_value(
-            Settings.REFRESH_FREQUENCY,
-            1,
-            setting_type=int
-        )
-
-        unit = settings_manager.get_value(
-            Settings.REFRESH_FREQUENCY_UNIT,
-            TimeUnits.MINUTES
-        )
-
-        refresh_time_count = {
-            TimeUnits.MINUTES: 60000,
-            TimeUnits.HOURS: 60 * 6000,
-            TimeUnits.DAYS: 24 * 60 * 6000,
-        }
-
-        if last_update:
-            last_update_date = QtCore.QDateTime.fromString(
-                    last_update, QtCore.Qt.ISODate
-            )
-        else:
-            last_update_date = QtCore.QDateTime.currentDateTime()
-            settings_manager.set_value(
-                Settings.REFRESH_LAST_UPDATE,
-                last_update_date.toString(QtCore.Qt.ISODate)
-            )
-
-        current_time = QtCore.QDateTime.currentDateTime()
-
-        if last_update_date.msecsTo(current_time) < \
-            refresh_frequency * refresh_time_count[unit]:
-            self.cancel()
-            return
-
-        settings_manager.set_value(
-            Settings.REFRESH_LAST_UPDATE,
-            current_time.toString(QtCore.Qt.ISODate)
-        )
-
+        """ Renews the cached SAS tokens close to their expiry that are
+        in use, the stored search results items are signed when their
+        assets are accessed.
+        """
         settings_manager.set_value(
             Settings.REFRESH_STATE,
             RefreshState.RUNNING
         )
 
-        connections = settings_manager.list_connections()
-
         key = os.getenv(SAS_SUBSCRIPTION_VARIABLE)
 
         # If the plugin defined connection sas subscription key
@@ -167,41 +149,16 @@ class RefreshTask(QgsTask):
                 connection.sas_subscription_key:
             key = connection.sas_subscription_key
 
-        if key:
-            pc.set_subscription_key(key)
-
-        for connection in connections:
-            if connection.capability == \
-                    ApiCapability.SUPPORT_SAS_TOKEN:
-                settings_items = settings_manager.get_items(
-                    connection.id
-                )
-                for page, items in settings_items.items():
-                    for item in items:
-                        if item.stac_object:
-                            stac_object = pc.sign(item.stac_object)
-                            item.stac_object = stac_object
-                            item.assets = [
-                                ResourceAsset(
-                                    href=asset.href,
-                                    title=asset.title or key,
-                                    description=asset.description,
-                                    type=asset.media_type,
-                                    roles=asset.roles or []
-                                )
-                                for key, asset in stac_object.assets.items()
-                            ]
-                            updated_items.append(item)
-                    if updated_items:
-                        settings_manager.save_items(
-                            connection,
-                            updated_items,
-                            page
-                        )
-                        updated_items = []
-
-        self.cancel()
+        renewed = sas_signer.refresh(
+            2 * SAS_TOKEN_RENEWAL_MARGIN,
+            subscription_key=key
+        )
 
+        settings_manager.set_value(
+            Settings.REFRESH_LAST_UPDATE,
+            QtCore.QDateTime.currentDateTime().toString(QtCore.Qt.ISODate)
+        )
+        log(f"Renewed {renewed} SAS tokens", notify=False)
 
     def finished(self, result: bool):
         """ Handle logic after task has completed.
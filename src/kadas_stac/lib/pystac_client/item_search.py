@@ -48,8 +48,8 @@ FilterLike = dict
 Sortby = List[str]
 SortbyLike = Union[Sortby, str]
 
-Fields = List[str]
-FieldsLike = Union[Fields, str]
+Fields = Dict[str, List[str]]
+FieldsLike = Union[Fields, List[str], str]
 
 
 # from https://gist.github.com/angstwad/bf22d1822c38a92ec0a9#gistcomment-2622319
@@ -211,6 +211,8 @@ class ItemSearch:
                 params['collections'] = ','.join(params['collections'])
             if 'intersects' in params:
                 params['intersects'] = json.dumps(params['intersects'])
+            if 'fields' in params:
+                params['fields'] = self._fields_dict_to_str(params['fields'])
             return params
         else:
             raise Exception(f"Unsupported method {self.method}")
@@ -393,9 +395,30 @@ class ItemSearch:
         self._stac_io.assert_conforms_to(ConformanceClasses.FIELDS)
 
         if isinstance(value, str):
-            return tuple(value.split(','))
+            return self._fields_to_dict(value.split(','))
+        if isinstance(value, dict):
+            return value
 
-        return tuple(value)
+        return self._fields_to_dict(value)
+
+    @staticmethod
+    def _fields_to_dict(fields: List[str]) -> Fields:
+        includes: List[str] = []
+        excludes: List[str] = []
+        for field in fields:
+            if field.startswith('-'):
+                excludes.append(field[1:])
+            elif field.startswith('+'):
+                includes.append(field[1:])
+            else:
+                includes.append(field)
+        return {'include': includes, 'exclude': excludes}
+
+    @staticmethod
+    def _fields_dict_to_str(fields: Fields) -> str:
+        includes = [f'+{field}' for field in fields.get('include', [])]
+        excludes = [f'-{field}' for field in fields.get('exclude', [])]
+        return ','.join(includes + excludes)
 
     @staticmethod
     def _format_intersects(value: Optional[IntersectsLike]) -> Optional[Intersects]:
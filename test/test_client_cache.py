@@ -0,0 +1,63 @@
+# coding=utf-8
+"""Tests for the catalogs landing pages cache.
+
+"""
+
+import unittest
+
+from unittest import mock
+
+from kadas_stac.api.client_cache import LandingPageCache
+
+
+class LandingPageCacheTest(unittest.TestCase):
+    """Test the catalogs landing pages cache"""
+
+    def setUp(self):
+        self.cache = LandingPageCache()
+        self.landing_page = {
+            "id": "catalog",
+            "conformsTo": ["https://api.stacspec.org/v1.0.0/core"],
+        }
+
+    def test_store_and_get(self):
+        """Cache returns copies of the stored landing pages"""
+        url = "https://example.com/stac"
+        self.cache.store(url, self.landing_page)
+
+        landing_page = self.cache.get(url, ttl=60)
+        self.assertEqual(landing_page, self.landing_page)
+        landing_page["id"] = "changed"
+        self.assertEqual(self.cache.get(f"{url}/", ttl=60)["id"], "catalog")
+
+        self.assertIsNone(self.cache.get(url, ttl=0))
+        self.assertIsNone(
+            self.cache.get(url, headers={"Authorization": "key"}, ttl=60)
+        )
+
+    def test_expiry(self):
+        """Cache drops the landing pages older than the time to live"""
+        url = "https://example.com/stac"
+        with mock.patch("time.monotonic", return_value=100):
+            self.cache.store(url, self.landing_page)
+        with mock.patch("time.monotonic", return_value=150):
+            self.assertIsNotNone(self.cache.get(url, ttl=60))
+        with mock.patch("time.monotonic", return_value=200):
+            self.assertIsNone(self.cache.get(url, ttl=60))
+
+    def test_invalidate(self):
+        """Invalidating a catalog drops its children entries"""
+        url = "https://example.com/stac"
+        self.cache.store(url, self.landing_page)
+        self.cache.store(f"{url}/collections/one", self.landing_page)
+        self.cache.store("https://other.com/stac", self.landing_page)
+
+        self.cache.invalidate(url)
+
+        self.assertIsNone(self.cache.get(url, ttl=60))
+        self.assertIsNone(self.cache.get(f"{url}/collections/one", ttl=60))
+        self.assertIsNotNone(self.cache.get("https://other.com/stac", ttl=60))
+
+
+if __name__ == "__main__":
+    unittest.main()
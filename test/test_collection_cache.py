@@ -0,0 +1,87 @@
+# coding=utf-8
+"""Tests for the collections cache.
+
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from kadas_stac.api.collection_cache import CollectionCache, diff_collections
+
+
+def collection(collection_id, title=None):
+    return {
+        "type": "Collection",
+        "id": collection_id,
+        "title": title or collection_id,
+        "extent": {
+            "spatial": {"bbox": [[-180, -90, 180, 90]]},
+            "temporal": {"interval": [["2020-01-01T00:00:00Z", None]]},
+        },
+        "links": [],
+    }
+
+
+class CollectionCacheTest(unittest.TestCase):
+    """Test the collections cache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_put_and_get(self):
+        """Cache returns the stored documents and reports the changes"""
+        cache = CollectionCache(self.directory)
+        self.assertIsNone(cache.get("connection"))
+
+        added, removed = cache.put(
+            "connection",
+            [collection("a"), collection("b")]
+        )
+        self.assertEqual((added, removed), (["a", "b"], []))
+
+        added, removed = cache.put(
+            "connection",
+            [collection("b"), collection("c")]
+        )
+        self.assertEqual((added, removed), (["c"], ["a"]))
+        self.assertEqual(
+            [document["id"] for document in cache.get("connection")],
+            ["b", "c"]
+        )
+        self.assertEqual(
+            cache.get_document("connection", "c")["extent"],
+            collection("c")["extent"]
+        )
+        self.assertIsNone(cache.get_document("connection", "a"))
+        self.assertIsNone(cache.get("other"))
+
+    def test_persistence(self):
+        """Cached documents are read back from disk"""
+        CollectionCache(self.directory).put("connection", [collection("a")])
+
+        cache = CollectionCache(self.directory)
+        self.assertEqual(cache.get("connection"), [collection("a")])
+        self.assertIsNotNone(cache.updated("connection"))
+
+        cache.remove("connection")
+        self.assertIsNone(cache.get("connection"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_diff_collections(self):
+        """Collection listings are compared by id"""
+        self.assertEqual(
+            diff_collections(
+                [collection("a"), collection("b")],
+                [collection("b", title="B"), collection("c")]
+            ),
+            (["c"], ["a"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+# coding=utf-8
+"""Tests for the HTTP content encoding decoding.
+
+"""
+
+import gzip
+import unittest
+import zlib
+
+from kadas_stac.api.content_encoding import (
+    ACCEPT_ENCODING,
+    ContentEncodingError,
+    decode_content,
+)
+
+BODY = b'{"type": "FeatureCollection", "features": []}'
+
+
+class ContentEncodingTest(unittest.TestCase):
+    """Test the response bodies decoding"""
+
+    def test_accept_encoding(self):
+        """Negotiated encodings include gzip and deflate"""
+        self.assertIn("gzip", ACCEPT_ENCODING)
+        self.assertIn("deflate", ACCEPT_ENCODING)
+
+    def test_decode(self):
+        """Bodies are decoded with the listed codings"""
+        self.assertEqual(decode_content(BODY), BODY)
+        self.assertEqual(decode_content(BODY, "identity"), BODY)
+        self.assertEqual(decode_content(gzip.compress(BODY), "gzip"), BODY)
+        self.assertEqual(decode_content(zlib.compress(BODY), "Deflate"), BODY)
+
+        raw_deflate = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        raw_body = raw_deflate.compress(BODY) + raw_deflate.flush()
+        self.assertEqual(decode_content(raw_body, "deflate"), BODY)
+
+    def test_multiple_codings(self):
+        """Codings are removed in the reverse order of their application"""
+        body = gzip.compress(zlib.compress(BODY))
+        self.assertEqual(decode_content(body, "deflate, gzip"), BODY)
+
+    def test_errors(self):
+        """Invalid or unsupported encoded bodies raise an error"""
+        with self.assertRaises(ContentEncodingError):
+            decode_content(BODY, "gzip")
+        with self.assertRaises(ContentEncodingError):
+            decode_content(BODY, "compress")
+
+
+if __name__ == "__main__":
+    unittest.main()
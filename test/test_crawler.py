@@ -0,0 +1,152 @@
+# coding=utf-8
+"""Tests for the static catalogs crawler.
+
+"""
+
+import unittest
+
+from concurrent.futures import Future
+
+from kadas_stac.api.crawler import StaticCatalogCrawler
+
+ROOT = "https://example.com/catalog.json"
+
+
+def item_document(item_id, collection):
+    return {
+        "type": "Feature",
+        "stac_version": "1.0.0",
+        "id": item_id,
+        "collection": collection,
+        "geometry": None,
+        "properties": {"datetime": "2022-01-01T00:00:00Z"},
+        "links": [],
+        "assets": {},
+    }
+
+
+def catalog_document(catalog_id, children=(), items=()):
+    links = [{"rel": "child", "href": href} for href in children]
+    links += [{"rel": "item", "href": href} for href in items]
+    return {
+        "type": "Catalog",
+        "stac_version": "1.0.0",
+        "id": catalog_id,
+        "description": catalog_id,
+        "links": links,
+    }
+
+
+class StaticStacIO:
+    """ Serves catalog documents from a dictionary through pending
+    futures, one future is completed on each wait."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.requests = []
+        self.pending = []
+        self.max_pending = 0
+        self.max_in_flight_per_host = 6
+        self.host_limits = []
+
+    def read_json(self, url):
+        self.requests.append(url)
+        return self.documents[url]
+
+    def read_json_async(self, url):
+        future = Future()
+        self.pending.append((url, future))
+        self.max_pending = max(self.max_pending, len(self.pending))
+        self.host_limits.append(self.max_in_flight_per_host)
+        return future
+
+    def wait(self, futures, first_completed=False):
+        url, future = self.pending.pop(0)
+        try:
+            future.set_result(self.read_json(url))
+        except Exception as e:
+            future.set_exception(e)
+
+
+class StaticCatalogCrawlerTest(unittest.TestCase):
+    """Test the static catalogs crawler"""
+
+    def setUp(self):
+        self.documents = {
+            ROOT: catalog_document(
+                "root",
+                children=["one/collection.json", "two/collection.json"],
+            ),
+            "https://example.com/one/collection.json": catalog_document(
+                "one",
+                children=["../two/collection.json"],
+                items=[f"item-{i}.json" for i in range(5)],
+            ),
+            "https://example.com/two/collection.json": catalog_document(
+                "two",
+                items=[f"item-{i}.json" for i in range(5)],
+            ),
+        }
+        for collection in ("one", "two"):
+            for i in range(5):
+                self.documents[
+                    f"https://example.com/{collection}/item-{i}.json"
+                ] = item_document(f"{collection}-{i}", collection)
+
+    def test_crawl(self):
+        """Crawler collects all the items and reads every document once"""
+        stac_io = StaticStacIO(self.documents)
+        progress = []
+        crawler = StaticCatalogCrawler(
+            stac_io,
+            max_items=100,
+            progress_callback=progress.append
+        )
+        items = crawler.crawl(ROOT)
+
+        self.assertEqual(len(items), 10)
+        self.assertEqual(len(stac_io.requests), len(set(stac_io.requests)))
+        self.assertEqual(len(stac_io.requests), 13)
+        self.assertEqual(len(progress), 10)
+
+    def test_concurrent_requests(self):
+        """Crawler concurrency is the StacIO per-host limit while crawling"""
+        stac_io = StaticStacIO(self.documents)
+        crawler = StaticCatalogCrawler(stac_io, max_in_flight=8)
+        items = crawler.crawl(ROOT)
+
+        self.assertEqual(len(items), 10)
+        self.assertEqual(len(stac_io.requests), 13)
+        self.assertEqual(stac_io.max_pending, 8)
+        self.assertEqual(set(stac_io.host_limits), {8})
+        self.assertEqual(stac_io.max_in_flight_per_host, 6)
+
+    def test_items_budget(self):
+        """Crawler stops once the items budget is reached"""
+        stac_io = StaticStacIO(self.documents)
+        crawler = StaticCatalogCrawler(stac_io, max_items=3, max_in_flight=1)
+        items = crawler.crawl(ROOT)
+
+        self.assertEqual(len(items), 3)
+        self.assertEqual(len(stac_io.requests), 6)
+
+    def test_collection_filter_and_depth(self):
+        """Crawler applies the collection filter and the maximum depth"""
+        stac_io = StaticStacIO(self.documents)
+        crawler = StaticCatalogCrawler(stac_io, collection_filter=["two"])
+        items = crawler.crawl(ROOT)
+        self.assertEqual({item["collection"] for item in items}, {"two"})
+        self.assertEqual(len(items), 5)
+
+        crawler = StaticCatalogCrawler(StaticStacIO(self.documents), max_depth=0)
+        self.assertEqual(crawler.crawl(ROOT), [])
+
+    def test_root_failure(self):
+        """Crawler raises when the root document can not be read"""
+        crawler = StaticCatalogCrawler(StaticStacIO({}))
+        with self.assertRaises(KeyError):
+            crawler.crawl(ROOT)
+
+
+if __name__ == "__main__":
+    unittest.main()
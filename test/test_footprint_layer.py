@@ -0,0 +1,112 @@
+# coding=utf-8
+"""Tests for the search result items footprints layers.
+
+"""
+
+import unittest
+
+from qgis.core import QgsWkbTypes
+
+from kadas_stac.api.models import ItemView
+from kadas_stac.gui.footprint_layer import (
+    footprint_feature,
+    footprint_features,
+    footprint_fields,
+    footprint_geometry,
+)
+
+POLYGON = {
+    "type": "Polygon",
+    "coordinates": [[[7, 46], [8, 46], [8, 47], [7, 47], [7, 46]]],
+}
+
+
+def item(geometry=POLYGON, bbox=None, **properties):
+    feature = {
+        "type": "Feature",
+        "id": "item-1",
+        "collection": "sentinel-2-l2a",
+        "geometry": geometry,
+        "properties": properties,
+        "assets": {
+            "thumbnail": {
+                "href": "https://example.com/thumbnail.png",
+                "roles": ["thumbnail"],
+            },
+        },
+    }
+    if bbox:
+        feature["bbox"] = bbox
+    return ItemView(feature)
+
+
+class FootprintLayerTest(unittest.TestCase):
+    """Test the footprints layers features"""
+
+    def test_fields(self):
+        """Footprints layers have the item attributes fields"""
+        self.assertEqual(
+            footprint_fields().names(),
+            [
+                "connection",
+                "id",
+                "collection",
+                "datetime",
+                "cloud_cover",
+                "thumbnail",
+            ]
+        )
+
+    def test_polygon_geometry(self):
+        """Polygon footprints are converted to multi polygons"""
+        geometry = footprint_geometry(item())
+        self.assertEqual(geometry.wkbType(), QgsWkbTypes.MultiPolygon)
+        self.assertEqual(geometry.boundingBox().xMaximum(), 8)
+
+    def test_point_geometry(self):
+        """Footprints that are not polygons use the item bbox"""
+        geometry = footprint_geometry(
+            item(
+                {"type": "Point", "coordinates": [7.5, 46.5]},
+                bbox=[7, 46, 8, 47]
+            )
+        )
+        self.assertEqual(geometry.wkbType(), QgsWkbTypes.MultiPolygon)
+        self.assertEqual(geometry.area(), 1)
+        self.assertIsNone(footprint_geometry(item(None)))
+
+    def test_feature_attributes(self):
+        """Footprint features hold the typed item attributes"""
+        feature = footprint_feature(
+            item(datetime="2022-01-15T10:20:30Z", **{"eo:cloud_cover": 12.5}),
+            footprint_fields(),
+            "Planetary Computer"
+        )
+        self.assertEqual(feature["connection"], "Planetary Computer")
+        self.assertEqual(feature["id"], "item-1")
+        self.assertEqual(feature["collection"], "sentinel-2-l2a")
+        self.assertEqual(
+            feature["datetime"].toString("yyyy-MM-dd hh:mm:ss"),
+            "2022-01-15 10:20:30"
+        )
+        self.assertEqual(feature["cloud_cover"], 12.5)
+        self.assertEqual(
+            feature["thumbnail"],
+            "https://example.com/thumbnail.png"
+        )
+
+    def test_features(self):
+        """Items without footprint are skipped"""
+        features = footprint_features(
+            [item(), item(None), item()],
+            footprint_fields()
+        )
+        self.assertEqual(len(features), 2)
+        self.assertEqual(
+            footprint_features([item()], footprint_fields(), None, lambda: True),
+            []
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
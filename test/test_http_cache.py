@@ -0,0 +1,100 @@
+# coding=utf-8
+"""Tests for the HTTP responses cache.
+
+"""
+
+import os
+import tempfile
+import unittest
+
+from kadas_stac.api.http_cache import (
+    HttpResponseCache,
+    parse_cache_control,
+    request_key,
+)
+
+
+class HttpResponseCacheTest(unittest.TestCase):
+    """Test the HTTP responses cache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = HttpResponseCache(directory=self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_parse_cache_control(self):
+        """Cache-Control directives are parsed"""
+        self.assertEqual(
+            parse_cache_control('public, Max-Age=60, no-cache'),
+            {"public": True, "max-age": "60", "no-cache": True}
+        )
+        self.assertEqual(parse_cache_control(None), {})
+
+    def test_request_key(self):
+        """POST bodies are keyed canonically"""
+        self.assertEqual(
+            request_key("POST", "https://a/search", {"limit": 1, "ids": ["x"]}),
+            request_key("post", "https://a/search", {"ids": ["x"], "limit": 1}),
+        )
+        self.assertNotEqual(
+            request_key("POST", "https://a/search", {"limit": 1}),
+            request_key("POST", "https://a/search", {"limit": 2}),
+        )
+
+    def test_store_policy(self):
+        """Responses are stored according to their headers"""
+        fresh = self.cache.store("fresh", b"{}", {"cache-control": "max-age=60"})
+        self.assertTrue(fresh.is_fresh())
+
+        validated = self.cache.store("etag", b"{}", {"etag": '"abc"'})
+        self.assertFalse(validated.is_fresh())
+        self.assertEqual(validated.validators(), {"If-None-Match": '"abc"'})
+
+        self.assertIsNone(
+            self.cache.store(
+                "no-store",
+                b"{}",
+                {"cache-control": "no-store", "etag": '"abc"'}
+            )
+        )
+        self.assertIsNone(self.cache.store("plain", b"{}", {}))
+        self.assertIsNone(self.cache.get("plain"))
+
+    def test_revalidated(self):
+        """A not modified response becomes fresh again"""
+        response = self.cache.store("key", b"{}", {"etag": '"abc"'})
+        self.cache.revalidated(
+            "key",
+            response,
+            {"cache-control": "max-age=60"}
+        )
+        self.assertTrue(self.cache.get("key").is_fresh())
+        self.assertEqual(self.cache.get("key").etag, '"abc"')
+
+    def test_disk_store(self):
+        """Responses are read back from disk and the disk size is capped"""
+        self.cache.store("one", b"1" * 100, {"etag": '"1"'})
+
+        other_cache = HttpResponseCache(directory=self.directory.name)
+        self.assertEqual(other_cache.get("one").body, b"1" * 100)
+
+        self.cache.configure(max_disk_size=250)
+        self.cache.store("two", b"2" * 100, {"etag": '"2"'})
+        files = os.listdir(self.directory.name)
+        self.assertNotIn("one.body", files)
+        self.assertIn("two.body", files)
+
+    def test_memory_limit(self):
+        """The memory store keeps the most recently used responses"""
+        cache = HttpResponseCache(memory_entries=2)
+        for key in ("one", "two", "three"):
+            cache.store(key, b"{}", {"etag": '"1"'})
+        self.assertIsNone(cache.get("one"))
+        self.assertIsNotNone(cache.get("three"))
+        self.assertEqual(cache.stats()["memory_entries"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# coding=utf-8
+"""Tests for the search result items store.
+
+"""
+
+import json
+import unittest
+import uuid
+
+from kadas_stac.item_store import ItemStore
+
+
+def item_record(item_id, href="https://example.com/data.tif"):
+    return {
+        "uuid": uuid.uuid4(),
+        "id": item_id,
+        "stac_version": "1.0.0",
+        "feature": {
+            "type": "Feature",
+            "id": item_id,
+            "properties": {},
+            "assets": {"data": {"href": href, "roles": ["data"]}},
+        },
+    }
+
+
+class ItemStoreTest(unittest.TestCase):
+    """Test the search result items store"""
+
+    def setUp(self):
+        self.store = ItemStore(":memory:")
+        self.connection = uuid.uuid4()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_save_and_get_items(self):
+        """Store returns the saved items by page, in order"""
+        first = [item_record("a"), item_record("b")]
+        second = [item_record("c")]
+        self.store.save_items(self.connection, 1, first)
+        self.store.save_items(self.connection, 2, second)
+
+        pages = self.store.get_items(self.connection)
+
+        self.assertEqual(list(pages.keys()), ["1", "2"])
+        self.assertEqual([item["id"] for item in pages["1"]], ["a", "b"])
+        self.assertEqual(pages["2"][0]["feature"], second[0]["feature"])
+        self.assertEqual(self.store.get_items(uuid.uuid4()), {})
+
+    def test_serialized_feature(self):
+        """Store accepts features already serialized to JSON"""
+        record = item_record("a")
+        feature = record["feature"]
+        record["feature"] = json.dumps(feature)
+        self.store.save_items(self.connection, 1, [record])
+
+        stored = self.store.get_items(self.connection)["1"][0]
+        self.assertEqual(stored["feature"], feature)
+
+    def test_get_items_by_uuid(self):
+        """Store filters the items by their identifiers"""
+        records = [item_record("a"), item_record("b")]
+        self.store.save_items(self.connection, 1, records)
+
+        pages = self.store.get_items(
+            self.connection,
+            items_uuids=[str(records[1]["uuid"])]
+        )
+
+        self.assertEqual([item["id"] for item in pages["1"]], ["b"])
+
+    def test_replace_page(self):
+        """Saving a page can replace its previously stored items"""
+        self.store.save_items(self.connection, 1, [item_record("a")])
+        self.store.save_items(self.connection, 2, [item_record("b")])
+        self.store.save_items(
+            self.connection,
+            1,
+            [item_record("c")],
+            replace_page=True
+        )
+
+        pages = self.store.get_items(self.connection)
+
+        self.assertEqual([item["id"] for item in pages["1"]], ["c"])
+        self.assertEqual([item["id"] for item in pages["2"]], ["b"])
+
+    def test_update_items(self):
+        """Updated items keep their page and get the new feature"""
+        record = item_record("a")
+        self.store.save_items(self.connection, 3, [record])
+
+        updated = item_record("a", href="https://example.com/other.tif")
+        updated["uuid"] = record["uuid"]
+        self.store.update_items([updated, item_record("unknown")])
+
+        pages = self.store.get_items(self.connection)
+        self.assertEqual(list(pages.keys()), ["3"])
+        self.assertEqual(len(pages["3"]), 1)
+        self.assertEqual(pages["3"][0]["feature"], updated["feature"])
+
+    def test_delete_items(self):
+        """Items are deleted by page or for the whole connection"""
+        record = item_record("a")
+        self.store.save_items(self.connection, 1, [record])
+        self.store.save_items(self.connection, 2, [item_record("b")])
+
+        self.store.delete_items(self.connection, 1)
+        self.assertEqual(list(self.store.get_items(self.connection)), ["2"])
+
+        self.store.delete_items(self.connection)
+        self.assertEqual(self.store.get_items(self.connection), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# coding=utf-8
+"""Tests for the lazy search result item view.
+
+"""
+
+import datetime
+import unittest
+
+from kadas_stac.api.models import ItemView, parse_datetime
+
+FEATURE = {
+    "type": "Feature",
+    "stac_version": "1.0.0",
+    "id": "item-1",
+    "collection": "sentinel-2-l2a",
+    "geometry": {"type": "Point", "coordinates": [7.4, 46.9]},
+    "properties": {
+        "datetime": "2022-01-01T10:20:30.0240000Z",
+        "eo:cloud_cover": 12.5,
+    },
+    "links": [{"rel": "self", "href": "https://example.com/items/item-1"}],
+    "assets": {
+        "thumbnail": {"href": "thumbnail.png", "roles": ["thumbnail"]},
+        "B01": {"href": "B01.tif", "title": "Band 1", "roles": ["data"]},
+    },
+}
+
+
+class ItemViewTest(unittest.TestCase):
+    """Test the search result item view"""
+
+    def test_parse_datetime(self):
+        """Datetimes are parsed with and without the fast path"""
+        utc = datetime.timezone.utc
+        self.assertEqual(
+            parse_datetime("2022-01-01T10:20:30Z"),
+            datetime.datetime(2022, 1, 1, 10, 20, 30, tzinfo=utc)
+        )
+        self.assertEqual(
+            parse_datetime("2022-01-01T10:20:30.0240000Z"),
+            datetime.datetime(2022, 1, 1, 10, 20, 30, 24000, tzinfo=utc)
+        )
+        self.assertIsNone(parse_datetime(None))
+        self.assertIsNone(parse_datetime("not a date"))
+
+    def test_item_view(self):
+        """Item view exposes the feature without copying it"""
+        item = ItemView(FEATURE)
+
+        self.assertEqual(item.id, "item-1")
+        self.assertEqual(item.collection, "sentinel-2-l2a")
+        self.assertIs(item.to_dict(), FEATURE)
+        self.assertEqual(item.properties.eo_cloud_cover, 12.5)
+        self.assertEqual(item.properties.resource_datetime.year, 2022)
+        self.assertEqual(item.self_href, "https://example.com/items/item-1")
+        self.assertEqual(item.asset_href("thumbnail"), "thumbnail.png")
+        self.assertIsNone(item.asset_href("overview"))
+
+    def test_lazy_assets(self):
+        """Assets and pystac item are built on first access"""
+        item = ItemView(FEATURE)
+
+        self.assertIsNone(item._assets)
+        self.assertEqual(
+            [asset.title for asset in item.assets],
+            ["thumbnail", "Band 1"]
+        )
+        self.assertEqual(item.stac_object.id, "item-1")
+
+        item.update(dict(FEATURE, id="item-2"))
+        self.assertIsNone(item._assets)
+        self.assertEqual(item.stac_object.id, "item-2")
+
+
+if __name__ == "__main__":
+    unittest.main()
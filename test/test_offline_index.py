@@ -0,0 +1,229 @@
+# coding=utf-8
+"""Tests for the offline items index.
+
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from kadas_stac.api.offline_index import (
+    OfflineIndex,
+    datetime_range,
+    matches_query,
+)
+from kadas_stac.api.sas_signer import SasSigner
+
+
+def feature(item_id, collection="sentinel", x=0.0, y=0.0,
+            datetime="2022-01-01T00:00:00Z", **properties):
+    return {
+        "type": "Feature",
+        "id": item_id,
+        "collection": collection,
+        "bbox": [x, y, x + 1.0, y + 1.0],
+        "geometry": None,
+        "properties": dict(datetime=datetime, **properties),
+        "links": [],
+        "assets": {},
+    }
+
+
+class OfflineIndexTest(unittest.TestCase):
+    """Test the offline items index"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index = OfflineIndex(
+            os.path.join(self.directory, "offline_index.sqlite")
+        )
+
+    def tearDown(self):
+        self.index.close()
+        shutil.rmtree(self.directory)
+
+    def ids(self, parameters, page=1):
+        records, _ = self.index.search("connection", parameters, page)
+        return [record["feature"]["id"] for record in records]
+
+    def test_search_filters(self):
+        """Search evaluates the bbox, datetime, collections and query"""
+        self.index.add_items(
+            "connection",
+            [
+                feature("a", x=6.0, y=46.0, datetime="2020-05-01T00:00:00Z",
+                        cloud_cover=5),
+                feature("b", x=6.5, y=46.5, datetime="2021-05-01T00:00:00Z",
+                        cloud_cover=50),
+                feature("c", collection="landsat", x=-120.0, y=40.0,
+                        datetime="2021-06-01T00:00:00Z", cloud_cover=1),
+            ]
+        )
+        self.index.add_items("other", [feature("d", x=6.0, y=46.0)])
+
+        self.assertEqual(self.ids({"bbox": [5.0, 45.0, 7.0, 47.0]}),
+                         ["b", "a"])
+        self.assertEqual(
+            self.ids({"datetime": "2021-01-01T00:00:00Z/.."}),
+            ["c", "b"]
+        )
+        self.assertEqual(self.ids({"collections": ["landsat"]}), ["c"])
+        self.assertEqual(
+            self.ids({"query": {"cloud_cover": {"lt": 10}}}),
+            ["c", "a"]
+        )
+        self.assertEqual(self.ids({"ids": ["a", "d"]}), ["a"])
+        self.assertEqual(
+            self.ids({"sortby": [{"field": "id", "direction": "asc"}]}),
+            ["a", "b", "c"]
+        )
+
+    def test_free_text(self):
+        """Free text search matches the ids and the properties"""
+        self.index.add_items(
+            "connection",
+            [
+                feature("S2A_tile", platform="sentinel-2a"),
+                feature("LC08_tile", platform="landsat-8"),
+            ]
+        )
+        self.assertEqual(self.ids({"q": "landsat"}), ["LC08_tile"])
+        self.assertEqual(
+            sorted(self.ids({"q": "S2A_tile, landsat"})),
+            ["LC08_tile", "S2A_tile"]
+        )
+
+    def test_pagination(self):
+        """Search returns the requested page and the total"""
+        self.index.add_items(
+            "connection",
+            [feature(f"item_{number:02d}") for number in range(25)]
+        )
+        parameters = {
+            "limit": 10,
+            "sortby": [{"field": "id", "direction": "asc"}],
+        }
+        records, total = self.index.search("connection", parameters, 3)
+        self.assertEqual(total, 25)
+        self.assertEqual(
+            [record["feature"]["id"] for record in records],
+            [f"item_{number:02d}" for number in range(20, 25)]
+        )
+
+    def test_replace_item(self):
+        """Adding an indexed item replaces it in all the indexes"""
+        self.index.add_items("connection", [feature("a", x=6.0, y=46.0)])
+        self.index.add_items("connection", [feature("a", x=100.0, y=10.0)])
+        self.assertEqual(self.index.count("connection"), 1)
+        self.assertEqual(self.ids({"bbox": [5.0, 45.0, 7.0, 47.0]}), [])
+        self.assertEqual(self.ids({"bbox": [99.0, 9.0, 102.0, 12.0]}), ["a"])
+
+    def test_lean_items(self):
+        """Lean search fields do not replace an indexed full item"""
+        full = feature("a", cloud_cover=5)
+        full["assets"] = {"data": {"href": "data.tif"}}
+        self.index.add_items("connection", [feature("a")], lean=True)
+        self.index.add_items("connection", [full])
+        self.index.add_items("connection", [feature("a")], lean=True)
+        records, _ = self.index.search("connection", {})
+        self.assertFalse(records[0]["lean"])
+        self.assertIn("data", records[0]["feature"]["assets"])
+
+    def test_lean_items_indexes(self):
+        """Lean search fields do not replace the full item text and bbox"""
+        self.index.add_items(
+            "connection",
+            [feature("a", x=6.0, y=46.0, platform="sentinel-2a")]
+        )
+        self.index.add_items(
+            "connection",
+            [feature("a", x=100.0, y=10.0)],
+            lean=True
+        )
+        self.assertEqual(self.ids({"q": "sentinel"}), ["a"])
+        self.assertEqual(self.ids({"bbox": [5.0, 45.0, 7.0, 47.0]}), ["a"])
+
+    def test_signed_items(self):
+        """Items of a SAS connection streamed, and so signed in place,
+        before they are indexed are stored without their tokens"""
+        href = "https://account.blob.core.windows.net/container/data.tif"
+        signed = feature("a")
+        signed["assets"] = {"data": {"href": href}}
+        signer = SasSigner(
+            lambda account, container, key: (
+                "se=2100-01-01T00:00:00Z&sig=token",
+                time.time() + 3600
+            )
+        )
+        signer.sign_features([signed])
+        self.assertNotEqual(signed["assets"]["data"]["href"], href)
+        self.index.add_items("connection", [signed])
+        records, _ = self.index.search("connection", {})
+        self.assertEqual(records[0]["feature"]["assets"]["data"]["href"], href)
+
+    def test_clear_all(self):
+        """The settings clear button removes the items of all connections"""
+        self.index.add_items("connection", [feature("a")])
+        self.index.add_items("other", [feature("b")])
+        self.index.clear("other")
+        self.assertEqual(self.index.count("connection"), 1)
+        self.assertEqual(self.index.count("other"), 0)
+        self.index.add_items("other", [feature("b")])
+        self.index.clear_all()
+        self.assertEqual(self.index.count("connection"), 0)
+        self.assertEqual(self.index.count("other"), 0)
+
+    def test_eviction(self):
+        """Items over the size limit and past the age limit are evicted"""
+        self.index.add_items("connection", [feature("old_0")])
+        size = self.index._database().execute(
+            "SELECT size FROM items"
+        ).fetchone()[0]
+        self.index.max_size = size * 2
+        self.index.add_items("connection", [feature("new_1")])
+        self.index.add_items("connection", [feature("new_2")])
+        self.assertEqual(sorted(self.ids({})), ["new_1", "new_2"])
+        self.assertEqual(
+            self.ids({"bbox": [0.0, 0.0, 1.0, 1.0], "q": "old_0"}),
+            []
+        )
+
+        self.index.max_age = 60
+        self.index._database().execute(
+            "UPDATE items SET fetched = ? WHERE id = 'new_1'",
+            (time.time() - 120,)
+        )
+        self.index.evict()
+        self.assertEqual(self.ids({}), ["new_2"])
+
+    def test_datetime_range(self):
+        """Datetime parameters are converted to open or closed ranges"""
+        self.assertEqual(datetime_range(None), (None, None))
+        start, end = datetime_range("2020-01-01T00:00:00Z/..")
+        self.assertEqual(start, 1577836800.0)
+        self.assertIsNone(end)
+        self.assertEqual(
+            datetime_range("2020-01-01T00:00:00"),
+            (1577836800.0, 1577836800.0)
+        )
+
+    def test_matches_query(self):
+        """Query operators compare the item properties"""
+        properties = {"eo:cloud_cover": 10, "platform": "sentinel-2a"}
+        self.assertTrue(matches_query(properties, None))
+        self.assertTrue(
+            matches_query(properties, {"eo:cloud_cover": {"gte": 10}})
+        )
+        self.assertTrue(
+            matches_query(properties, {"platform": {"startsWith": "sent"}})
+        )
+        self.assertFalse(
+            matches_query(properties, {"platform": {"lt": 10}})
+        )
+        self.assertFalse(matches_query(properties, {"missing": {"eq": 1}}))
+
+
+if __name__ == "__main__":
+    unittest.main()
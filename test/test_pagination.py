@@ -0,0 +1,93 @@
+# coding=utf-8
+"""Tests for the item search pagination cursors cache.
+
+"""
+
+import unittest
+
+from kadas_stac.api.pagination import PaginationCursorCache, search_key
+
+
+class PaginationCursorCacheTest(unittest.TestCase):
+    """Test the pagination cursors cache"""
+
+    def setUp(self):
+        self.cache = PaginationCursorCache()
+        self.key = search_key(
+            {
+                "collections": ["sentinel-2-l2a"],
+                "limit": 10,
+                "bbox": None,
+            }
+        )
+        self.cursor = {
+            "rel": "next",
+            "href": "https://example.com/search?token=abc",
+        }
+
+    def test_search_key(self):
+        """Search key is independent of the parameters order
+        and of the empty parameters"""
+        self.assertEqual(
+            search_key({"limit": 10, "collections": ["a"], "ids": None}),
+            search_key({"collections": ["a"], "limit": 10}),
+        )
+        self.assertNotEqual(
+            search_key({"collections": ["a"], "limit": 10}),
+            search_key({"collections": ["b"], "limit": 10}),
+        )
+
+    def test_nearest_cursor(self):
+        """Cache returns the closest stored cursor for a page"""
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 5),
+            (1, None)
+        )
+        self.cache.store("connection", self.key, 2, self.cursor)
+        self.cache.store("connection", self.key, 3, self.cursor)
+
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 5),
+            (3, self.cursor)
+        )
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 2),
+            (2, self.cursor)
+        )
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 1),
+            (1, None)
+        )
+
+    def test_search_change_drops_cursors(self):
+        """A different search on the same connection drops the cursors"""
+        self.cache.store("connection", self.key, 2, self.cursor)
+        other_key = search_key({"collections": ["landsat"], "limit": 10})
+
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", other_key, 2),
+            (1, None)
+        )
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 2),
+            (1, None)
+        )
+
+    def test_last_page_and_invalidate(self):
+        """Cache records the last page and can be invalidated"""
+        self.cache.store("connection", self.key, 2, self.cursor)
+        self.cache.store("connection", self.key, 3, self.cursor)
+        self.cache.mark_last_page("connection", self.key, 2)
+
+        self.assertEqual(self.cache.last_page("connection", self.key), 2)
+        self.assertEqual(
+            self.cache.nearest_cursor("connection", self.key, 3),
+            (2, self.cursor)
+        )
+
+        self.cache.invalidate("connection")
+        self.assertIsNone(self.cache.last_page("connection", self.key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+# coding=utf-8
+"""Tests for the prefetched result pages buffer.
+
+"""
+
+import unittest
+
+from kadas_stac.api.prefetch import PageBuffer
+
+
+class PageBufferTest(unittest.TestCase):
+    """Test the prefetched result pages buffer"""
+
+    def test_put_and_get(self):
+        """Buffer returns the stored pages of the matching search"""
+        buffer = PageBuffer()
+        buffer.put("connection", "search", 2, ["item"], None)
+
+        self.assertEqual(
+            buffer.get("connection", "search", 2),
+            (["item"], None)
+        )
+        self.assertIsNone(buffer.get("connection", "search", 3))
+        self.assertIsNone(buffer.get("connection", "other", 2))
+        self.assertIsNone(buffer.get("other", "search", 2))
+
+    def test_bounded_size(self):
+        """Buffer drops the least recently used pages"""
+        buffer = PageBuffer(max_pages=2)
+        buffer.put("connection", "search", 1, ["one"], None)
+        buffer.put("connection", "search", 2, ["two"], None)
+        buffer.get("connection", "search", 1)
+        buffer.put("connection", "search", 3, ["three"], None)
+
+        self.assertIsNotNone(buffer.get("connection", "search", 1))
+        self.assertIsNone(buffer.get("connection", "search", 2))
+        self.assertIsNotNone(buffer.get("connection", "search", 3))
+
+    def test_clear(self):
+        """Buffer pages can be dropped per connection"""
+        buffer = PageBuffer()
+        buffer.put("one", "search", 1, [], None)
+        buffer.put("two", "search", 1, [], None)
+
+        buffer.clear("one")
+        self.assertIsNone(buffer.get("one", "search", 1))
+        self.assertIsNotNone(buffer.get("two", "search", 1))
+
+        buffer.clear()
+        self.assertIsNone(buffer.get("two", "search", 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
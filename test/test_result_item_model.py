@@ -0,0 +1,116 @@
+# coding=utf-8
+"""Tests for the search result items models.
+
+"""
+
+import unittest
+
+from qgis.PyQt import QtCore
+
+from kadas_stac.api.models import ItemView
+from kadas_stac.gui.result_item_model import (
+    ItemsModel,
+    ItemsSortFilterProxyModel,
+    item_search_text,
+)
+
+
+def item(item_id, collection="sentinel-2-l2a", **properties):
+    properties.setdefault("datetime", "2022-01-15T10:20:30Z")
+    return ItemView(
+        {
+            "type": "Feature",
+            "id": item_id,
+            "collection": collection,
+            "geometry": None,
+            "properties": properties,
+        }
+    )
+
+
+class ItemsFilterTest(unittest.TestCase):
+    """Test the search result items filter"""
+
+    def setUp(self):
+        self.items = [
+            item("S2A_32TMT", platform="sentinel-2a"),
+            item("S2B_32TLT", platform="sentinel-2b"),
+            item("LC08_195027", collection="landsat-c2-l2",
+                 platform="landsat-8", datetime="2021-06-01T00:00:00Z"),
+        ]
+        self.model = ItemsModel(self.items)
+        self.proxy_model = ItemsSortFilterProxyModel()
+        self.proxy_model.setSourceModel(self.model)
+
+    def ids(self):
+        return [
+            self.proxy_model.index(row, 0).data(ItemsModel.ItemRole).id
+            for row in range(self.proxy_model.rowCount())
+        ]
+
+    def test_item_search_text(self):
+        """Search text holds the id, collection, dates and properties"""
+        text = item_search_text(self.items[2])
+        for value in ("lc08_195027", "landsat-c2-l2", "2021-06-01",
+                      "06/01/2021", "landsat-8"):
+            self.assertIn(value, text)
+
+    def test_filter_fields(self):
+        """All the filter words are matched against the item fields"""
+        self.proxy_model.set_filter("Sentinel")
+        self.assertEqual(self.ids(), ["S2A_32TMT", "S2B_32TLT"])
+        self.proxy_model.set_filter("2021")
+        self.assertEqual(self.ids(), ["LC08_195027"])
+        self.proxy_model.set_filter("s2 2b")
+        self.assertEqual(self.ids(), ["S2B_32TLT"])
+        self.proxy_model.set_filter("")
+        self.assertEqual(len(self.ids()), 3)
+
+    def test_filter_narrowing(self):
+        """Extending the filter text only tests the current matches"""
+        self.proxy_model.set_filter("s2")
+        self.assertEqual(len(self.proxy_model.matches), 3)
+        self.proxy_model.set_filter("s2a")
+        self.assertEqual(self.proxy_model.matches[self.items[2].item_uuid],
+                         False)
+        self.assertEqual(self.ids(), ["S2A_32TMT"])
+        self.proxy_model.set_filter("s2")
+        self.assertEqual(self.ids(), ["S2A_32TMT", "S2B_32TLT"])
+
+    def test_filter_accepted_items(self):
+        """Accepted items restrict the filtered rows"""
+        self.proxy_model.set_filter(
+            "sentinel",
+            {self.items[1].item_uuid, self.items[2].item_uuid}
+        )
+        self.assertEqual(self.ids(), ["S2B_32TLT"])
+
+    def test_streamed_items(self):
+        """Items added after the filter is set are filtered"""
+        self.model.set_items([])
+        self.proxy_model.set_filter("landsat")
+        self.model.add_items(self.items)
+        self.assertEqual(self.ids(), ["LC08_195027"])
+
+    def test_highlighted_items(self):
+        """Only the rows whose highlight changed are updated"""
+        changed = []
+        self.model.dataChanged.connect(
+            lambda first, last, roles: changed.append(first.row())
+        )
+        self.model.set_highlighted({self.items[0].item_uuid, "unknown"})
+        self.model.set_highlighted(
+            {self.items[0].item_uuid, self.items[2].item_uuid}
+        )
+        self.assertEqual(changed, [0, 2])
+        self.assertTrue(
+            self.model.index(2, 0, QtCore.QModelIndex()).data(
+                ItemsModel.HighlightRole
+            )
+        )
+        self.model.set_items(self.items)
+        self.assertFalse(self.model.highlighted)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+# coding=utf-8
+"""Tests for the SAS hrefs signing.
+
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from kadas_stac.api.sas_signer import (
+    SasSigner,
+    blob_container,
+    expiry_timestamp,
+    unsigned_feature,
+    unsigned_url,
+)
+
+BLOB_HREF = "https://account.blob.core.windows.net/container/path/data.tif"
+
+
+class SasSignerTest(unittest.TestCase):
+    """Test the SAS hrefs signer"""
+
+    def setUp(self):
+        self.requests = []
+        self.lifetime = 3600
+        self.issued = []
+        self.signer = SasSigner(self.provide_token, renewal_margin=60)
+        self.signer.token_listener = self.issued.append
+
+    def provide_token(self, account, container, subscription_key):
+        self.requests.append((account, container, subscription_key))
+        return f"sig={len(self.requests)}", time.time() + self.lifetime
+
+    def test_sign(self):
+        """Blob hrefs are signed with one token per container"""
+        self.assertEqual(
+            self.signer.sign("https://example.com/data.tif"),
+            "https://example.com/data.tif"
+        )
+        self.assertEqual(self.signer.sign(BLOB_HREF, "key"), f"{BLOB_HREF}?sig=1")
+        self.assertEqual(
+            self.signer.sign(f"{BLOB_HREF}?sig=old"),
+            f"{BLOB_HREF}?sig=1"
+        )
+        self.assertEqual(
+            self.signer.sign(f"{BLOB_HREF}?version=2"),
+            f"{BLOB_HREF}?version=2&sig=1"
+        )
+        self.assertEqual(self.requests, [("account", "container", "key")])
+        self.assertEqual(len(self.issued), 1)
+
+    def test_token_renewal(self):
+        """Tokens close to their expiry are requested again"""
+        self.lifetime = 30
+        self.signer.sign(BLOB_HREF)
+        self.signer.sign(BLOB_HREF)
+        self.assertEqual(len(self.requests), 2)
+
+    def test_refresh(self):
+        """Refresh renews the used tokens and drops the unused ones"""
+        self.signer.sign(BLOB_HREF)
+        self.signer.sign(
+            "https://other.blob.core.windows.net/unused/data.tif"
+        )
+        self.signer._tokens[("other", "unused")][2] = False
+        self.assertEqual(self.signer.refresh(60), 0)
+        self.assertEqual(self.signer.refresh(2 * self.lifetime), 1)
+        self.assertEqual(len(self.signer._tokens), 1)
+        self.assertEqual(self.signer.sign(BLOB_HREF), f"{BLOB_HREF}?sig=3")
+        self.assertAlmostEqual(
+            self.signer.next_expiry(),
+            time.time() + self.lifetime,
+            delta=5
+        )
+
+    def test_stored_tokens(self):
+        """Tokens are read back from the tokens file"""
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "sas_tokens.json")
+            self.signer.configure(path)
+            self.signer.sign(BLOB_HREF)
+
+            signer = SasSigner(self.provide_token, path=path)
+            self.assertEqual(signer.sign(BLOB_HREF), f"{BLOB_HREF}?sig=1")
+            self.assertEqual(len(self.requests), 1)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_concurrent_requests(self):
+        """Concurrent signing of a container shares one token request"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_token(account, container, subscription_key):
+            started.set()
+            release.wait(5)
+            return self.provide_token(account, container, subscription_key)
+
+        self.signer.token_provider = slow_token
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(self.signer.sign(BLOB_HREF))
+            )
+            for _ in range(5)
+        ]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(results, [f"{BLOB_HREF}?sig=1"] * 5)
+
+    def test_sign_features(self):
+        """Page assets are signed in place with one token per container"""
+        expiry = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ",
+            time.gmtime(time.time() + self.lifetime)
+        )
+        self.signer.token_provider = lambda account, container, key: (
+            self.provide_token(account, container, key)[0] + f"&se={expiry}",
+            time.time() + self.lifetime
+        )
+        other_href = "https://other.blob.core.windows.net/data/b.tif"
+        features = [
+            {
+                "assets": {
+                    "data": {"href": BLOB_HREF},
+                    "other": {"href": other_href},
+                    "metadata": {"href": "https://example.com/a.xml"},
+                    "table": {
+                        "href": "abfs://tables/items.parquet",
+                        "table:storage_options": {"account_name": "account"},
+                    },
+                }
+            }
+            for _ in range(3)
+        ]
+        self.assertEqual(self.signer.sign_features(features), 9)
+        self.assertEqual(len(self.requests), 3)
+        assets = features[0]["assets"]
+        self.assertEqual(assets["data"]["href"], f"{BLOB_HREF}?sig=1&se={expiry}")
+        self.assertTrue(self.signer.signed(assets["other"]["href"]))
+        self.assertEqual(assets["metadata"]["href"], "https://example.com/a.xml")
+        self.assertEqual(
+            assets["table"]["table:storage_options"]["credential"],
+            f"sig=3&se={expiry}"
+        )
+
+        # Already signed hrefs are kept
+        self.assertEqual(self.signer.sign_features(features), 3)
+        self.assertEqual(assets["data"]["href"], f"{BLOB_HREF}?sig=1&se={expiry}")
+        self.assertFalse(self.signer.signed(BLOB_HREF))
+
+    def test_unsigned_url(self):
+        """SAS token queries are dropped from signed URLs only"""
+        url = BLOB_HREF
+        self.assertEqual(
+            unsigned_url(f"{url}?width=200&st=2024&sv=2021&sig=abc&height=9"),
+            f"{url}?width=200&height=9"
+        )
+        self.assertEqual(unsigned_url(f"{url}?sig=abc"), url)
+        self.assertEqual(unsigned_url(f"{url}?sp=r"), f"{url}?sp=r")
+
+    def test_unsigned_feature(self):
+        """Asset hrefs and storage credentials lose their SAS tokens"""
+        signed = {
+            "id": "a",
+            "assets": {
+                "data": {"href": f"{BLOB_HREF}?sig=1&se=2024"},
+                "table": {
+                    "href": "abfs://tables/items.parquet",
+                    "table:storage_options": {
+                        "account_name": "account",
+                        "credential": "sig=2&se=2024",
+                    },
+                },
+            },
+        }
+        feature = unsigned_feature(signed)
+        self.assertEqual(feature["assets"]["data"]["href"], BLOB_HREF)
+        self.assertEqual(
+            feature["assets"]["table"]["table:storage_options"],
+            {"account_name": "account"}
+        )
+        self.assertEqual(
+            signed["assets"]["data"]["href"],
+            f"{BLOB_HREF}?sig=1&se=2024"
+        )
+
+    def test_helpers(self):
+        """Blob containers and token expiries are parsed"""
+        self.assertEqual(blob_container(BLOB_HREF), ("account", "container"))
+        self.assertIsNone(blob_container("https://example.com/a/b"))
+        self.assertEqual(
+            expiry_timestamp("2020-01-01T00:00:00Z"),
+            1577836800.0
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
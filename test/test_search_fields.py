@@ -0,0 +1,61 @@
+# coding=utf-8
+"""Tests for the item search fields extension parameters.
+
+"""
+
+import unittest
+
+import kadas_stac  # noqa: F401, adds the bundled libraries to the path
+
+from pystac_client.item_search import ItemSearch
+
+from kadas_stac.definitions.constants import (
+    LEAN_SEARCH_FIELDS,
+    RESULT_FILTER_PROPERTIES,
+)
+
+SEARCH_URL = "https://example.com/search"
+
+
+class ItemSearchFieldsTest(unittest.TestCase):
+    """Test the fields parameter of the item searches"""
+
+    def test_post_fields(self):
+        """POST searches send the fields include and exclude sets"""
+        fields = {"include": ["id", "properties.datetime"], "exclude": []}
+        search = ItemSearch(SEARCH_URL, method="POST", fields=fields)
+        self.assertEqual(search.get_parameters()["fields"], fields)
+
+        search = ItemSearch(
+            SEARCH_URL,
+            method="POST",
+            fields=["id", "+geometry", "-properties.instruments"]
+        )
+        self.assertEqual(
+            search.get_parameters()["fields"],
+            {
+                "include": ["id", "geometry"],
+                "exclude": ["properties.instruments"],
+            }
+        )
+
+    def test_get_fields(self):
+        """GET searches send the fields as a prefixed comma separated list"""
+        search = ItemSearch(
+            SEARCH_URL,
+            method="GET",
+            fields={"include": ["id"], "exclude": ["links"]}
+        )
+        self.assertEqual(search.get_parameters()["fields"], "+id,-links")
+
+    def test_lean_fields(self):
+        """Lean searches request the properties matched by the filter"""
+        for name in RESULT_FILTER_PROPERTIES:
+            self.assertIn(
+                f"properties.{name}",
+                LEAN_SEARCH_FIELDS["include"]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,13 +3,14 @@
 
 """
 
+import copy
 import unittest
 
 import uuid
 
 
 from kadas_stac.conf import settings_manager
-from kadas_stac.conf import ConnectionSettings
+from kadas_stac.conf import CollectionSettings, ConnectionSettings
 
 
 class SettingsManagerTest(unittest.TestCase):
@@ -158,3 +159,116 @@ class SettingsManagerTest(unittest.TestCase):
         settings_manager.delete_connection(second_connection_id)
         connections = settings_manager.list_connections()
         self.assertEqual(len(connections), 1)
+
+    def test_connection_registry(self):
+        """Connections are read once and their resources loaded lazily"""
+
+        connection_id = uuid.uuid4()
+        connection = ConnectionSettings(
+            id=connection_id,
+            name="registry_connection",
+            url="http:://registry",
+            page_size=10,
+            capability=None,
+            catalog_type="api",
+            sas_subscription_key=None,
+        )
+        settings_manager.save_connection_settings(connection)
+
+        stored_connection = settings_manager.get_connection_settings(
+            connection_id
+        )
+        self.assertIs(
+            stored_connection,
+            settings_manager.get_connection_settings(connection_id)
+        )
+        self.assertIs(
+            stored_connection,
+            settings_manager.find_connection_by_name("registry_connection")
+        )
+        self.assertNotIn("_collections", vars(stored_connection))
+        repr(stored_connection)
+        self.assertEqual(stored_connection, copy.copy(stored_connection))
+        self.assertNotIn("_collections", vars(stored_connection))
+        self.assertEqual(stored_connection.collections, [])
+        self.assertIn("_collections", vars(stored_connection))
+
+        connection.name = "renamed_registry_connection"
+        settings_manager.save_connection_settings(connection)
+        renamed_connection = settings_manager.get_connection_settings(
+            connection_id
+        )
+        self.assertIsNot(stored_connection, renamed_connection)
+        self.assertEqual(renamed_connection.name, connection.name)
+
+        settings_manager.delete_connection(connection_id)
+        self.assertNotIn(
+            connection_id,
+            [conn.id for conn in settings_manager.list_connections()]
+        )
+
+    def test_collection_lookup(self):
+        """Collections are found by STAC id and by settings identifier"""
+
+        connection = ConnectionSettings(
+            id=uuid.uuid4(),
+            name="collections_connection",
+            url="http:://collections",
+            page_size=10,
+            capability=None,
+            catalog_type="api",
+            sas_subscription_key=None,
+        )
+        settings_manager.save_connection_settings(connection)
+
+        collection = CollectionSettings(
+            uuid=uuid.uuid4(),
+            id="sentinel-2-l2a",
+            title="Sentinel-2 Level-2A"
+        )
+        settings_manager.save_collection(connection, collection)
+
+        stored_collection = settings_manager.get_collection(
+            "sentinel-2-l2a",
+            connection
+        )
+        self.assertEqual(stored_collection.uuid, collection.uuid)
+        self.assertEqual(stored_collection.title, collection.title)
+        self.assertEqual(
+            settings_manager.get_collection_by_uuid(
+                collection.uuid,
+                connection
+            ).id,
+            "sentinel-2-l2a"
+        )
+        self.assertIsNone(
+            settings_manager.get_collection("landsat", connection)
+        )
+
+        collections = [
+            CollectionSettings(
+                uuid=uuid.uuid4(),
+                id=f"collection-{i}",
+                title=f"Collection {i}"
+            )
+            for i in range(3)
+        ]
+        settings_manager.save_collections(connection, collections)
+        for saved in collections:
+            self.assertEqual(
+                settings_manager.get_collection(saved.id, connection).uuid,
+                saved.uuid
+            )
+        self.assertEqual(
+            settings_manager.get_collection(
+                "sentinel-2-l2a",
+                connection
+            ).uuid,
+            collection.uuid
+        )
+
+        settings_manager.delete_all_collections(connection)
+        self.assertIsNone(
+            settings_manager.get_collection("sentinel-2-l2a", connection)
+        )
+        settings_manager.delete_connection(connection.id)
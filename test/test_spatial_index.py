@@ -0,0 +1,97 @@
+# coding=utf-8
+"""Tests for the search result items spatial index.
+
+"""
+
+import unittest
+
+from qgis.core import QgsPointXY, QgsRectangle
+
+from kadas_stac.api.models import ItemView
+from kadas_stac.api.spatial_index import ItemSpatialIndex, item_bbox
+
+
+def item(item_id, min_x, min_y, max_x, max_y, bbox=True):
+    feature = {
+        "type": "Feature",
+        "id": item_id,
+        "collection": "test",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [[
+                [min_x, min_y],
+                [max_x, min_y],
+                [max_x, max_y],
+                [min_x, min_y],
+            ]],
+        },
+    }
+    if bbox:
+        feature["bbox"] = [min_x, min_y, max_x, max_y]
+    return ItemView(feature)
+
+
+class ItemSpatialIndexTest(unittest.TestCase):
+    """Test the search result items spatial index"""
+
+    def test_item_bbox(self):
+        """Items bbox is read or computed from the geometry"""
+        self.assertEqual(item_bbox(item("a", 1, 2, 3, 4)), [1, 2, 3, 4])
+        self.assertEqual(
+            item_bbox(item("a", 1, 2, 3, 4, bbox=False)),
+            [1, 2, 3, 4]
+        )
+        self.assertIsNone(item_bbox(ItemView({"id": "empty"})))
+
+    def test_extent_and_point_queries(self):
+        """Queries return the items whose footprint matches"""
+        index = ItemSpatialIndex()
+        index.add_items([item("a", 0, 0, 10, 10), item("b", 20, 20, 30, 30)])
+        index.add_items([item("c", 5, 5, 25, 25, bbox=False)])
+        self.assertEqual(len(index), 3)
+
+        def ids(items):
+            return sorted(result.id for result in items)
+
+        self.assertEqual(
+            ids(index.items_in_extent(QgsRectangle(8, 8, 9, 9))),
+            ["a", "c"]
+        )
+        self.assertEqual(ids(index.items_at(QgsPointXY(28, 28))), ["b"])
+        # The triangle footprint of "a" does not contain the point,
+        # only its bounding box does.
+        self.assertEqual(ids(index.items_at(QgsPointXY(1, 9))), [])
+        self.assertEqual(
+            ids(index.items_in_extent(QgsRectangle(0, 8, 2, 10), exact=False)),
+            ["a"]
+        )
+
+    def test_replace_and_clear(self):
+        """Adding an indexed item replaces it, clearing empties the index"""
+        index = ItemSpatialIndex()
+        first = item("a", 0, 0, 1, 1)
+        second = item("a", 0, 0, 1, 1)
+        index.add_items([first])
+        index.add_items([second])
+
+        self.assertEqual(len(index), 1)
+        self.assertIs(index.items_at(QgsPointXY(0.9, 0.1))[0], second)
+
+        index.clear()
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.items_at(QgsPointXY(0.9, 0.1)), [])
+
+    def test_antimeridian(self):
+        """Bounding boxes crossing the antimeridian are split"""
+        index = ItemSpatialIndex()
+        index.add_items([
+            ItemView({"id": "a", "bbox": [170, -10, -170, 10]})
+        ])
+
+        self.assertEqual(len(index.items_at(QgsPointXY(175, 0))), 1)
+        self.assertEqual(len(index.items_at(QgsPointXY(-175, 0))), 1)
+        self.assertEqual(len(index.items_at(QgsPointXY(0, 0))), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
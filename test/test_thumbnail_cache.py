@@ -0,0 +1,86 @@
+# coding=utf-8
+"""Tests for the thumbnails cache.
+
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from kadas_stac.api.thumbnail_cache import ThumbnailCache, thumbnail_key
+
+
+class ThumbnailCacheTest(unittest.TestCase):
+    """Test the thumbnails cache"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ThumbnailCache(directory=self.directory.name)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_thumbnail_key(self):
+        """SAS token queries are not part of the key"""
+        url = "https://account.blob.core.windows.net/container/thumb.png"
+        self.assertEqual(
+            thumbnail_key(url),
+            thumbnail_key(f"{url}?st=2024-01-01&se=2024-01-02&sp=rl&sig=abc")
+        )
+        self.assertEqual(
+            thumbnail_key(f"{url}?width=200&height=200"),
+            thumbnail_key(f"{url}?height=200&sv=2021&width=200&sig=abc")
+        )
+        self.assertNotEqual(
+            thumbnail_key(f"{url}?width=200"),
+            thumbnail_key(f"{url}?width=100")
+        )
+
+    def test_memory_lru(self):
+        """Decoded thumbnails are dropped over the memory limit"""
+        self.cache.max_memory_size = 250
+        self.cache.store_image("https://a/1.png", "first", 100)
+        self.cache.store_image("https://a/2.png", "second", 100)
+        self.assertEqual(self.cache.image("https://a/1.png"), "first")
+        self.cache.store_image("https://a/3.png", "third", 100)
+        self.assertIsNone(self.cache.image("https://a/2.png"))
+        self.assertEqual(self.cache.image("https://a/1.png"), "first")
+        self.assertEqual(self.cache.image("https://a/3.png"), "third")
+
+    def test_disk_store(self):
+        """Encoded thumbnails are read back and trimmed by size"""
+        self.cache.store_data("https://a/1.png?sig=old", b"1" * 100)
+        self.assertEqual(self.cache.data("https://a/1.png?sig=new"), b"1" * 100)
+        self.assertIsNone(self.cache.data("https://a/2.png"))
+
+        self.cache.configure(max_disk_size=250)
+        past = time.time() - 60
+        for name in os.listdir(self.directory.name):
+            os.utime(os.path.join(self.directory.name, name), (past, past))
+        self.cache.store_data("https://a/2.png", b"2" * 100)
+        self.cache.store_data("https://a/3.png", b"3" * 100)
+        self.assertIsNone(self.cache.data("https://a/1.png"))
+        self.assertEqual(self.cache.data("https://a/3.png"), b"3" * 100)
+
+    def test_stats(self):
+        """Memory and disk hits count towards the hit rate"""
+        self.cache.store_data("https://a/1.png", b"1")
+        self.cache.store_image("https://a/1.png", "first", 1)
+        self.cache.image("https://a/1.png")
+        self.cache.data("https://a/1.png")
+        self.cache.data("https://a/2.png")
+        self.cache.data("https://a/3.png")
+        stats = self.cache.stats()
+        self.assertEqual(stats["memory_hits"], 1)
+        self.assertEqual(stats["disk_hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.image("https://a/1.png"))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
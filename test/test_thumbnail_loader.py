@@ -0,0 +1,49 @@
+# coding=utf-8
+"""Tests for the result thumbnails loader.
+
+"""
+
+import unittest
+
+from qgis.PyQt import QtCore, QtGui
+
+from kadas_stac.definitions.constants import RESULT_THUMBNAIL_SIZE
+from kadas_stac.gui.thumbnail_loader import (
+    encoded_thumbnail,
+    scaled_thumbnail,
+)
+
+
+def image_content(width, height, image_format="PNG"):
+    image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB32)
+    image.fill(QtGui.QColor("green"))
+    content = QtCore.QByteArray()
+    image_buffer = QtCore.QBuffer(content)
+    image_buffer.open(QtCore.QIODevice.WriteOnly)
+    image.save(image_buffer, image_format)
+    return bytes(content)
+
+
+class ThumbnailLoaderTest(unittest.TestCase):
+    """Test the result thumbnails decoding and scaling"""
+
+    def test_scaled_thumbnail(self):
+        """Fetched images are scaled down keeping their aspect ratio"""
+        image = scaled_thumbnail(image_content(800, 400))
+        self.assertEqual(image.width(), RESULT_THUMBNAIL_SIZE)
+        self.assertEqual(image.height(), RESULT_THUMBNAIL_SIZE // 2)
+
+        image = scaled_thumbnail(image_content(50, 40))
+        self.assertEqual((image.width(), image.height()), (50, 40))
+        self.assertIsNone(scaled_thumbnail(b"not an image"))
+
+    def test_encoded_thumbnail(self):
+        """Scaled thumbnails are encoded for the disk cache"""
+        image = scaled_thumbnail(image_content(400, 400))
+        decoded = QtGui.QImage.fromData(encoded_thumbnail(image))
+        self.assertFalse(decoded.isNull())
+        self.assertEqual(decoded.size(), image.size())
+
+
+if __name__ == "__main__":
+    unittest.main()